@@ -0,0 +1,433 @@
+"""
+asyncio Google Custom Search client
+AsyncWebSearcher drives many in-flight queries from one event loop over an
+aiohttp connection pool; LoopBackedWebSearcher is a drop-in WebSearcher whose
+searches run on a shared background event loop
+"""
+
+import asyncio
+import atexit
+import copy
+import os
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Union
+
+try:
+    import aiohttp
+except ImportError:  # optional; only needed for SEARCH_BACKEND=async
+    aiohttp = None
+
+from demo_prep import (
+    STAKEHOLDER_SATURATION, STAKEHOLDER_WAVE_SIZE, TERM_WAVE_SIZE, VENDOR_BATCH_MAX_PAGES, VENDOR_BATCH_PAGE_SIZE,
+    VENDOR_QUERY_CAP, WebSearcher, _saturated_terms
+)
+from extractors import SECURITY_TOOL_MATCHER, TECHNOLOGY_MATCHER, TermMatcher
+from http_client import DEFAULT_BACKOFF_FACTOR, DEFAULT_BACKOFF_JITTER, DEFAULT_MAX_RETRIES, RETRY_STATUS_CODES
+from metrics import HTTP_RETRYABLE_RESPONSES, SEARCH_CACHE_LOOKUPS, SEARCH_ERRORS, SEARCH_SECONDS, SEARCH_SKIPPED
+from search_cache import cache_key, classify_query
+
+# Connections open to the Custom Search API at once
+DEFAULT_MAX_CONNECTIONS = 64
+
+# Seconds allowed per API request
+REQUEST_TIMEOUT = 10
+
+
+def _require_aiohttp():
+    if aiohttp is None:
+        raise ImportError("The async search backend needs aiohttp: pip install aiohttp "
+                          "(or unset SEARCH_BACKEND to use the threaded searcher)")
+
+
+class _SharedState:
+    """
+    Connection pool and in-flight queries of one event loop, shared by every
+    AsyncWebSearcher running on it
+    """
+
+    def __init__(self, max_connections: Optional[int] = None):
+        self.max_connections = max(1, max_connections or int(
+            os.environ.get('ASYNC_SEARCH_CONNECTIONS', DEFAULT_MAX_CONNECTIONS)))
+        self.session = None
+        self.in_flight = {}  # (cache_key(), num) -> asyncio.Future
+
+    def get_session(self) -> 'aiohttp.ClientSession':
+        """The pooled session, created on first use (inside the running loop)"""
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_connections)
+            self.session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            )
+        return self.session
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+class AsyncWebSearcher:
+    """
+    Async counterpart of WebSearcher, with the same public search methods as coroutines
+
+    Configuration, the result cache, quota, query budget, rate limiter and
+    progress bus come from a WebSearcher (self.searcher), and so do the
+    query lists and result collection, so both searchers find the same
+    things. Only the transport differs: every query is a coroutine on one
+    aiohttp pool capped at max_connections, so a single event loop can keep
+    hundreds of queries in flight. The cache, quota and rate limiter block
+    on SQLite and file locks, so they are called from worker threads.
+    """
+
+    def __init__(self, searcher: Optional[WebSearcher] = None, max_connections: Optional[int] = None,
+                 shared: Optional[_SharedState] = None, **searcher_options):
+        """
+        Args:
+            searcher: WebSearcher supplying credentials, cache, quota and rate limiter
+                (default: WebSearcher(**searcher_options))
+            max_connections: Concurrent API connections
+                (default: ASYNC_SEARCH_CONNECTIONS env var or 64)
+            shared: Connection pool and in-flight queries to join (default: a new
+                pool, closed by close())
+        """
+        _require_aiohttp()
+        self.searcher = searcher or WebSearcher(**searcher_options)
+        self._shared = shared or _SharedState(max_connections)
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self.searcher.api_key
+
+    @property
+    def max_connections(self) -> int:
+        return self._shared.max_connections
+
+    def bind(self, **attributes) -> 'AsyncWebSearcher':
+        """Return a copy sharing the connection pool, with searcher attributes overridden (see WebSearcher.bind)"""
+        bound = copy.copy(self)
+        bound.searcher = self.searcher.bind(**attributes)
+        return bound
+
+    async def close(self):
+        await self._shared.close()
+
+    async def __aenter__(self) -> 'AsyncWebSearcher':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def search(self, query: str, num_results: int = 5, start: int = 1) -> List[Dict]:
+        """Perform a web search and return results (see WebSearcher.search)"""
+        searcher = self.searcher
+        if not searcher.api_key or not searcher.search_engine_id:
+            print("⚠ Web search disabled: API credentials not configured")
+            print("  Set GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID environment variables")
+            return []
+
+        num_results = min(num_results, 10)
+        category = classify_query(query)
+        started = time.perf_counter()
+
+        if searcher.cache:
+            cached = await asyncio.to_thread(searcher.cache.get, query, num_results, start, searcher.search_engine_id)
+            SEARCH_CACHE_LOOKUPS.inc(result='miss' if cached is None else 'hit')
+            if cached is not None:
+                SEARCH_SECONDS.observe(time.perf_counter() - started, category=category, source='cache')
+                return cached
+
+        # Identical queries in flight at the same time share one API call
+        key = (cache_key(query, start, searcher.search_engine_id), num_results)
+        future = self._shared.in_flight.get(key)
+        if future is not None:
+            results = await asyncio.shield(future)
+            source = 'shared'
+            if results is None:
+                # The leader's budget or quota refused the query; this searcher's may not
+                results, source = await self._fetch(query, num_results, start), 'api'
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._shared.in_flight[key] = future
+            try:
+                results = await self._fetch(query, num_results, start)
+                future.set_result(results)
+            except BaseException:
+                future.cancel()
+                raise
+            finally:
+                self._shared.in_flight.pop(key, None)
+            source = 'api'
+
+        SEARCH_SECONDS.observe(time.perf_counter() - started, category=category, source=source)
+        return results if results is not None else []
+
+    async def _fetch(self, query: str, num_results: int, start: int = 1) -> Optional[List[Dict]]:
+        """Call the Custom Search API (see WebSearcher._fetch); None if the budget or quota refused the query"""
+        searcher = self.searcher
+        if not await asyncio.to_thread(searcher._reserve_query):
+            print(f"⚠ Query budget exhausted, skipping: {query}")
+            SEARCH_SKIPPED.inc(category=classify_query(query))
+            return None
+
+        if searcher.rate_limiter:
+            await searcher.rate_limiter.acquire_async()
+
+        params = {
+            'key': searcher.api_key,
+            'cx': searcher.search_engine_id,
+            'q': query,
+            'num': str(num_results)
+        }
+        if start > 1:
+            params['start'] = str(start)
+        try:
+            results = searcher._parse_results(await self._get_json(searcher.base_url, params))
+            if searcher.cache:
+                await asyncio.to_thread(searcher.cache.put, query, num_results, results, start,
+                                        searcher.search_engine_id)
+            return results
+
+        except aiohttp.ClientResponseError as e:
+            print(f"⚠ Search error: {str(e)}")
+            SEARCH_ERRORS.inc(category=classify_query(query),
+                              reason='rate_limited' if e.status == 429 else 'http_error')
+            if e.status == 429 or e.status >= 500:
+                await asyncio.to_thread(searcher._refund_query)
+            return []
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"⚠ Search error: {str(e) or type(e).__name__}")
+            SEARCH_ERRORS.inc(category=classify_query(query), reason='network')
+            await asyncio.to_thread(searcher._refund_query)
+            return []
+        except Exception as e:
+            print(f"⚠ Unexpected error during search: {str(e)}")
+            SEARCH_ERRORS.inc(category=classify_query(query), reason='unexpected')
+            return []
+
+    async def _get_json(self, url: str, params: Dict) -> Dict:
+        """GET url, retrying connection errors, 429 and 5xx like http_client's session does"""
+        session = self._shared.get_session()
+        max_retries = int(os.environ.get('HTTP_MAX_RETRIES', DEFAULT_MAX_RETRIES))
+
+        for attempt in range(max_retries + 1):
+            backoff = DEFAULT_BACKOFF_FACTOR * 2 ** attempt + random.uniform(0, DEFAULT_BACKOFF_JITTER)
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status in RETRY_STATUS_CODES:
+                        HTTP_RETRYABLE_RESPONSES.inc(status=response.status)
+                    if response.status in RETRY_STATUS_CODES and attempt < max_retries:
+                        retry_after = response.headers.get('Retry-After', '')
+                        delay = float(retry_after) if retry_after.isdigit() else backoff
+                    else:
+                        response.raise_for_status()
+                        return await response.json(content_type=None)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= max_retries:
+                    raise
+                delay = backoff
+            await asyncio.sleep(delay)
+
+    async def search_many(self, queries: List[str], num_results: Union[int, List[int]] = 5,
+                          start: int = 1) -> List[List[Dict]]:
+        """Perform several searches concurrently; one result list per query, in query order (see WebSearcher.search_many)"""
+        if not queries:
+            return []
+
+        progress = self.searcher.progress
+        if progress:
+            progress.emit('queries_dispatched', count=len(queries))
+
+        async def search_and_report(query, num):
+            results = await self.search(query, num, start)
+            if progress:
+                progress.emit('query', query=query, results=len(results))
+            return results
+
+        counts = num_results if isinstance(num_results, list) else [num_results] * len(queries)
+        return list(await asyncio.gather(*(search_and_report(query, num) for query, num in zip(queries, counts))))
+
+    async def iter_search(self, queries: List[str], num_results: int = 5, wave_size: Optional[int] = None,
+                          saturated=None):
+        """Yield (query, results) pairs in query order, dispatching queries in waves (see WebSearcher.iter_search)"""
+        wave_size = wave_size or len(queries) or 1
+        for start in range(0, len(queries), wave_size):
+            if start and saturated and saturated():
+                return
+            wave = queries[start:start + wave_size]
+            for query, results in zip(wave, await self.search_many(wave, num_results)):
+                yield query, results
+
+    async def search_company_info(self, company_name: str, domain: str) -> Dict:
+        """Search for general company information"""
+        searcher = self.searcher
+        queries = searcher._company_info_queries(company_name, domain)
+        results = await self.search_many(list(queries), num_results=list(queries.values()))
+        return searcher._collect_company_info(*results)
+
+    async def search_tech_stack(self, company_name: str, domain: str,
+                                site_pages: Optional[List[Dict]] = None) -> List[Dict]:
+        """Search for company's technology stack, starting from crawled site pages"""
+        searcher = self.searcher
+        tech_stack, seen_techs = searcher._collect_site_matches(TECHNOLOGY_MATCHER, 'technology', site_pages)
+
+        queries = await asyncio.to_thread(searcher.plan_queries, searcher._tech_stack_queries(company_name, domain),
+                                          num_results=3)
+        async for query, results in self.iter_search(queries, num_results=3, wave_size=TERM_WAVE_SIZE,
+                                                     saturated=_saturated_terms(tech_stack)):
+            searcher._collect_matches(searcher._extract_technologies, 'technology', results,
+                                      tech_stack, seen_techs)
+        return tech_stack
+
+    async def search_security_tools(self, company_name: str, domain: str,
+                                    site_pages: Optional[List[Dict]] = None) -> List[Dict]:
+        """Search for company's security tools and practices, starting from crawled site pages"""
+        searcher = self.searcher
+        security_tools, seen_tools = searcher._collect_site_matches(SECURITY_TOOL_MATCHER, 'tool', site_pages)
+
+        queries = await asyncio.to_thread(searcher.plan_queries,
+                                          searcher._security_tool_queries(company_name, domain, site_pages),
+                                          num_results=3)
+        async for query, results in self.iter_search(queries, num_results=3, wave_size=TERM_WAVE_SIZE,
+                                                     saturated=_saturated_terms(security_tools)):
+            searcher._collect_matches(searcher._extract_security_tools, 'tool', results,
+                                      security_tools, seen_tools)
+        return security_tools
+
+    async def search_security_vendor_connections(self, company_name: str, domain: str) -> List[Dict]:
+        """Search for connections between company and known security vendors"""
+        searcher = self.searcher
+        if searcher.vendor_search_mode != 'per_vendor':
+            return await self._search_vendor_batches(company_name)
+
+        vendors_by_query = searcher._vendor_queries(company_name)
+        print(f"  🔍 Checking {len(vendors_by_query)} security vendors...")
+
+        queries = await asyncio.to_thread(searcher.plan_queries, list(vendors_by_query), num_results=2,
+                                          max_paid=VENDOR_QUERY_CAP)
+        vendor_results = await self.search_many(queries, num_results=2)
+        return searcher._collect_vendor_connections(
+            company_name, [vendors_by_query[query] for query in queries], vendor_results
+        )
+
+    async def _search_vendor_batches(self, company_name: str) -> List[Dict]:
+        """Batched vendor check (see WebSearcher._search_vendor_batches)"""
+        searcher = self.searcher
+        vendors_by_query = searcher._vendor_batch_queries(company_name)
+        vendor_count = sum(len(vendors) for vendors in vendors_by_query.values())
+        print(f"  🔍 Checking {vendor_count} security vendors in {len(vendors_by_query)} batched queries...")
+
+        matcher = TermMatcher([vendor for vendors in vendors_by_query.values() for vendor in vendors])
+        vendor_connections = []
+        seen_vendors = set()
+
+        queries = list(vendors_by_query)
+        paid_allowed = VENDOR_QUERY_CAP
+        for page in range(VENDOR_BATCH_MAX_PAGES):
+            start = 1 + page * VENDOR_BATCH_PAGE_SIZE
+            queries = await asyncio.to_thread(searcher.plan_queries, queries, num_results=VENDOR_BATCH_PAGE_SIZE,
+                                              max_paid=paid_allowed, start=start)
+            if not queries:
+                break
+            paid_allowed -= await asyncio.to_thread(
+                lambda: sum(not searcher.is_cached(query, VENDOR_BATCH_PAGE_SIZE, start) for query in queries)
+            )
+
+            page_results = await self.search_many(queries, num_results=VENDOR_BATCH_PAGE_SIZE, start=start)
+            for results in page_results:
+                searcher._collect_vendor_mentions(company_name, matcher, results, vendor_connections, seen_vendors)
+            queries = searcher._dense_vendor_batches(vendors_by_query, queries, page_results, seen_vendors)
+
+        return vendor_connections
+
+    async def search_stakeholders(self, company_name: str, role_titles: list, category: str) -> list:
+        """Search for company stakeholders by role titles"""
+        searcher = self.searcher
+        stakeholders = []
+        seen_urls = set()
+
+        titles_by_query = searcher._stakeholder_queries(company_name, role_titles)
+        queries = await asyncio.to_thread(searcher.plan_queries, list(titles_by_query), num_results=2)
+        async for query, results in self.iter_search(
+                queries, num_results=2, wave_size=STAKEHOLDER_WAVE_SIZE,
+                saturated=lambda: len(stakeholders) >= STAKEHOLDER_SATURATION):
+            searcher._collect_stakeholders(results, titles_by_query[query], category, stakeholders, seen_urls)
+            if len(stakeholders) >= STAKEHOLDER_SATURATION:
+                break
+        return stakeholders
+
+    async def search_contact_linkedin(self, contact_name: str, company_name: str, title: str = None) -> dict:
+        """Search for a specific person's LinkedIn profile"""
+        searcher = self.searcher
+        results = await self.search(searcher._contact_query(contact_name, company_name, title), num_results=1)
+        return searcher._collect_contact_linkedin(results)
+
+
+class _LoopThread:
+    """An event loop running forever on a daemon thread, with the connection pool its searches share"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.shared = _SharedState()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='async-search-loop', daemon=True)
+        self.thread.start()
+
+    def run(self, coroutine, timeout: Optional[float] = None):
+        """Run a coroutine on the loop and block the calling thread until it finishes"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def stop(self):
+        """Close the connection pool, then stop the loop"""
+        if not self.loop.is_running():
+            return
+        try:
+            self.run(self.shared.close(), timeout=5)
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=5)
+
+
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+
+def get_shared_loop() -> _LoopThread:
+    """Return the process-wide background event loop, starting it on first use"""
+    global _shared_loop
+
+    if _shared_loop is None:
+        with _shared_loop_lock:
+            if _shared_loop is None:
+                _shared_loop = _LoopThread()
+                atexit.register(_shared_loop.stop)
+    return _shared_loop
+
+
+class LoopBackedWebSearcher(WebSearcher):
+    """
+    Synchronous WebSearcher whose API calls run on a shared background event loop
+
+    A drop-in for WebSearcher (CLI, batch mode, web app): callers and
+    research phases stay blocking and threaded, but every query they issue
+    is a coroutine on the shared loop. All LoopBackedWebSearchers in the
+    process (e.g. one per web request) share that loop's aiohttp pool of
+    ASYNC_SEARCH_CONNECTIONS sockets and its in-flight queries; the pool is
+    closed at interpreter exit.
+    """
+
+    def __init__(self, *args, **kwargs):
+        _require_aiohttp()
+        super().__init__(*args, **kwargs)
+        self._loop = get_shared_loop()
+
+    def search(self, query: str, num_results: int = 5, start: int = 1) -> List[Dict]:
+        return self._loop.run(self._async_searcher().search(query, num_results, start))
+
+    def search_many(self, queries: List[str], num_results: Union[int, List[int]] = 5,
+                    start: int = 1) -> List[List[Dict]]:
+        return self._loop.run(self._async_searcher().search_many(queries, num_results, start))
+
+    def _async_searcher(self) -> AsyncWebSearcher:
+        # Built per call: bind() copies this searcher (progress, budget), and the copy must be the one consulted
+        return AsyncWebSearcher(self, shared=self._loop.shared)
@@ -5,21 +5,170 @@ Demo Prep Tool - Generate demo preparation documents by researching companies
 
 import argparse
 import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import json
 import os
 import sys
 import re
+import threading
+import time
+import copy
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from urllib.parse import urlparse, quote
-from typing import List, Dict, Optional
-from security_vendors import get_security_vendors
+from typing import List, Dict, Optional, Union
+from security_vendors import get_vendors_by_priority
+from http_client import get_shared_session
+from search_cache import SearchCache, cache_key, classify_query, get_default_cache
+from extractors import (
+    TECHNOLOGY_MATCHER, SECURITY_TOOL_MATCHER, TermMatcher, extract_technologies, extract_security_tools
+)
+from progress import ProgressBus
+from quota import QuotaTracker, QueryBudget, get_default_quota_tracker
+from rate_limiter import TokenBucket, get_default_rate_limiter
+from singleflight import SingleFlight
+from pdf_renderer import get_default_pdf_renderer
+from research_store import get_default_research_store
+from website_scraper import scrape_homepage
+from site_crawler import SiteCrawler
+from profiling import profile_run
+from metrics import (
+    PHASE_SECONDS, SEARCH_CACHE_LOOKUPS, SEARCH_ERRORS, SEARCH_SECONDS, SEARCH_SKIPPED, format_summary
+)
+
+# Maximum number of Google Custom Search requests in flight at once
+DEFAULT_MAX_WORKERS = 8
+
+# Stakeholder queries are dispatched in small waves so the search can stop
+# once enough people are found (the category is saturated)
+STAKEHOLDER_WAVE_SIZE = 3
+STAKEHOLDER_SATURATION = 2
+
+# Tech stack and security tool queries go out in fixed-size waves; the search
+# stops once it has found TERM_SATURATION terms, or after TERM_PATIENCE
+# consecutive waves that found nothing new
+TERM_WAVE_SIZE = 4
+TERM_SATURATION = 25
+TERM_PATIENCE = 2
+
+# Paid (uncached) vendor queries per research; cached vendor checks are free
+VENDOR_QUERY_CAP = 20
+
+# Google ignores query words past the 32nd; long queries also risk the URL limit
+MAX_QUERY_WORDS = 32
+MAX_QUERY_CHARS = 1024
+
+# Batched vendor checks: results per page (the API maximum) and pages read per
+# batch while its results stay dense (a full page with vendors still unseen)
+VENDOR_BATCH_PAGE_SIZE = 10
+VENDOR_BATCH_MAX_PAGES = 3
+
+# CompanyResearcher phases in default run order, mapped to the phases they
+# depend on and the self.data key they populate
+RESEARCH_PHASES = {
+    'research_website': {'depends_on': [], 'output': 'website_info'},
+    'get_company_info': {'depends_on': [], 'output': 'company_info'},
+    # Uses the pages crawled by research_website when both run together
+    'research_tech_stack': {'depends_on': ['research_website'], 'output': 'tech_stack'},
+    # Scans the crawled pages instead of querying site:{domain} security
+    'research_security_tools': {'depends_on': ['research_website'], 'output': 'security_tools'},
+    'research_security_vendors': {'depends_on': [], 'output': 'security_vendors'},
+    'research_security_leadership': {'depends_on': [], 'output': 'security_leadership'},
+    'research_executive_leadership': {'depends_on': [], 'output': 'executive_leadership'},
+    'enrich_contact_leads': {'depends_on': [], 'output': 'contact_leads'},
+}
+
+# Seconds a single research phase may run before run_all() gives up on it
+DEFAULT_PHASE_TIMEOUT = 300
+
+# Days a researched section stays fresh when re-researching incrementally;
+# sections not listed (contact leads) are always re-run
+SECTION_FRESHNESS_DAYS = {
+    'website_info': 30,
+    'company_info': 3,  # includes recent news
+    'tech_stack': 30,
+    'security_tools': 30,
+    'security_vendors': 14,
+    'security_leadership': 30,
+    'executive_leadership': 60,
+}
+
+# Field identifying an item in each list section, for diffing two results
+SECTION_ITEM_KEYS = {
+    'tech_stack': 'technology',
+    'security_tools': 'tool',
+    'security_vendors': 'vendor',
+    'security_leadership': 'name',
+    'executive_leadership': 'name',
+}
+
+
+def _saturated_terms(items: list):
+    """
+    Saturation check for iter_search(): True once items holds TERM_SATURATION
+    terms, or the last TERM_PATIENCE waves of queries added nothing to it
+    """
+    last_count = [len(items)]
+    empty_waves = [0]
+
+    def saturated():
+        empty_waves[0] = empty_waves[0] + 1 if len(items) == last_count[0] else 0
+        last_count[0] = len(items)
+        return len(items) >= TERM_SATURATION or empty_waves[0] >= TERM_PATIENCE
+
+    return saturated
+
+
+def pack_or_queries(prefix: str, terms: List[str], max_words: int = MAX_QUERY_WORDS,
+                    max_chars: int = MAX_QUERY_CHARS) -> Dict[str, List[str]]:
+    """
+    Pack quoted terms into as few '{prefix} ("a" OR "b" ...)' queries as the
+    query limits allow, keeping term order; returns query -> its terms
+    """
+    def size(group):
+        query = f'{prefix} (' + ' OR '.join(f'"{term}"' for term in group) + ')'
+        return query, len(re.findall(r'[^\s"()]+', query))
+
+    packed = {}
+    group = []
+    for term in terms:
+        query, words = size(group + [term])
+        if group and (words > max_words or len(query) > max_chars):
+            packed[size(group)[0]] = group
+            group = []
+        group.append(term)
+    if group:
+        packed[size(group)[0]] = group
+    return packed
+
+
+def _search_error_reason(error: requests.exceptions.RequestException) -> str:
+    """Metrics label for a failed API call (429s arrive here once the session's retries are used up)"""
+    response = getattr(error, 'response', None)
+    if response is not None and response.status_code == 429:
+        return 'rate_limited'
+    if isinstance(error, requests.exceptions.HTTPError):
+        return 'http_error'
+    return 'network'
+
+
+def _search_was_billed(error: requests.exceptions.RequestException) -> bool:
+    """False if a failed API call never reached Google or was turned away (429, 5xx), so no query was charged"""
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code != 429 and response.status_code < 500
 
 
 class WebSearcher:
     """Handle web search queries using Google Custom Search API"""
 
-    def __init__(self, api_key: Optional[str] = None, search_engine_id: Optional[str] = None):
+    # Identical searches in flight at the same time share one API call,
+    # across every WebSearcher in the process (unless the call is refused by
+    # the budget or quota of the searcher that made it)
+    _in_flight_searches = SingleFlight()
+
+    def __init__(self, api_key: Optional[str] = None, search_engine_id: Optional[str] = None,
+                 max_workers: Optional[int] = None, session: Optional[requests.Session] = None,
+                 cache: Optional[SearchCache] = None, use_cache: bool = True,
+                 quota: Optional[QuotaTracker] = None, rate_limiter: Optional[TokenBucket] = None):
         """
         Initialize web searcher with API credentials
 
@@ -28,18 +177,41 @@ class WebSearcher:
         2. Enable Custom Search API
         3. Create credentials (API key)
         4. Create a Custom Search Engine: https://programmablesearchengine.google.com/
+
+        Args:
+            max_workers: Maximum concurrent search requests
+                (default: SEARCH_MAX_WORKERS env var or 8)
+            session: HTTP session to use (default: shared pooled session)
+            cache: Search result cache (default: shared on-disk cache)
+            use_cache: Set False to always query the API
+            quota: Daily quota tracker (default: shared on-disk tracker)
+            rate_limiter: Token bucket paced before each API call
+                (default: shared limiter from SEARCH_QPS / SEARCH_BURST)
         """
         self.api_key = api_key or os.environ.get('GOOGLE_API_KEY')
         self.search_engine_id = search_engine_id or os.environ.get('GOOGLE_SEARCH_ENGINE_ID')
         self.base_url = "https://www.googleapis.com/customsearch/v1"
-
-    def search(self, query: str, num_results: int = 5) -> List[Dict]:
+        self.session = session or get_shared_session()
+        self.cache = (cache or get_default_cache()) if use_cache else None
+        self.quota = quota or get_default_quota_tracker()
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        # Per-research progress bus and query budget, set through bind()
+        self.progress = None
+        self.budget = None
+        self.max_workers = max(1, max_workers or int(os.environ.get('SEARCH_MAX_WORKERS', DEFAULT_MAX_WORKERS)))
+        # 'batched' packs vendors into OR-queries; 'per_vendor' spends a query on each vendor
+        self.vendor_search_mode = os.environ.get('VENDOR_SEARCH_MODE', 'batched').lower()
+        # Caps in-flight requests across every concurrent search_many() call
+        self._in_flight = threading.BoundedSemaphore(self.max_workers)
+
+    def search(self, query: str, num_results: int = 5, start: int = 1) -> List[Dict]:
         """
         Perform a web search and return results
 
         Args:
             query: Search query string
             num_results: Number of results to return (max 10)
+            start: 1-based rank of the first result, to page through results
 
         Returns:
             List of search result dictionaries with 'title', 'link', 'snippet'
@@ -49,38 +221,363 @@ class WebSearcher:
             print("  Set GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID environment variables")
             return []
 
+        num_results = min(num_results, 10)
+        category = classify_query(query)
+        started = time.perf_counter()
+
+        if self.cache:
+            cached = self.cache.get(query, num_results, start, self.search_engine_id)
+            SEARCH_CACHE_LOOKUPS.inc(result='miss' if cached is None else 'hit')
+            if cached is not None:
+                SEARCH_SECONDS.observe(time.perf_counter() - started, category=category, source='cache')
+                return cached
+
+        key = (cache_key(query, start, self.search_engine_id), num_results)
+        results, shared = self._in_flight_searches.do(key, lambda: self._fetch(query, num_results, start))
+        if results is None and shared:
+            # The leader's budget or quota refused the query; this searcher's may not
+            results, shared = self._fetch(query, num_results, start), False
+        SEARCH_SECONDS.observe(time.perf_counter() - started, category=category,
+                               source='shared' if shared else 'api')
+        return results if results is not None else []
+
+    def _fetch(self, query: str, num_results: int, start: int = 1) -> Optional[List[Dict]]:
+        """
+        Call the Custom Search API (after budget and rate-limit checks) and cache the results
+
+        Returns None, rather than [], when the budget or quota refused the query.
+        """
+        if not self._reserve_query():
+            print(f"⚠ Query budget exhausted, skipping: {query}")
+            SEARCH_SKIPPED.inc(category=classify_query(query))
+            return None
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
         try:
             params = {
                 'key': self.api_key,
                 'cx': self.search_engine_id,
                 'q': query,
-                'num': min(num_results, 10)
+                'num': num_results
             }
+            if start > 1:
+                params['start'] = start
 
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            results = self._parse_results(response.json())
 
-            results = []
-            for item in data.get('items', []):
-                results.append({
-                    'title': item.get('title', ''),
-                    'link': item.get('link', ''),
-                    'snippet': item.get('snippet', '')
-                })
+            if self.cache:
+                self.cache.put(query, num_results, results, start, self.search_engine_id)
 
             return results
 
         except requests.exceptions.RequestException as e:
             print(f"⚠ Search error: {str(e)}")
+            SEARCH_ERRORS.inc(category=classify_query(query), reason=_search_error_reason(e))
+            if not _search_was_billed(e):
+                self._refund_query()
             return []
         except Exception as e:
             print(f"⚠ Unexpected error during search: {str(e)}")
+            SEARCH_ERRORS.inc(category=classify_query(query), reason='unexpected')
+            return []
+
+    @staticmethod
+    def _parse_results(data: Dict) -> List[Dict]:
+        """Title/link/snippet of each item in a Custom Search API response"""
+        results = []
+        for item in data.get('items', []):
+            results.append({
+                'title': item.get('title', ''),
+                'link': item.get('link', ''),
+                'snippet': item.get('snippet', '')
+            })
+        return results
+
+    def _reserve_query(self) -> bool:
+        """Charge one API query to the research budget and the daily quota"""
+        if self.budget and not self.budget.try_spend():
+            return False
+        if self.quota and not self.quota.try_spend():
+            if self.budget:
+                self.budget.refund()
+            return False
+        return True
+
+    def _refund_query(self):
+        """Give back a query charged by _reserve_query() that was never billed"""
+        if self.budget:
+            self.budget.refund()
+        if self.quota:
+            self.quota.refund()
+
+    def plan_queries(self, queries: List[str], num_results: int = 5,
+                     max_paid: Optional[int] = None, start: int = 1) -> List[str]:
+        """
+        Choose which queries to send, keeping their priority order
+
+        Queries with a fresh cached answer cost nothing and are always kept.
+        Other queries are kept while the research budget, the daily quota
+        and max_paid allow.
+        """
+        limits = [max_paid]
+        if self.budget:
+            limits.append(self.budget.remaining)
+        if self.quota:
+            limits.append(self.quota.remaining())
+        limits = [limit for limit in limits if limit is not None]
+        if not limits:
+            return list(queries)
+
+        paid_allowed = min(limits)
+        planned = []
+        paid = 0
+        for query in queries:
+            if self.is_cached(query, num_results, start):
+                planned.append(query)
+            elif paid < paid_allowed:
+                planned.append(query)
+                paid += 1
+        return planned
+
+    def is_cached(self, query: str, num_results: int = 5, start: int = 1) -> bool:
+        """True if the query has a fresh cached answer, i.e. searching it costs no API call"""
+        return bool(self.cache) and self.cache.is_fresh(query, min(num_results, 10), start, self.search_engine_id)
+
+    def bind(self, **attributes) -> 'WebSearcher':
+        """
+        Return a copy of this searcher with some attributes overridden
+
+        The copy shares the session, cache and in-flight limit, so a single
+        searcher can serve many concurrent researches, each with its own
+        per-research settings (e.g. bind(progress=bus)).
+        """
+        bound = copy.copy(self)
+        for name, value in attributes.items():
+            setattr(bound, name, value)
+        return bound
+
+    def search_many(self, queries: List[str], num_results: Union[int, List[int]] = 5,
+                    start: int = 1) -> List[List[Dict]]:
+        """
+        Perform several searches concurrently
+
+        Args:
+            queries: Search query strings
+            num_results: Number of results to return per query (max 10), or
+                a list with one count per query
+            start: 1-based rank of the first result, for every query
+
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        if not queries:
             return []
 
+        if self.progress:
+            self.progress.emit('queries_dispatched', count=len(queries))
+
+        counts = num_results if isinstance(num_results, list) else [num_results] * len(queries)
+
+        if len(queries) == 1 or self.max_workers == 1:
+            return [self._bounded_search(query, num, start) for query, num in zip(queries, counts)]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries))) as executor:
+            return list(executor.map(lambda query, num: self._bounded_search(query, num, start), queries, counts))
+
+    def iter_search(self, queries: List[str], num_results: int = 5, wave_size: Optional[int] = None,
+                    saturated=None):
+        """
+        Yield (query, results) pairs in query order, dispatching queries in waves
+
+        Each wave runs concurrently; the next wave is only dispatched once the
+        caller consumes the previous one and saturated() (if given) returns
+        False, so stopping early saves quota.
+        """
+        wave_size = wave_size or len(queries) or 1
+        for start in range(0, len(queries), wave_size):
+            if start and saturated and saturated():
+                return
+            wave = queries[start:start + wave_size]
+            for query, results in zip(wave, self.search_many(wave, num_results)):
+                yield query, results
+
+    def _bounded_search(self, query: str, num_results: int, start: int = 1) -> List[Dict]:
+        """Run a single search while holding an in-flight slot"""
+        with self._in_flight:
+            results = self.search(query, num_results, start)
+
+        if self.progress:
+            self.progress.emit('query', query=query, results=len(results))
+        return results
+
     def search_company_info(self, company_name: str, domain: str) -> Dict:
         """Search for general company information"""
+        # All four lookups go out together, each asking for as many results as it uses
+        queries = self._company_info_queries(company_name, domain)
+        results = self.search_many(list(queries), num_results=list(queries.values()))
+        return self._collect_company_info(*results)
+
+    def search_tech_stack(self, company_name: str, domain: str,
+                          site_pages: Optional[List[Dict]] = None) -> List[str]:
+        """
+        Search for company's technology stack
+
+        Technologies named on crawled pages of the company's own site
+        (site_pages) are collected first, free of API quota.
+        """
+        tech_stack, seen_techs = self._collect_site_matches(TECHNOLOGY_MATCHER, 'technology', site_pages)
+
+        queries = self.plan_queries(self._tech_stack_queries(company_name, domain), num_results=3)
+        saturated = _saturated_terms(tech_stack)
+
+        for query, results in self.iter_search(queries, num_results=3, wave_size=TERM_WAVE_SIZE,
+                                               saturated=saturated):
+            self._collect_matches(self._extract_technologies, 'technology', results, tech_stack, seen_techs)
+
+        return tech_stack
+
+    def search_security_tools(self, company_name: str, domain: str,
+                              site_pages: Optional[List[Dict]] = None) -> List[str]:
+        """
+        Search for company's security tools and practices
+
+        When pages of the company's own site were crawled (site_pages), they
+        are scanned locally instead of spending a query on site:{domain}.
+        """
+        security_tools, seen_tools = self._collect_site_matches(SECURITY_TOOL_MATCHER, 'tool', site_pages)
+
+        queries = self.plan_queries(self._security_tool_queries(company_name, domain, site_pages), num_results=3)
+        saturated = _saturated_terms(security_tools)
+
+        for query, results in self.iter_search(queries, num_results=3, wave_size=TERM_WAVE_SIZE,
+                                               saturated=saturated):
+            self._collect_matches(self._extract_security_tools, 'tool', results, security_tools, seen_tools)
+
+        return security_tools
+
+    def search_security_vendor_connections(self, company_name: str, domain: str) -> List[Dict]:
+        """
+        Search for connections between company and known security vendors
+        Uses a curated list of security vendors (Black Hat sponsors, major vendors)
+
+        By default vendors are checked in batches: a few OR-queries cover the
+        whole list, results are paged while they stay dense, and each result
+        is attributed to the vendors it names. VENDOR_SEARCH_MODE=per_vendor
+        spends one query per vendor instead (capped at VENDOR_QUERY_CAP).
+        """
+        if self.vendor_search_mode != 'per_vendor':
+            return self._search_vendor_batches(company_name)
+
+        vendors_by_query = self._vendor_queries(company_name)
+
+        print(f"  🔍 Checking {len(vendors_by_query)} security vendors...")
+
+        # Vendors with cached answers are free; cap the rest to balance
+        # thoroughness with API quota
+        queries = self.plan_queries(list(vendors_by_query), num_results=2, max_paid=VENDOR_QUERY_CAP)
+
+        # Search for company + vendor connection, all vendors at once
+        vendor_results = self.search_many(queries, num_results=2)
+
+        return self._collect_vendor_connections(
+            company_name, [vendors_by_query[query] for query in queries], vendor_results
+        )
+
+    def _search_vendor_batches(self, company_name: str) -> List[Dict]:
+        """Batched vendor check: OR-queries over the vendor list, paged while results stay dense"""
+        vendors_by_query = self._vendor_batch_queries(company_name)
+        vendor_count = sum(len(vendors) for vendors in vendors_by_query.values())
+        print(f"  🔍 Checking {vendor_count} security vendors in {len(vendors_by_query)} batched queries...")
+
+        matcher = TermMatcher([vendor for vendors in vendors_by_query.values() for vendor in vendors])
+        vendor_connections = []
+        seen_vendors = set()
+
+        queries = list(vendors_by_query)
+        paid_allowed = VENDOR_QUERY_CAP
+        for page in range(VENDOR_BATCH_MAX_PAGES):
+            start = 1 + page * VENDOR_BATCH_PAGE_SIZE
+            queries = self.plan_queries(queries, num_results=VENDOR_BATCH_PAGE_SIZE,
+                                        max_paid=paid_allowed, start=start)
+            if not queries:
+                break
+            # Only API calls count against the cap; cached pages are free
+            paid_allowed -= sum(not self.is_cached(query, VENDOR_BATCH_PAGE_SIZE, start) for query in queries)
+
+            page_results = self.search_many(queries, num_results=VENDOR_BATCH_PAGE_SIZE, start=start)
+            for results in page_results:
+                self._collect_vendor_mentions(company_name, matcher, results, vendor_connections, seen_vendors)
+            queries = self._dense_vendor_batches(vendors_by_query, queries, page_results, seen_vendors)
+
+        return vendor_connections
+
+    def search_stakeholders(self, company_name: str, role_titles: list, category: str) -> list:
+        """
+        Search for company stakeholders by role titles
+
+        Args:
+            company_name: Company name to search for
+            role_titles: List of role titles to search (e.g., ["CISO", "VP Security"])
+            category: Category label (e.g., "Security Leadership")
+
+        Returns:
+            List of dictionaries with name, title, linkedin_url, role_category
+        """
+        stakeholders = []
+        seen_urls = set()
+
+        # Search LinkedIn for each role, a few roles at a time
+        titles_by_query = self._stakeholder_queries(company_name, role_titles)
+        queries = self.plan_queries(list(titles_by_query), num_results=2)
+        role_results = self.iter_search(
+            queries, num_results=2, wave_size=STAKEHOLDER_WAVE_SIZE,
+            saturated=lambda: len(stakeholders) >= STAKEHOLDER_SATURATION
+        )
+
+        for query, results in role_results:
+            self._collect_stakeholders(results, titles_by_query[query], category, stakeholders, seen_urls)
+
+            # Early termination: if we found someone for this role category,
+            # we can be less aggressive searching variants
+            if len(stakeholders) >= STAKEHOLDER_SATURATION:
+                break
+
+        return stakeholders
+
+    def search_contact_linkedin(self, contact_name: str, company_name: str, title: str = None) -> dict:
+        """
+        Search for a specific person's LinkedIn profile
+
+        Args:
+            contact_name: Person's full name
+            company_name: Company they work at
+            title: Optional job title to refine search
+
+        Returns:
+            Dict with linkedin_url and linkedin_snippet, or empty dict if not found
+        """
+        results = self.search(self._contact_query(contact_name, company_name, title), num_results=1)
+        return self._collect_contact_linkedin(results)
+
+    # Query lists and result collection, shared with async_search.AsyncWebSearcher
+
+    def _company_info_queries(self, company_name: str, domain: str) -> Dict[str, int]:
+        """Query -> results wanted, for the LinkedIn, Crunchbase, general and news queries in that order"""
+        return {
+            f"{company_name} site:linkedin.com/company": 3,
+            f"{company_name} site:crunchbase.com": 3,
+            f"{company_name} {domain} company about": 5,
+            f"{company_name} news 2026": 3,
+        }
+
+    def _collect_company_info(self, linkedin_results: List[Dict], crunchbase_results: List[Dict],
+                              general_results: List[Dict], news_results: List[Dict]) -> Dict:
+        """Build the company info section from the _company_info_queries() results"""
         info = {
             'linkedin': None,
             'crunchbase': None,
@@ -88,9 +585,7 @@ class WebSearcher:
             'news': []
         }
 
-        # Search for LinkedIn profile
-        linkedin_query = f"{company_name} site:linkedin.com/company"
-        linkedin_results = self.search(linkedin_query, num_results=3)
+        # LinkedIn profile
         for result in linkedin_results:
             if 'linkedin.com/company' in result['link']:
                 info['linkedin'] = {
@@ -99,9 +594,7 @@ class WebSearcher:
                 }
                 break
 
-        # Search for Crunchbase profile
-        crunchbase_query = f"{company_name} site:crunchbase.com"
-        crunchbase_results = self.search(crunchbase_query, num_results=3)
+        # Crunchbase profile
         for result in crunchbase_results:
             if 'crunchbase.com' in result['link']:
                 info['crunchbase'] = {
@@ -111,8 +604,6 @@ class WebSearcher:
                 break
 
         # General company information
-        general_query = f"{company_name} {domain} company about"
-        general_results = self.search(general_query, num_results=5)
         for result in general_results:
             info['about'].append({
                 'title': result['title'],
@@ -121,8 +612,6 @@ class WebSearcher:
             })
 
         # Recent news
-        news_query = f"{company_name} news 2026"
-        news_results = self.search(news_query, num_results=3)
         for result in news_results:
             info['news'].append({
                 'title': result['title'],
@@ -132,12 +621,8 @@ class WebSearcher:
 
         return info
 
-    def search_tech_stack(self, company_name: str, domain: str) -> List[str]:
-        """Search for company's technology stack"""
-        tech_stack = []
-
-        # Search for tech stack information with focus on job postings
-        queries = [
+    def _tech_stack_queries(self, company_name: str, domain: str) -> List[str]:
+        return [
             # Job posting searches (most reliable)
             f'site:linkedin.com/jobs "{company_name}" software engineer',
             f'site:glassdoor.com "{company_name}" developer',
@@ -151,30 +636,8 @@ class WebSearcher:
             f'site:reddit.com "{company_name}" technologies',
         ]
 
-        seen_techs = set()
-
-        for query in queries:
-            results = self.search(query, num_results=3)
-            for result in results:
-                # Extract potential technologies from snippets
-                text = f"{result['title']} {result['snippet']}"
-                techs = self._extract_technologies(text)
-                for tech in techs:
-                    if tech.lower() not in seen_techs:
-                        seen_techs.add(tech.lower())
-                        tech_stack.append({
-                            'technology': tech,
-                            'source': result['link'],
-                            'context': result['snippet'][:200]
-                        })
-
-        return tech_stack
-
-    def search_security_tools(self, company_name: str, domain: str) -> List[str]:
-        """Search for company's security tools and practices"""
-        security_tools = []
-
-        # Search for actual security products with targeted queries
+    def _security_tool_queries(self, company_name: str, domain: str,
+                               site_pages: Optional[List[Dict]] = None) -> List[str]:
         queries = [
             # Security-specific job postings (most likely to mention tools)
             f'site:linkedin.com/jobs "{company_name}" "SOC analyst"',
@@ -194,62 +657,81 @@ class WebSearcher:
             f'"{company_name}" selects security solution',
             # Tech communities discussing tools
             f'site:reddit.com "{company_name}" security tools',
-            # Official security pages (for compliance context)
-            f'site:{domain} security',
         ]
+        if not site_pages:
+            # Official security pages (for compliance context)
+            queries.append(f'site:{domain} security')
+        return queries
+
+    def _collect_site_matches(self, matcher, key: str, site_pages: Optional[List[Dict]]):
+        """Terms named on crawled pages, as ([{key, 'source', 'context'}], set of lower-cased terms seen)"""
+        items = []
+        seen = set()
+        for page in site_pages or []:
+            for term, context in matcher.find_with_context(page['text']):
+                if term.lower() not in seen:
+                    seen.add(term.lower())
+                    items.append({key: term, 'source': page['url'], 'context': context})
+        return items, seen
+
+    def _collect_matches(self, extract, key: str, results: List[Dict], items: List[Dict], seen: set):
+        """Add terms extract() finds in search results to items, skipping terms already seen"""
+        for result in results:
+            text = f"{result['title']} {result['snippet']}"
+            for term in extract(text):
+                if term.lower() not in seen:
+                    seen.add(term.lower())
+                    items.append({
+                        key: term,
+                        'source': result['link'],
+                        'context': result['snippet'][:200]
+                    })
 
-        seen_tools = set()
-
-        for query in queries:
-            results = self.search(query, num_results=3)
-            for result in results:
-                # Extract security-related information
-                text = f"{result['title']} {result['snippet']}"
-                tools = self._extract_security_tools(text)
-                for tool in tools:
-                    if tool.lower() not in seen_tools:
-                        seen_tools.add(tool.lower())
-                        security_tools.append({
-                            'tool': tool,
-                            'source': result['link'],
-                            'context': result['snippet'][:200]
-                        })
-
-        return security_tools
-
-    def search_security_vendor_connections(self, company_name: str, domain: str) -> List[Dict]:
-        """
-        Search for connections between company and known security vendors
-        Uses a curated list of security vendors (Black Hat sponsors, major vendors)
-        """
-        vendor_connections = []
-        seen_vendors = set()
+    def _vendor_queries(self, company_name: str) -> Dict[str, str]:
+        """Query -> vendor, most common vendors first"""
+        return {f'"{company_name}" "{vendor}"': vendor for vendor in get_vendors_by_priority()}
 
-        # Get list of security vendors
-        security_vendors = get_security_vendors()
+    def _vendor_batch_queries(self, company_name: str) -> Dict[str, List[str]]:
+        """OR-query -> the vendors it checks, packed to the query limits, most common vendors first"""
+        return pack_or_queries(f'"{company_name}"', get_vendors_by_priority())
 
-        print(f"  🔍 Checking {len(security_vendors)} security vendors...")
+    def _collect_vendor_mentions(self, company_name: str, matcher: TermMatcher, results: List[Dict],
+                                 vendor_connections: List[Dict], seen_vendors: set):
+        """Attribute batched results to every vendor they name alongside the company"""
+        for result in results:
+            text = f"{result['title']} {result['snippet']}"
+            if company_name.lower() not in text.lower():
+                continue
+            for vendor in matcher.find_all(text):
+                if vendor.lower() not in seen_vendors:
+                    seen_vendors.add(vendor.lower())
+                    vendor_connections.append({
+                        'vendor': vendor,
+                        'source': result['link'],
+                        'context': result['snippet'][:250],
+                        'title': result['title']
+                    })
 
-        # Search for top vendors (limit to avoid quota exhaustion)
-        # Prioritize the most common vendors
-        priority_vendors = [
-            "CrowdStrike", "Splunk", "CyberArk", "Okta", "Palo Alto Networks",
-            "Fortinet", "Proofpoint", "Tenable", "Rapid7", "SentinelOne",
-            "Wiz", "Zscaler", "Mimecast", "Varonis", "Recorded Future"
+    def _dense_vendor_batches(self, vendors_by_query: Dict[str, List[str]], queries: List[str],
+                              page_results: List[List[Dict]], seen_vendors: set) -> List[str]:
+        """Batches worth another page: this page came back full and some of their vendors are still unseen"""
+        return [
+            query for query, results in zip(queries, page_results)
+            if len(results) >= VENDOR_BATCH_PAGE_SIZE
+            and any(vendor.lower() not in seen_vendors for vendor in vendors_by_query[query])
         ]
 
-        vendors_to_check = priority_vendors + [v for v in security_vendors if v not in priority_vendors]
+    def _collect_vendor_connections(self, company_name: str, vendors: List[str],
+                                    vendor_results: List[List[Dict]]) -> List[Dict]:
+        """Vendors whose results mention both the company and the vendor"""
+        vendor_connections = []
+        seen_vendors = set()
 
-        # Check top 20 vendors to balance thoroughness with API quota
-        for vendor in vendors_to_check[:20]:
+        for vendor, results in zip(vendors, vendor_results):
             vendor_lower = vendor.lower()
             if vendor_lower in seen_vendors:
                 continue
 
-            # Search for company + vendor connection
-            query = f'"{company_name}" "{vendor}"'
-            results = self.search(query, num_results=2)
-
             for result in results:
                 # Check if result actually mentions both company and vendor
                 text = f"{result['title']} {result['snippet']}".lower()
@@ -265,148 +747,65 @@ class WebSearcher:
 
         return vendor_connections
 
-    def _extract_technologies(self, text: str) -> List[str]:
-        """Extract technology names from text"""
-        # Common technologies to look for (expanded for job postings)
-        tech_patterns = [
-            # Programming languages
-            r'\b(Python|Java|JavaScript|TypeScript|Go|Golang|Rust|Ruby|PHP|C\+\+|C#|\.NET|Swift|Kotlin|Scala|Perl|Objective-C|Visual Basic|VB\.NET)\b',
-            # Web frameworks
-            r'\b(React|Angular|Vue\.js|Vue|Django|Flask|FastAPI|Rails|Ruby on Rails|Spring Boot|Spring|Express|Next\.js|Node\.js|ASP\.NET|Laravel)\b',
-            # Mobile
-            r'\b(React Native|Flutter|Xamarin|Ionic|SwiftUI)\b',
-            # Databases
-            r'\b(PostgreSQL|Postgres|MySQL|SQL Server|MSSQL|MongoDB|Redis|Elasticsearch|DynamoDB|Cassandra|Oracle|DB2|MariaDB|SQLite|Couchbase|Neo4j)\b',
-            # Specialized databases
-            r'\b(InterSystems Cache|Caché|MUMPS|M technology)\b',
-            # Cloud/Infrastructure
-            r'\b(AWS|Amazon Web Services|Azure|Microsoft Azure|Google Cloud|GCP|Kubernetes|K8s|Docker|Terraform|Ansible|Chef|Puppet|CloudFormation)\b',
-            # CI/CD & DevOps
-            r'\b(Jenkins|GitLab CI|GitHub Actions|CircleCI|Travis CI|TeamCity|Bamboo|Bitbucket)\b',
-            # Message queues & streaming
-            r'\b(Kafka|RabbitMQ|ActiveMQ|Redis Queue|SQS|Kinesis|Apache Flink|Storm)\b',
-            # APIs & Integration
-            r'\b(GraphQL|REST API|SOAP|gRPC|Microservices|FHIR|HL7)\b',
-            # Frontend tools
-            r'\b(Webpack|Vite|Babel|TypeScript|jQuery|Bootstrap|Tailwind CSS|Material UI|Redux|MobX)\b',
-            # Testing
-            r'\b(Jest|Mocha|Pytest|JUnit|Selenium|Cypress|TestNG|Cucumber)\b',
-            # Version control
-            r'\b(Git|GitHub|GitLab|Bitbucket|SVN|Subversion|Mercurial)\b',
-            # Other tools
-            r'\b(Linux|Unix|Windows Server|Apache|Nginx|Tomcat|IIS|Maven|Gradle|npm|pip)\b'
-        ]
-
-        technologies = []
-        for pattern in tech_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                tech = match.group(0)
-                if tech not in technologies:
-                    technologies.append(tech)
+    def _stakeholder_queries(self, company_name: str, role_titles: list) -> Dict[str, str]:
+        """Query -> role title"""
+        return {f'site:linkedin.com/in "{company_name}" "{role_title}"': role_title
+                for role_title in role_titles}
 
-        return technologies
-
-    def _extract_security_tools(self, text: str) -> List[str]:
-        """Extract security tool names from text"""
-        # Common security tools to look for (expanded with specific products)
-        security_patterns = [
-            # SIEM/Monitoring platforms
-            r'\b(Splunk|Splunk Enterprise|Datadog|New Relic|Sumo Logic|ELK Stack|Elastic|Elasticsearch|LogRhythm|QRadar|IBM QRadar|ArcSight|HP ArcSight)\b',
-            # Identity & Access Management (PAM)
-            r'\b(CyberArk|Okta|Auth0|Azure AD|Active Directory|Ping Identity|OneLogin|Duo Security|Duo|ForgeRock|BeyondTrust|Thycotic|Centrify)\b',
-            # Endpoint Security (EDR/EPP)
-            r'\b(CrowdStrike|CrowdStrike Falcon|Carbon Black|VMware Carbon Black|SentinelOne|Cylance|Symantec|Symantec Endpoint|McAfee|Trend Micro|Sophos|Microsoft Defender)\b',
-            # Network Security
-            r'\b(Palo Alto|Palo Alto Networks|Fortinet|FortiGate|Cisco ASA|Cisco Firepower|Check Point|F5 Networks|F5|Barracuda|Zscaler|Cisco Umbrella)\b',
-            # Cloud Security
-            r'\b(Cloudflare|Akamai|AWS GuardDuty|AWS Security Hub|Azure Security Center|Azure Sentinel|Google Cloud Security|Prisma Cloud|Wiz|Lacework)\b',
-            # Application Security (SAST/DAST)
-            r'\b(Snyk|Veracode|Checkmarx|SonarQube|WhiteSource|Mend|Black Duck|Fortify|HP Fortify|Qualys|Aqua Security|Twistlock)\b',
-            # Vulnerability Management
-            r'\b(Nessus|Tenable Nessus|Rapid7|InsightVM|Tenable\.io|OpenVAS|Nexpose|Qualys VMDR)\b',
-            # Email Security
-            r'\b(Proofpoint|Mimecast|Barracuda Email Security|Microsoft Defender for Office|Cisco Email Security)\b',
-            # Threat Intelligence
-            r'\b(Recorded Future|ThreatConnect|Anomali|CrowdStrike Threat Intelligence|Mandiant|FireEye)\b',
-            # CASB (Cloud Access Security Broker)
-            r'\b(Netskope|McAfee MVISION|Symantec CloudSOC|Microsoft Cloud App Security)\b',
-            # Security Automation (SOAR)
-            r'\b(Palo Alto Cortex XSOAR|Splunk SOAR|Phantom|IBM Resilient|Swimlane|Demisto)\b',
-            # Compliance Standards
-            r'\b(SOC ?2|SOC2 Type II|ISO 27001|ISO27001|HIPAA|HITECH|GDPR|PCI DSS|PCI-DSS|FedRAMP|NIST|CCPA)\b',
-            # Security Practices
-            r'\b(WAF|Web Application Firewall|Firewall|IDS|IPS|SIEM|VPN|MFA|Multi-Factor|SSO|Single Sign-On|Zero Trust|Penetration Testing|Pen Test|Red Team|Blue Team)\b',
-            # Encryption & PKI
-            r'\b(TLS|SSL|AES|RSA|PKI|Certificate Authority|HSM|Hardware Security Module)\b',
-            # Security Frameworks
-            r'\b(OWASP|CIS Controls|NIST CSF|MITRE ATT&CK)\b',
-            # DLP & Data Security
-            r'\b(DLP|Data Loss Prevention|Varonis|Digital Guardian|Forcepoint DLP)\b',
-            # Incident Response
-            r'\b(PagerDuty|ServiceNow Security Operations|Jira Service Management)\b'
-        ]
-
-        tools = []
-        for pattern in security_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                tool = match.group(0)
-                if tool not in tools:
-                    tools.append(tool)
+    def _collect_stakeholders(self, results: List[Dict], role_title: str, category: str,
+                              stakeholders: List[Dict], seen_urls: set):
+        """Add the LinkedIn profiles among one role query's results to stakeholders"""
+        for result in results:
+            # Extract LinkedIn URL
+            linkedin_url = self._extract_linkedin_url(result['link'])
+            if not linkedin_url:
+                continue
 
-        return tools
+            # Normalize and check for duplicates
+            normalized_url = self._normalize_linkedin_url(linkedin_url)
+            if normalized_url in seen_urls:
+                continue
+            seen_urls.add(normalized_url)
 
-    def search_stakeholders(self, company_name: str, role_titles: list, category: str) -> list:
-        """
-        Search for company stakeholders by role titles
+            # Extract name and title
+            name = self._extract_name_from_title(result['title'])
+            title = self._extract_title_from_result(result['title'], result['snippet'])
 
-        Args:
-            company_name: Company name to search for
-            role_titles: List of role titles to search (e.g., ["CISO", "VP Security"])
-            category: Category label (e.g., "Security Leadership")
+            if name and linkedin_url:
+                stakeholders.append({
+                    'name': name,
+                    'title': title or role_title,  # Fallback to searched role
+                    'linkedin_url': linkedin_url,
+                    'role_category': category
+                })
 
-        Returns:
-            List of dictionaries with name, title, linkedin_url, role_category
-        """
-        stakeholders = []
-        seen_urls = set()
+    def _contact_query(self, contact_name: str, company_name: str, title: Optional[str] = None) -> str:
+        if title:
+            return f'site:linkedin.com/in "{contact_name}" "{company_name}" "{title}"'
+        return f'site:linkedin.com/in "{contact_name}" "{company_name}"'
 
-        for role_title in role_titles:
-            # Search LinkedIn for this role
-            query = f'site:linkedin.com/in "{company_name}" "{role_title}"'
-            results = self.search(query, num_results=2)
+    def _collect_contact_linkedin(self, results: List[Dict]) -> Dict:
+        """LinkedIn URL and snippet from the first result, or {} if it is not a profile"""
+        if results:
+            result = results[0]
+            # Extract LinkedIn URL
+            linkedin_url = self._extract_linkedin_url(result['link'])
 
-            for result in results:
-                # Extract LinkedIn URL
-                linkedin_url = self._extract_linkedin_url(result['link'])
-                if not linkedin_url:
-                    continue
+            if linkedin_url:
+                return {
+                    'linkedin_url': linkedin_url,
+                    'linkedin_snippet': result.get('snippet', '')
+                }
 
-                # Normalize and check for duplicates
-                normalized_url = self._normalize_linkedin_url(linkedin_url)
-                if normalized_url in seen_urls:
-                    continue
-                seen_urls.add(normalized_url)
-
-                # Extract name and title
-                name = self._extract_name_from_title(result['title'])
-                title = self._extract_title_from_result(result['title'], result['snippet'])
-
-                if name and linkedin_url:
-                    stakeholders.append({
-                        'name': name,
-                        'title': title or role_title,  # Fallback to searched role
-                        'linkedin_url': linkedin_url,
-                        'role_category': category
-                    })
+        return {}
 
-            # Early termination: if we found someone for this role category,
-            # we can be less aggressive searching variants
-            if len(stakeholders) >= 2:
-                break
+    def _extract_technologies(self, text: str) -> List[str]:
+        """Extract technology names from text"""
+        return extract_technologies(text)
 
-        return stakeholders
+    def _extract_security_tools(self, text: str) -> List[str]:
+        """Extract security tool names from text"""
+        return extract_security_tools(text)
 
     def _extract_linkedin_url(self, url_or_text: str) -> Optional[str]:
         """Extract LinkedIn profile URL"""
@@ -450,39 +849,17 @@ class WebSearcher:
 
         return None
 
-    def search_contact_linkedin(self, contact_name: str, company_name: str, title: str = None) -> dict:
-        """
-        Search for a specific person's LinkedIn profile
 
-        Args:
-            contact_name: Person's full name
-            company_name: Company they work at
-            title: Optional job title to refine search
-
-        Returns:
-            Dict with linkedin_url and linkedin_snippet, or empty dict if not found
-        """
-        # Construct search query
-        if title:
-            query = f'site:linkedin.com/in "{contact_name}" "{company_name}" "{title}"'
-        else:
-            query = f'site:linkedin.com/in "{contact_name}" "{company_name}"'
-
-        # Search LinkedIn
-        results = self.search(query, num_results=1)
-
-        if results:
-            result = results[0]
-            # Extract LinkedIn URL
-            linkedin_url = self._extract_linkedin_url(result['link'])
-
-            if linkedin_url:
-                return {
-                    'linkedin_url': linkedin_url,
-                    'linkedin_snippet': result.get('snippet', '')
-                }
-
-        return {}
+def create_web_searcher(**options) -> WebSearcher:
+    """
+    WebSearcher for the SEARCH_BACKEND env var: 'threads' (default, a
+    thread per in-flight query) or 'async' (async_search, one event loop
+    multiplexing queries over an aiohttp pool)
+    """
+    if os.environ.get('SEARCH_BACKEND', 'threads').lower() == 'async':
+        from async_search import LoopBackedWebSearcher
+        return LoopBackedWebSearcher(**options)
+    return WebSearcher(**options)
 
 
 class CompanyResearcher:
@@ -491,10 +868,20 @@ class CompanyResearcher:
     def __init__(self, domain, web_searcher: Optional[WebSearcher] = None,
                  company_name_override: Optional[str] = None,
                  company_context: Optional[str] = None,
-                 contact_leads: Optional[List[Dict]] = None):
+                 contact_leads: Optional[List[Dict]] = None,
+                 progress: Optional[ProgressBus] = None,
+                 query_budget: Optional[int] = None):
         self.domain = domain
         self.company_name = company_name_override or self._extract_company_name(domain)
         self.company_context = company_context
+        self.progress = progress
+
+        # Per-research searcher settings (shares the session, cache and quota)
+        if query_budget is None and os.environ.get('RESEARCH_QUERY_BUDGET'):
+            query_budget = int(os.environ['RESEARCH_QUERY_BUDGET'])
+        self.query_budget = QueryBudget(query_budget) if query_budget else None
+        if web_searcher and (progress or self.query_budget):
+            web_searcher = web_searcher.bind(progress=progress, budget=self.query_budget)
         self.web_searcher = web_searcher
         self.data = {
             'domain': domain,
@@ -509,8 +896,226 @@ class CompanyResearcher:
             'security_leadership': [],
             'executive_leadership': [],
             'contact_leads': contact_leads or [],
-            'search_enabled': web_searcher is not None and web_searcher.api_key is not None
+            'search_enabled': web_searcher is not None and web_searcher.api_key is not None,
+            # Section (output key) -> when it was last researched
+            'section_dates': {}
         }
+        # Pages crawled from the company's own site ({'url', 'title', 'text'}),
+        # scanned by the tech stack and security tools research. Only kept for
+        # this run; they are not part of self.data or snapshots.
+        self.site_pages = []
+        # Outcome of each phase run through run_all(): completed, failed, timed_out or skipped
+        self.phase_status = {}
+        self._data_lock = threading.Lock()
+        self._abandoned_outputs = set()
+
+    def _store(self, key, value):
+        """
+        Write a phase result into self.data
+
+        Thread-safe; results from phases that run_all() already gave up on
+        are dropped so a late phase cannot overwrite a finished report.
+        """
+        with self._data_lock:
+            if key not in self._abandoned_outputs:
+                self.data[key] = value
+
+    def run_all(self, phases: Optional[List[str]] = None, timeout=DEFAULT_PHASE_TIMEOUT,
+                max_workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        Run research phases concurrently, respecting declared dependencies
+
+        A phase that times out is abandoned, not cancelled: its thread keeps
+        running in the background until the phase returns, but whatever it
+        stores afterwards is discarded.
+
+        Args:
+            phases: Phase names to run (default: every phase in RESEARCH_PHASES)
+            timeout: Seconds allowed per phase, or a dict of phase name -> seconds
+            max_workers: Maximum phases running at once (default: all of them)
+
+        Returns:
+            Dict of phase name -> status for the phases requested
+        """
+        phases = list(phases) if phases is not None else list(RESEARCH_PHASES)
+        for name in phases:
+            if name not in RESEARCH_PHASES:
+                raise ValueError(f"Unknown research phase: {name}")
+
+        def phase_timeout(name):
+            if isinstance(timeout, dict):
+                return timeout.get(name, DEFAULT_PHASE_TIMEOUT)
+            return timeout
+
+        pending = list(phases)
+        running = {}  # future -> (phase name, deadline)
+        executor = ThreadPoolExecutor(max_workers=max_workers or len(phases) or 1)
+        self._emit('research_start', phases=phases)
+
+        try:
+            while pending or running:
+                # Start every phase whose dependencies (within this run) are done
+                for name in list(pending):
+                    deps = [d for d in RESEARCH_PHASES[name]['depends_on'] if d in phases]
+                    if any(self.phase_status.get(d) in ('failed', 'timed_out', 'skipped') for d in deps):
+                        pending.remove(name)
+                        self.phase_status[name] = 'skipped'
+                        print(f"⚠ Skipping {name} - a phase it depends on did not complete")
+                        self._emit('phase_end', phase=name, status='skipped')
+                    elif all(self.phase_status.get(d) == 'completed' for d in deps):
+                        pending.remove(name)
+                        self.phase_status[name] = 'running'
+                        future = executor.submit(self._run_phase, name)
+                        running[future] = (name, time.monotonic() + phase_timeout(name))
+
+                if not running:
+                    continue
+
+                next_deadline = min(deadline for _, deadline in running.values())
+                done, _ = wait(running, timeout=max(0, next_deadline - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name, _ = running.pop(future)
+                    if future.exception():
+                        print(f"⚠ Error in {name}: {future.exception()}")
+                        self.phase_status[name] = 'failed'
+                    else:
+                        self.phase_status[name] = 'completed'
+
+                now = time.monotonic()
+                for future, (name, deadline) in list(running.items()):
+                    if deadline <= now:
+                        running.pop(future)
+                        self.phase_status[name] = 'timed_out'
+                        print(f"⚠ {name} timed out after {phase_timeout(name)}s")
+                        PHASE_SECONDS.observe(phase_timeout(name), phase=name, status='timed_out')
+                        with self._data_lock:
+                            self._abandoned_outputs.add(RESEARCH_PHASES[name]['output'])
+                        self._emit('phase_end', phase=name, status='timed_out')
+        finally:
+            # Don't block on phases that timed out; their results are discarded
+            executor.shutdown(wait=False)
+
+        statuses = {name: self.phase_status[name] for name in phases}
+        self._emit('research_end', phases=statuses)
+        return statuses
+
+    def pending_phases(self) -> List[str]:
+        """Phases that have not completed yet, in default run order"""
+        return [name for name in RESEARCH_PHASES if self.phase_status.get(name) != 'completed']
+
+    def snapshot(self) -> Dict:
+        """Copy of the research state, for continuing later with resume()"""
+        with self._data_lock:
+            return {
+                'data': copy.deepcopy(self.data),
+                'phase_status': dict(self.phase_status)
+            }
+
+    def resume(self, snapshot: Dict):
+        """
+        Load state saved by snapshot()
+
+        Completed phase results are kept, so run_all(self.pending_phases())
+        only runs the phases that are still missing.
+        """
+        with self._data_lock:
+            data = copy.deepcopy(snapshot['data'])
+            # Settings given to this researcher win over the snapshot
+            data['company_context'] = self.company_context
+            data['contact_leads'] = self.data['contact_leads'] or data.get('contact_leads', [])
+            data['search_enabled'] = self.data['search_enabled']
+            self.data.update(data)
+            self.phase_status.update({
+                name: status for name, status in snapshot['phase_status'].items() if status == 'completed'
+            })
+            self._recrawl_for_site_scans()
+
+    def load_previous(self, previous: Dict, freshness: Optional[Dict[str, float]] = None) -> List[str]:
+        """
+        Reuse the still-fresh sections of an earlier result (incremental re-research)
+
+        Sections researched within their freshness window are copied in and
+        their phases marked completed, so run_all(self.pending_phases())
+        only re-queries stale sections.
+
+        Args:
+            previous: Earlier CompanyResearcher.data for this company
+            freshness: Section -> days overrides for SECTION_FRESHNESS_DAYS
+
+        Returns:
+            Names of the phases that are stale and still need to run
+        """
+        windows = dict(SECTION_FRESHNESS_DAYS, **(freshness or {}))
+        dates = previous.get('section_dates')
+        now = datetime.now()
+
+        with self._data_lock:
+            for name, phase in RESEARCH_PHASES.items():
+                output = phase['output']
+                if output not in windows or output not in previous:
+                    continue
+
+                if dates is not None:
+                    researched = dates.get(output)
+                elif previous.get('search_enabled') or output == 'website_info':
+                    # Saved before section dates were recorded
+                    researched = previous['research_date']
+                else:
+                    researched = None
+
+                if researched and (now - datetime.fromisoformat(researched)).total_seconds() < windows[output] * 86400:
+                    self.data[output] = copy.deepcopy(previous[output])
+                    self.data['section_dates'][output] = researched
+                    self.phase_status[name] = 'completed'
+            self._recrawl_for_site_scans()
+
+        return self.pending_phases()
+
+    def _recrawl_for_site_scans(self):
+        """
+        Mark research_website to run again when a phase that scans its crawled
+        pages still has to run but the pages are not in memory (caller holds
+        _data_lock); the re-crawl is mostly served from the website cache
+        """
+        scans_pending = any(
+            self.phase_status.get(name) != 'completed'
+            for name, phase in RESEARCH_PHASES.items() if 'research_website' in phase['depends_on']
+        )
+        if scans_pending and not self.site_pages and self.phase_status.get('research_website') == 'completed':
+            del self.phase_status['research_website']
+
+    def _run_phase(self, name: str):
+        """Run one research phase, emitting start/end progress events"""
+        output = RESEARCH_PHASES[name]['output']
+        started = time.monotonic()
+        self._emit('phase_start', phase=name)
+
+        try:
+            getattr(self, name)()
+        except Exception as e:
+            duration = time.monotonic() - started
+            PHASE_SECONDS.observe(duration, phase=name, status='failed')
+            self._emit('phase_end', phase=name, status='failed', error=str(e), duration=duration)
+            raise
+
+        with self._data_lock:
+            if output in self._abandoned_outputs:
+                return
+            result = self.data.get(output)
+            # Sections skipped for lack of web search don't count as researched
+            if (self.web_searcher and self.web_searcher.api_key) or name == 'research_website':
+                self.data['section_dates'][output] = datetime.now().isoformat(timespec='seconds')
+        duration = time.monotonic() - started
+        PHASE_SECONDS.observe(duration, phase=name, status='completed')
+        self._emit('phase_end', phase=name, status='completed', output=output, result=result,
+                   duration=duration)
+
+    def _emit(self, event_type: str, **fields):
+        """Send a progress event if a progress bus is attached"""
+        if self.progress:
+            self.progress.emit(event_type, domain=self.domain, **fields)
 
     def _extract_company_name(self, domain):
         """Extract company name from domain"""
@@ -574,82 +1179,68 @@ class CompanyResearcher:
     def research_website(self):
         """Scrape basic information from company website"""
         print(f"🔍 Researching {self.domain}...")
+        website_info = {}
 
         try:
-            url = f"https://{self.domain}"
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Extract meta description
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            if meta_desc:
-                self.data['website_info']['description'] = meta_desc.get('content', '')
-
-            # Extract title
-            title = soup.find('title')
-            if title:
-                self.data['website_info']['title'] = title.text.strip()
-
-            # Look for common about/description text
-            about_keywords = ['about', 'what we do', 'who we are']
-            for keyword in about_keywords:
-                about_section = soup.find(lambda tag: tag.name in ['p', 'div'] and
-                                        keyword in tag.text.lower())
-                if about_section:
-                    self.data['website_info']['about'] = about_section.text.strip()[:500]
-                    break
+            session = self.web_searcher.session if self.web_searcher else get_shared_session()
+            crawler = SiteCrawler(session)
+            if crawler.max_pages > 1:
+                crawl = crawler.crawl(self.domain)
+                website_info = crawl['homepage']
+                self.site_pages = crawl['pages']
+                print(f"✓ Crawled {len(crawl['pages'])} page(s) ({crawl['bytes'] // 1024} KB)")
+            else:
+                website_info = scrape_homepage(self.domain, session)
 
             print(f"✓ Website scraped successfully")
 
         except Exception as e:
             print(f"⚠ Error scraping website: {str(e)}")
-            self.data['website_info']['error'] = str(e)
+            website_info['error'] = str(e)
+
+        self._store('website_info', website_info)
 
     def research_tech_stack(self):
         """Research company's tech stack"""
         print(f"🔍 Researching tech stack for {self.company_name}...")
 
         if not self.web_searcher or not self.web_searcher.api_key:
-            self.data['tech_stack'] = []
+            self._store('tech_stack', [])
             print(f"⚠ Skipping tech stack research - web search not configured")
             return
 
         try:
-            tech_stack = self.web_searcher.search_tech_stack(self.company_name, self.domain)
-            self.data['tech_stack'] = tech_stack
+            tech_stack = self.web_searcher.search_tech_stack(self.company_name, self.domain, self.site_pages)
+            self._store('tech_stack', tech_stack)
             print(f"✓ Found {len(tech_stack)} technologies")
         except Exception as e:
             print(f"⚠ Error researching tech stack: {str(e)}")
-            self.data['tech_stack'] = []
+            self._store('tech_stack', [])
 
     def research_security_tools(self):
         """Research company's security tools"""
         print(f"🔍 Researching security tools for {self.company_name}...")
 
         if not self.web_searcher or not self.web_searcher.api_key:
-            self.data['security_tools'] = []
+            self._store('security_tools', [])
             print(f"⚠ Skipping security tools research - web search not configured")
             return
 
         try:
-            security_tools = self.web_searcher.search_security_tools(self.company_name, self.domain)
-            self.data['security_tools'] = security_tools
+            security_tools = self.web_searcher.search_security_tools(self.company_name, self.domain,
+                                                                     self.site_pages)
+            self._store('security_tools', security_tools)
             print(f"✓ Found {len(security_tools)} security tools/practices")
         except Exception as e:
             print(f"⚠ Error researching security tools: {str(e)}")
-            self.data['security_tools'] = []
+            self._store('security_tools', [])
 
     def research_security_vendors(self):
         """Research connections with known security vendors"""
         print(f"🔍 Checking security vendor connections for {self.company_name}...")
 
         if not self.web_searcher or not self.web_searcher.api_key:
-            self.data['security_vendors'] = []
+            self._store('security_vendors', [])
             print(f"⚠ Skipping vendor research - web search not configured")
             return
 
@@ -657,24 +1248,24 @@ class CompanyResearcher:
             vendor_connections = self.web_searcher.search_security_vendor_connections(
                 self.company_name, self.domain
             )
-            self.data['security_vendors'] = vendor_connections
+            self._store('security_vendors', vendor_connections)
             print(f"✓ Found {len(vendor_connections)} vendor connections")
         except Exception as e:
             print(f"⚠ Error researching security vendors: {str(e)}")
-            self.data['security_vendors'] = []
+            self._store('security_vendors', [])
 
     def get_company_info(self):
         """Get general company information"""
         print(f"🔍 Gathering company information for {self.company_name}...")
 
         if not self.web_searcher or not self.web_searcher.api_key:
-            self.data['company_info'] = {}
+            self._store('company_info', {})
             print(f"⚠ Skipping company info research - web search not configured")
             return
 
         try:
             company_info = self.web_searcher.search_company_info(self.company_name, self.domain)
-            self.data['company_info'] = company_info
+            self._store('company_info', company_info)
 
             # Print what was found
             found = []
@@ -690,14 +1281,14 @@ class CompanyResearcher:
             print(f"✓ Found: {', '.join(found) if found else 'limited info'}")
         except Exception as e:
             print(f"⚠ Error gathering company info: {str(e)}")
-            self.data['company_info'] = {}
+            self._store('company_info', {})
 
     def research_security_leadership(self):
         """Research security leadership roles"""
         print(f"🔍 Researching security leadership for {self.company_name}...")
 
         if not self.web_searcher or not self.web_searcher.api_key:
-            self.data['security_leadership'] = []
+            self._store('security_leadership', [])
             print(f"⚠ Skipping security leadership research - web search not configured")
             return
 
@@ -719,18 +1310,18 @@ class CompanyResearcher:
                 "Security Leadership"
             )
 
-            self.data['security_leadership'] = stakeholders
+            self._store('security_leadership', stakeholders)
             print(f"✓ Found {len(stakeholders)} security leader(s)")
         except Exception as e:
             print(f"⚠ Error researching security leadership: {str(e)}")
-            self.data['security_leadership'] = []
+            self._store('security_leadership', [])
 
     def research_executive_leadership(self):
         """Research executive leadership roles"""
         print(f"🔍 Researching executive leadership for {self.company_name}...")
 
         if not self.web_searcher or not self.web_searcher.api_key:
-            self.data['executive_leadership'] = []
+            self._store('executive_leadership', [])
             print(f"⚠ Skipping executive leadership research - web search not configured")
             return
 
@@ -756,11 +1347,11 @@ class CompanyResearcher:
                 "Executive Leadership"
             )
 
-            self.data['executive_leadership'] = stakeholders
+            self._store('executive_leadership', stakeholders)
             print(f"✓ Found {len(stakeholders)} executive(s)")
         except Exception as e:
             print(f"⚠ Error researching executive leadership: {str(e)}")
-            self.data['executive_leadership'] = []
+            self._store('executive_leadership', [])
 
     def enrich_contact_leads(self):
         """Search LinkedIn for each contact lead to retrieve profile information"""
@@ -771,12 +1362,13 @@ class CompanyResearcher:
 
         if not self.web_searcher or not self.web_searcher.api_key:
             print(f"⚠ Skipping contact enrichment - web search not configured")
-            for contact in self.data['contact_leads']:
-                contact['search_performed'] = False
+            contacts = [dict(contact, search_performed=False) for contact in self.data['contact_leads']]
+            self._store('contact_leads', contacts)
             return
 
+        contacts = [dict(contact) for contact in self.data['contact_leads']]
         enriched_count = 0
-        for contact in self.data['contact_leads']:
+        for contact in contacts:
             try:
                 # Search for LinkedIn profile
                 linkedin_data = self.web_searcher.search_contact_linkedin(
@@ -800,17 +1392,97 @@ class CompanyResearcher:
                 print(f"⚠ Error enriching contact {contact['name']}: {str(e)}")
                 contact['search_performed'] = False
 
-        print(f"✓ Enriched {enriched_count} of {len(self.data['contact_leads'])} contact(s)")
+        self._store('contact_leads', contacts)
+        print(f"✓ Enriched {enriched_count} of {len(contacts)} contact(s)")
+
+
+def diff_research(old: Dict, new: Dict) -> Dict[str, Dict]:
+    """
+    Compare two research results for the same company
+
+    Returns:
+        Section -> changes, for sections that changed only. List sections
+        and company news give 'added'/'removed' item names; other sections
+        give {'changed': True}.
+    """
+    def names(items, key):
+        return {item[key] if isinstance(item, dict) else item for item in items or []}
+
+    changes = {}
+    for section, key in SECTION_ITEM_KEYS.items():
+        before, after = names(old.get(section), key), names(new.get(section), key)
+        if before != after:
+            changes[section] = {'added': sorted(after - before), 'removed': sorted(before - after)}
+
+    old_news = {item['url']: item['title'] for item in (old.get('company_info') or {}).get('news', [])}
+    new_news = {item['url']: item['title'] for item in (new.get('company_info') or {}).get('news', [])}
+    if old_news.keys() != new_news.keys():
+        changes['news'] = {
+            'added': [title for url, title in new_news.items() if url not in old_news],
+            'removed': [title for url, title in old_news.items() if url not in new_news],
+        }
+
+    for section in ('website_info', 'company_info'):
+        before = {k: v for k, v in (old.get(section) or {}).items() if k != 'news'}
+        after = {k: v for k, v in (new.get(section) or {}).items() if k != 'news'}
+        if before != after:
+            changes[section] = {'changed': True}
+
+    return changes
 
 
 class MarkdownGenerator:
-    """Generate markdown documents from research data"""
+    """
+    Generate markdown documents from research data
+
+    The document is built from independent sections (see SECTIONS), so a
+    section can be rendered, streamed or regenerated on its own.
+    """
+
+    # Sections in document order, with the research data keys each one reads
+    SECTIONS = [
+        ('header', ['contact_leads']),
+        ('overview', ['website_info']),
+        ('company_info', ['company_info']),
+        ('contacts', ['contact_leads']),
+        ('security_leadership', ['security_leadership']),
+        ('executive_leadership', ['executive_leadership']),
+        ('tech_stack', ['tech_stack']),
+        ('security_tools', ['security_tools']),
+        ('security_vendors', ['security_vendors']),
+        ('footer', []),
+    ]
 
     @staticmethod
     def generate(data, output_path):
         """Generate a formatted markdown document"""
         print(f"📝 Generating markdown document...")
 
+        # Sections are written as they are rendered; the whole document is
+        # never held in memory
+        with open(output_path, 'w', encoding='utf-8') as f:
+            MarkdownGenerator.write(data, f)
+
+        print(f"✓ Document generated: {output_path}")
+
+    @staticmethod
+    def write(data, stream):
+        """Render every section to a file-like stream"""
+        for name, _ in MarkdownGenerator.SECTIONS:
+            stream.write(MarkdownGenerator.render_section(name, data))
+
+    @staticmethod
+    def render(data) -> str:
+        """Render the whole document to a string"""
+        return ''.join(MarkdownGenerator.render_section(name, data) for name, _ in MarkdownGenerator.SECTIONS)
+
+    @staticmethod
+    def render_section(name, data) -> str:
+        """Render a single section by name"""
+        return getattr(MarkdownGenerator, f'_render_{name}')(data)
+
+    @staticmethod
+    def _render_header(data) -> str:
         md_content = []
 
         # Title
@@ -828,10 +1500,16 @@ class MarkdownGenerator:
         md_content.append("4. Security Leadership\n")
         md_content.append("5. Executive Leadership\n")
         md_content.append("6. Technology Stack\n")
-        md_content.append("7. Security Vendor Connections\n")
+        md_content.append("7. Security Tools & Practices\n")
+        md_content.append("8. Security Vendor Connections\n")
         md_content.append("\n---\n")
 
-        # Company Overview
+        return ''.join(md_content)
+
+    @staticmethod
+    def _render_overview(data) -> str:
+        md_content = []
+
         md_content.append("\n## 🏢 Company Overview\n\n")
         if data['website_info']:
             if 'title' in data['website_info']:
@@ -843,7 +1521,12 @@ class MarkdownGenerator:
             if 'error' in data['website_info']:
                 md_content.append(f"> ⚠️ *Note: Error accessing website - {data['website_info']['error']}*\n\n")
 
-        # Company Information
+        return ''.join(md_content)
+
+    @staticmethod
+    def _render_company_info(data) -> str:
+        md_content = []
+
         md_content.append("---\n\n")
         md_content.append("## 📊 Company Information\n\n")
         if data['company_info']:
@@ -881,7 +1564,12 @@ class MarkdownGenerator:
         else:
             md_content.append("*No additional company information available*\n")
 
-        # Contact Leads
+        return ''.join(md_content)
+
+    @staticmethod
+    def _render_contacts(data) -> str:
+        md_content = []
+
         md_content.append("---\n\n")
         md_content.append("## 👥 Contact Leads\n\n")
         if data.get('contact_leads') and len(data['contact_leads']) > 0:
@@ -907,39 +1595,42 @@ class MarkdownGenerator:
         else:
             md_content.append("> *No contact leads added*\n\n")
 
-        # Security Leadership
-        md_content.append("---\n\n")
-        md_content.append("## 🛡️ Security Leadership\n\n")
-        if data.get('search_enabled') == False:
-            md_content.append("> ⚠️ *Web search not configured - enable search for stakeholder research*\n\n")
-        elif data.get('security_leadership'):
-            if len(data['security_leadership']) > 0:
-                for idx, person in enumerate(data['security_leadership'], 1):
-                    md_content.append(f"### {idx}. {person['name']}\n\n")
-                    md_content.append(f"**Title:** {person['title']}  \n")
-                    md_content.append(f"**LinkedIn:** [{person['linkedin_url']}]({person['linkedin_url']})\n\n")
-            else:
-                md_content.append("> *No security leadership information found*\n\n")
-        else:
-            md_content.append("> *No security leadership information found*\n\n")
+        return ''.join(md_content)
+
+    @staticmethod
+    def _render_people(data, key, heading, empty_message) -> str:
+        md_content = []
 
-        # Executive Leadership
         md_content.append("---\n\n")
-        md_content.append("## 👔 Executive Leadership\n\n")
+        md_content.append(f"## {heading}\n\n")
         if data.get('search_enabled') == False:
             md_content.append("> ⚠️ *Web search not configured - enable search for stakeholder research*\n\n")
-        elif data.get('executive_leadership'):
-            if len(data['executive_leadership']) > 0:
-                for idx, person in enumerate(data['executive_leadership'], 1):
-                    md_content.append(f"### {idx}. {person['name']}\n\n")
-                    md_content.append(f"**Title:** {person['title']}  \n")
-                    md_content.append(f"**LinkedIn:** [{person['linkedin_url']}]({person['linkedin_url']})\n\n")
-            else:
-                md_content.append("> *No executive leadership information found*\n\n")
+        elif data.get(key):
+            for idx, person in enumerate(data[key], 1):
+                md_content.append(f"### {idx}. {person['name']}\n\n")
+                md_content.append(f"**Title:** {person['title']}  \n")
+                md_content.append(f"**LinkedIn:** [{person['linkedin_url']}]({person['linkedin_url']})\n\n")
         else:
-            md_content.append("> *No executive leadership information found*\n\n")
+            md_content.append(f"> *{empty_message}*\n\n")
+
+        return ''.join(md_content)
+
+    @staticmethod
+    def _render_security_leadership(data) -> str:
+        return MarkdownGenerator._render_people(
+            data, 'security_leadership', "🛡️ Security Leadership", "No security leadership information found"
+        )
+
+    @staticmethod
+    def _render_executive_leadership(data) -> str:
+        return MarkdownGenerator._render_people(
+            data, 'executive_leadership', "👔 Executive Leadership", "No executive leadership information found"
+        )
+
+    @staticmethod
+    def _render_tech_stack(data) -> str:
+        md_content = []
 
-        # Tech Stack
         md_content.append("---\n\n")
         md_content.append("## 💻 Technology Stack\n\n")
         if data.get('search_enabled') == False:
@@ -962,7 +1653,33 @@ class MarkdownGenerator:
         else:
             md_content.append("> *No tech stack information found*\n\n")
 
-        # Security Vendor Connections
+        return ''.join(md_content)
+
+    @staticmethod
+    def _render_security_tools(data) -> str:
+        md_content = []
+
+        md_content.append("---\n\n")
+        md_content.append("## 🛡️ Security Tools & Practices\n\n")
+        if data.get('search_enabled') == False:
+            md_content.append("> ⚠️ *Web search not configured - enable search for security tool detection*\n\n")
+        elif data.get('security_tools'):
+            for item in data['security_tools']:
+                md_content.append(f"### {item['tool']}\n\n")
+                md_content.append(f"**Source:** [{item['source']}]({item['source']})  \n")
+                if item.get('context'):
+                    md_content.append(f"**Context:** {item['context']}\n\n")
+                else:
+                    md_content.append("\n")
+        else:
+            md_content.append("> *No security tools or practices found*\n\n")
+
+        return ''.join(md_content)
+
+    @staticmethod
+    def _render_security_vendors(data) -> str:
+        md_content = []
+
         md_content.append("---\n\n")
         md_content.append("## 🔐 Security Vendor Connections\n\n")
         md_content.append("> *Verified connections with known security vendors*\n\n")
@@ -970,30 +1687,109 @@ class MarkdownGenerator:
             md_content.append("> ⚠️ *Web search not configured - enable search for vendor detection*\n\n")
         elif data.get('security_vendors'):
             vendors_found = data['security_vendors']
-            if vendors_found:
-                md_content.append(f"**Found {len(vendors_found)} vendor connection(s)**\n\n")
-                for idx, item in enumerate(vendors_found, 1):
-                    md_content.append(f"### {idx}. {item['vendor']}\n\n")
-                    md_content.append(f"**Source:** [{item['title']}]({item['source']})  \n")
-                    md_content.append(f"**Context:** {item['context']}\n\n")
-            else:
-                md_content.append("> *No vendor connections found*\n\n")
+            md_content.append(f"**Found {len(vendors_found)} vendor connection(s)**\n\n")
+            for idx, item in enumerate(vendors_found, 1):
+                md_content.append(f"### {idx}. {item['vendor']}\n\n")
+                md_content.append(f"**Source:** [{item['title']}]({item['source']})  \n")
+                md_content.append(f"**Context:** {item['context']}\n\n")
         else:
             md_content.append("> *No vendor connections found*\n\n")
 
-        # Footer
-        md_content.append("---\n\n")
-        md_content.append("*Research generated by Demo Prep Tool*\n")
+        return ''.join(md_content)
 
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(''.join(md_content))
+    @staticmethod
+    def _render_footer(data) -> str:
+        return "---\n\n*Research generated by Demo Prep Tool*\n"
 
-        print(f"✓ Document generated: {output_path}")
+
+class MarkdownReport:
+    """
+    A rendered markdown document that can be updated one section at a time
+
+    Sections are rendered once and kept; update() re-renders only the
+    sections that read the given data keys.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.sections = {name: MarkdownGenerator.render_section(name, data)
+                         for name, _ in MarkdownGenerator.SECTIONS}
+
+    def update(self, *data_keys):
+        """Re-render the sections that depend on data_keys"""
+        for name, keys in MarkdownGenerator.SECTIONS:
+            if set(keys) & set(data_keys):
+                self.sections[name] = MarkdownGenerator.render_section(name, self.data)
+
+    def regenerate_section(self, name):
+        """Re-render a single section by name"""
+        self.sections[name] = MarkdownGenerator.render_section(name, self.data)
+
+    def text(self) -> str:
+        return ''.join(self.sections[name] for name, _ in MarkdownGenerator.SECTIONS)
+
+    def write(self, stream):
+        for name, _ in MarkdownGenerator.SECTIONS:
+            stream.write(self.sections[name])
+
+
+class StreamingMarkdownWriter:
+    """
+    Write a report to a stream progressively, as research data arrives
+
+    Sections are flushed in document order as soon as the data keys they
+    read are ready, so a partially written file (or HTTP response) is a
+    valid preview of the finished report.
+    """
+
+    def __init__(self, stream, data, pending_keys=()):
+        """
+        Args:
+            stream: File-like object to write to
+            data: Research data dict (e.g. CompanyResearcher.data), read as sections flush
+            pending_keys: Data keys still being researched; every other key is ready
+        """
+        self.stream = stream
+        self.data = data
+        self.pending_keys = set(pending_keys)
+        self._next_section = 0
+        self._lock = threading.Lock()
+        self.flush()
+
+    def mark_ready(self, *data_keys):
+        """Record that data keys are final, then flush any sections now complete"""
+        with self._lock:
+            self.pending_keys -= set(data_keys)
+        self.flush()
+
+    def handle_event(self, event):
+        """ProgressBus subscriber: a finished phase makes its output key ready"""
+        if event['type'] == 'phase_end':
+            self.mark_ready(RESEARCH_PHASES[event['phase']]['output'])
+
+    def flush(self):
+        """Write every consecutive section whose data is ready"""
+        with self._lock:
+            sections = MarkdownGenerator.SECTIONS
+            while self._next_section < len(sections):
+                name, keys = sections[self._next_section]
+                if self.pending_keys & set(keys):
+                    break
+                self.stream.write(MarkdownGenerator.render_section(name, self.data))
+                self.stream.flush()
+                self._next_section += 1
+
+    def close(self):
+        """Write all remaining sections, whatever their state"""
+        self.mark_ready(*self.pending_keys)
 
 
 def main():
     """Main CLI entry point"""
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        batch_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description='Generate demo prep documents by researching companies',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1001,6 +1797,7 @@ def main():
 Examples:
   python demo_prep.py example.com
   python demo_prep.py example.com -o output.md
+  python demo_prep.py batch accounts.txt --pdf
         """
     )
 
@@ -1034,10 +1831,45 @@ Examples:
         default=False
     )
 
+    parser.add_argument(
+        '--query-budget',
+        help='Maximum Google API queries for this research (cached results are free)',
+        type=int,
+        default=None
+    )
+
+    parser.add_argument(
+        '--incremental',
+        help='Reuse still-fresh sections of the latest stored research and only re-query stale ones',
+        action='store_true',
+        default=False
+    )
+
+    parser.add_argument(
+        '--freshness',
+        help=f"Days a section stays fresh with --incremental, as SECTION=DAYS (repeatable; "
+             f"sections: {', '.join(SECTION_FRESHNESS_DAYS)})",
+        action='append',
+        metavar='SECTION=DAYS',
+        default=None
+    )
+
+    parser.add_argument(
+        '--profile',
+        help='Sample the run with a profiler and write a flamegraph file and hot-function summary '
+             '(also enabled by DEMO_PREP_PROFILE=1)',
+        action='store_true',
+        default=False
+    )
+
     args = parser.parse_args()
+    try:
+        freshness = parse_freshness(args.freshness)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
 
     # Clean up domain input
-    domain = args.domain.replace('https://', '').replace('http://', '').strip('/')
+    domain = clean_domain(args.domain)
 
     # Set output path
     company_name = domain.replace('www.', '').split('.')[0]
@@ -1051,8 +1883,14 @@ Examples:
     print("=" * 60)
     print()
 
+    with profile_run(domain, enabled=args.profile or None):
+        research_company(args, domain, output_path, freshness)
+
+
+def research_company(args, domain: str, output_path: str, freshness: Dict[str, float]):
+    """Research one company from the CLI and write its report to output_path"""
     # Initialize web searcher
-    web_searcher = WebSearcher()
+    web_searcher = create_web_searcher()
     if web_searcher.api_key:
         print("✓ Web search enabled")
     else:
@@ -1061,16 +1899,21 @@ Examples:
     print()
 
     # Research company
+    progress = ProgressBus()
     researcher = CompanyResearcher(
         domain,
         web_searcher=web_searcher,
         company_name_override=args.company_name,
-        company_context=args.company_context
+        company_context=args.company_context,
+        progress=progress,
+        query_budget=args.query_budget
     )
+    queries_before = web_searcher.quota.spent_today()
+    previous = load_previous_research(researcher, freshness) if args.incremental else None
 
     # Initial research
-    researcher.research_website()
-    researcher.get_company_info()
+    researcher.run_all([phase for phase in ('research_website', 'get_company_info')
+                        if phase in researcher.pending_phases()])
 
     # Verify company (unless skipped)
     if not args.skip_verification:
@@ -1080,21 +1923,344 @@ Examples:
             print("=" * 60)
             sys.exit(0)
 
-    # Deep research
+    # Deep research, writing each report section as soon as its data is ready
     print()
-    researcher.research_tech_stack()
-    researcher.research_security_vendors()
-    researcher.research_security_leadership()
-    researcher.research_executive_leadership()
+    deep_phases = [phase for phase in (
+        'research_tech_stack',
+        'research_security_tools',
+        'research_security_vendors',
+        'research_security_leadership',
+        'research_executive_leadership',
+    ) if phase in researcher.pending_phases()]
+    with open(output_path, 'w', encoding='utf-8') as f:
+        writer = StreamingMarkdownWriter(
+            f, researcher.data, [RESEARCH_PHASES[phase]['output'] for phase in deep_phases]
+        )
+        progress.subscribe(writer.handle_event)
+        researcher.run_all(deep_phases)
+        writer.close()
+
+    get_default_research_store().save(researcher.data)
 
     print()
     print("=" * 60)
+    print(f"✓ Document generated: {output_path}")
+    print("=" * 60)
+    print(f"✓ Complete! Open {output_path} to view the demo prep document.")
+    if previous:
+        print_research_diff(diff_research(previous, researcher.data))
+    print_quota_summary(web_searcher, queries_before)
+    print_metrics_summary()
+    print("=" * 60)
+
+
+def load_previous_research(researcher: CompanyResearcher, freshness: Optional[Dict[str, float]] = None) -> Optional[Dict]:
+    """
+    Load the latest stored research for the researcher's domain and reuse its fresh sections
+
+    Returns:
+        The previous research data, or None if the domain was never researched
+    """
+    previous = get_default_research_store().latest_for_domain(researcher.domain)
+    if previous is None:
+        print(f"ℹ No previous research for {researcher.domain} - running full research")
+        return None
+
+    stale = researcher.load_previous(previous, freshness)
+    reused = [RESEARCH_PHASES[name]['output'] for name in RESEARCH_PHASES if name not in stale]
+    print(f"♻ Reusing research from {previous['research_date']}: {', '.join(reused) or 'nothing fresh'}")
+    return previous
+
+
+def print_quota_summary(web_searcher: WebSearcher, queries_before: int):
+    """Print API queries spent by this run and today overall"""
+    spent_today = web_searcher.quota.spent_today()
+    line = f"📊 API queries: {spent_today - queries_before} this run, {spent_today} today"
+    if web_searcher.quota.daily_limit is not None:
+        line += f" (daily limit {web_searcher.quota.daily_limit})"
+    print(line)
+
+
+def print_metrics_summary():
+    """Print where this run's time went: phase durations, search latency by category, errors and cache hit rates"""
+    print("⏱  Timing:")
+    print(format_summary())
+
+
+def print_research_diff(changes: Dict[str, Dict]):
+    """Print what changed since the previous research (from diff_research)"""
+    if not changes:
+        print("♻ No changes since the previous research")
+        return
+
+    print("♻ Changes since the previous research:")
+    for section, change in changes.items():
+        label = section.replace('_', ' ').title()
+        if change.get('changed'):
+            print(f"  ~ {label} updated")
+            continue
+        for name in change['added']:
+            print(f"  + {label}: {name}")
+        for name in change['removed']:
+            print(f"  - {label}: {name}")
+
+
+def parse_freshness(values: Optional[List[str]]) -> Dict[str, float]:
+    """Parse --freshness SECTION=DAYS arguments"""
+    freshness = {}
+    for value in values or []:
+        section, _, days = value.partition('=')
+        if section not in SECTION_FRESHNESS_DAYS or not days:
+            raise argparse.ArgumentTypeError(
+                f"--freshness expects SECTION=DAYS with SECTION one of: {', '.join(SECTION_FRESHNESS_DAYS)}"
+            )
+        freshness[section] = float(days)
+    return freshness
+
+
+def clean_domain(domain: str) -> str:
+    """Strip scheme and trailing slashes from a domain argument"""
+    return domain.strip().replace('https://', '').replace('http://', '').strip('/')
+
+
+def read_batch_accounts(source) -> List[Dict]:
+    """
+    Read accounts for batch research, one per line: domain[,company name]
+
+    Blank lines and lines starting with # are ignored; duplicate domains are
+    researched once.
+    """
+    accounts = []
+    seen = set()
+    for line in source:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        domain, _, company_name = line.partition(',')
+        domain = clean_domain(domain)
+        if domain and domain not in seen:
+            seen.add(domain)
+            accounts.append({'domain': domain, 'company_name': company_name.strip() or None})
+    return accounts
+
+
+def research_account(account: Dict, web_searcher: WebSearcher, output_dir: str,
+                     make_pdf: bool = False, query_budget: Optional[int] = None,
+                     incremental: bool = False, freshness: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Research one batch account and write its report files
+
+    With incremental, still-fresh sections of the account's latest stored
+    research are reused and only stale sections are re-queried.
+
+    Returns:
+        Summary dict (counts and file names) - the full research data is not
+        kept, so large batches don't hold every report in memory
+    """
+    domain = account['domain']
+    summary = {'domain': domain, 'company_name': account['company_name'] or domain, 'files': []}
+
+    try:
+        progress = ProgressBus()
+        researcher = CompanyResearcher(
+            domain,
+            web_searcher=web_searcher,
+            company_name_override=account['company_name'],
+            progress=progress,
+            query_budget=query_budget
+        )
+        previous = load_previous_research(researcher, freshness) if incremental else None
+        phases = researcher.pending_phases()
+
+        # Sections are written as phases finish, not after the whole run
+        slug = domain.replace('www.', '').split('.')[0]
+        md_path = os.path.join(output_dir, f"{slug}_demo_prep.md")
+        with open(md_path, 'w', encoding='utf-8') as f:
+            writer = StreamingMarkdownWriter(
+                f, researcher.data, [RESEARCH_PHASES[name]['output'] for name in phases]
+            )
+            progress.subscribe(writer.handle_event)
+            statuses = researcher.run_all(phases)
+            writer.close()
+        summary['files'].append(os.path.basename(md_path))
+        get_default_research_store().save(researcher.data)
+
+        if make_pdf:
+            # Rendered from the in-memory data in a worker process
+            pdf_path = os.path.join(output_dir, f"{slug}_demo_prep.pdf")
+            get_default_pdf_renderer().render(MarkdownGenerator.render(researcher.data), pdf_path)
+            summary['files'].append(os.path.basename(pdf_path))
+
+        incomplete = [name for name, status in statuses.items() if status != 'completed']
+        summary.update({
+            'company_name': researcher.company_name,
+            'status': 'partial' if incomplete else 'ok',
+            'vendors': len(researcher.data['security_vendors']),
+            'technologies': len(researcher.data['tech_stack']),
+            'security_leaders': len(researcher.data['security_leadership']),
+            'executives': len(researcher.data['executive_leadership']),
+        })
+        if previous:
+            summary['changes'] = sum(
+                len(change.get('added', [])) + len(change.get('removed', [])) + bool(change.get('changed'))
+                for change in diff_research(previous, researcher.data).values()
+            )
+    except Exception as e:
+        print(f"⚠ Error researching {domain}: {str(e)}")
+        summary.update({'status': 'failed', 'error': str(e)})
+
+    return summary
+
+
+def write_batch_summary(summaries: List[Dict], output_path: str):
+    """Write a markdown table summarizing a batch run"""
+    lines = [
+        "# 📋 Batch Research Summary\n\n",
+        f"**Research Date:** {datetime.now().strftime('%Y-%m-%d')}  \n",
+        f"**Accounts:** {len(summaries)}\n\n",
+        "| Company | Domain | Status | Vendors | Technologies | Security Leaders | Executives | Changes | Files |\n",
+        "|---------|--------|--------|---------|--------------|------------------|------------|---------|-------|\n",
+    ]
+    for item in summaries:
+        files = ', '.join(f"[{name}]({name})" for name in item['files'])
+        lines.append(
+            f"| {item['company_name']} | `{item['domain']}` | {item['status']} | "
+            f"{item.get('vendors', '-')} | {item.get('technologies', '-')} | "
+            f"{item.get('security_leaders', '-')} | {item.get('executives', '-')} | "
+            f"{item.get('changes', '-')} | {files} |\n"
+        )
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(''.join(lines))
+
+
+def batch_main(argv: List[str]):
+    """Batch CLI entry point: research many companies concurrently in one process"""
+    parser = argparse.ArgumentParser(
+        prog='demo_prep.py batch',
+        description='Research many companies concurrently',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Input is one account per line: domain[,company name]
+
+Examples:
+  python demo_prep.py batch accounts.txt
+  cat accounts.txt | python demo_prep.py batch - --pdf -o reports/
+        """
+    )
+
+    parser.add_argument(
+        'input',
+        help='File with one domain per line, or - to read from stdin'
+    )
+
+    parser.add_argument(
+        '-o', '--output-dir',
+        help='Directory for reports and the summary (default: batch_outputs)',
+        default='batch_outputs'
+    )
+
+    parser.add_argument(
+        '--workers',
+        help='Companies researched at once (default: 4)',
+        type=int,
+        default=4
+    )
+
+    parser.add_argument(
+        '--pdf',
+        help='Also generate a PDF for each company (requires reportlab)',
+        action='store_true',
+        default=False
+    )
+
+    parser.add_argument(
+        '--query-budget',
+        help='Maximum Google API queries per company (cached results are free)',
+        type=int,
+        default=None
+    )
+
+    parser.add_argument(
+        '--incremental',
+        help='Reuse still-fresh sections of the latest stored research and only re-query stale ones',
+        action='store_true',
+        default=False
+    )
+
+    parser.add_argument(
+        '--freshness',
+        help=f"Days a section stays fresh with --incremental, as SECTION=DAYS (repeatable; "
+             f"sections: {', '.join(SECTION_FRESHNESS_DAYS)})",
+        action='append',
+        metavar='SECTION=DAYS',
+        default=None
+    )
 
-    # Generate markdown document
-    MarkdownGenerator.generate(researcher.data, output_path)
+    parser.add_argument(
+        '--profile',
+        help='Sample the whole batch with a profiler and write a flamegraph file and hot-function summary '
+             '(also enabled by DEMO_PREP_PROFILE=1)',
+        action='store_true',
+        default=False
+    )
+
+    args = parser.parse_args(argv)
+    try:
+        freshness = parse_freshness(args.freshness)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    if args.input == '-':
+        accounts = read_batch_accounts(sys.stdin)
+    else:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            accounts = read_batch_accounts(f)
+
+    if not accounts:
+        print("✗ No domains to research")
+        sys.exit(1)
+
+    os.makedirs(args.output_dir, exist_ok=True)
 
     print("=" * 60)
-    print(f"✓ Complete! Open {output_path} to view the demo prep document.")
+    print("Demo Prep Tool - Batch Research")
+    print("=" * 60)
+    print(f"Accounts: {len(accounts)}")
+    print(f"Output: {args.output_dir}")
+    print("=" * 60)
+    print()
+
+    # One searcher for the whole batch: shared session, cache and quota
+    web_searcher = create_web_searcher()
+    if not web_searcher.api_key:
+        print("⚠ Web search disabled - set GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID")
+        print()
+    queries_before = web_searcher.quota.spent_today()
+
+    started = time.monotonic()
+    with profile_run('batch', enabled=args.profile or None), \
+            ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        summaries = list(executor.map(
+            lambda account: research_account(account, web_searcher, args.output_dir,
+                                             args.pdf, args.query_budget,
+                                             args.incremental, freshness),
+            accounts
+        ))
+
+    summary_path = os.path.join(args.output_dir, 'batch_summary.md')
+    write_batch_summary(summaries, summary_path)
+
+    failed = [item for item in summaries if item['status'] == 'failed']
+    print()
+    print("=" * 60)
+    print(f"✓ Researched {len(summaries) - len(failed)} of {len(summaries)} companies "
+          f"in {time.monotonic() - started:.0f}s")
+    for item in failed:
+        print(f"  ✗ {item['domain']}: {item['error']}")
+    print(f"📋 Summary: {summary_path}")
+    print_quota_summary(web_searcher, queries_before)
+    print_metrics_summary()
     print("=" * 60)
 
 
@@ -0,0 +1,206 @@
+"""
+Technology and security tool term dictionaries with a precompiled matcher
+Each matcher scans a snippet once and returns canonical, deduplicated terms
+"""
+
+import re
+from typing import Dict, Iterable, List, Tuple, Union
+
+# Technologies to look for (expanded for job postings)
+TECHNOLOGY_CATEGORIES = {
+    'Programming languages': [
+        "Python", "Java", "JavaScript", "TypeScript", "Go", "Golang", "Rust", "Ruby", "PHP",
+        "C++", "C#", ".NET", "Swift", "Kotlin", "Scala", "Perl", "Objective-C", "Visual Basic", "VB.NET",
+    ],
+    'Web frameworks': [
+        "React", "Angular", "Vue.js", "Vue", "Django", "Flask", "FastAPI", "Rails", "Ruby on Rails",
+        "Spring Boot", "Spring", "Express", "Next.js", "Node.js", "ASP.NET", "Laravel",
+    ],
+    'Mobile': [
+        "React Native", "Flutter", "Xamarin", "Ionic", "SwiftUI",
+    ],
+    'Databases': [
+        "PostgreSQL", "Postgres", "MySQL", "SQL Server", "MSSQL", "MongoDB", "Redis", "Elasticsearch",
+        "DynamoDB", "Cassandra", "Oracle", "DB2", "MariaDB", "SQLite", "Couchbase", "Neo4j",
+    ],
+    'Specialized databases': [
+        "InterSystems Cache", "Caché", "MUMPS", "M technology",
+    ],
+    'Cloud/Infrastructure': [
+        "AWS", "Amazon Web Services", "Azure", "Microsoft Azure", "Google Cloud", "GCP", "Kubernetes",
+        "K8s", "Docker", "Terraform", "Ansible", "Chef", "Puppet", "CloudFormation",
+    ],
+    'CI/CD & DevOps': [
+        "Jenkins", "GitLab CI", "GitHub Actions", "CircleCI", "Travis CI", "TeamCity", "Bamboo", "Bitbucket",
+    ],
+    'Message queues & streaming': [
+        "Kafka", "RabbitMQ", "ActiveMQ", "Redis Queue", "SQS", "Kinesis", "Apache Flink", "Storm",
+    ],
+    'APIs & Integration': [
+        "GraphQL", "REST API", "SOAP", "gRPC", "Microservices", "FHIR", "HL7",
+    ],
+    'Frontend tools': [
+        "Webpack", "Vite", "Babel", "jQuery", "Bootstrap", "Tailwind CSS", "Material UI", "Redux", "MobX",
+    ],
+    'Testing': [
+        "Jest", "Mocha", "Pytest", "JUnit", "Selenium", "Cypress", "TestNG", "Cucumber",
+    ],
+    'Version control': [
+        "Git", "GitHub", "GitLab", "SVN", "Subversion", "Mercurial",
+    ],
+    'Other tools': [
+        "Linux", "Unix", "Windows Server", "Apache", "Nginx", "Tomcat", "IIS", "Maven", "Gradle", "npm", "pip",
+    ],
+}
+
+# Security tools, standards and practices to look for
+SECURITY_CATEGORIES = {
+    'SIEM/Monitoring platforms': [
+        "Splunk", "Splunk Enterprise", "Datadog", "New Relic", "Sumo Logic", "ELK Stack", "Elastic",
+        "Elasticsearch", "LogRhythm", "QRadar", "IBM QRadar", "ArcSight", "HP ArcSight",
+    ],
+    'Identity & Access Management (PAM)': [
+        "CyberArk", "Okta", "Auth0", "Azure AD", "Active Directory", "Ping Identity", "OneLogin",
+        "Duo Security", "Duo", "ForgeRock", "BeyondTrust", "Thycotic", "Centrify",
+    ],
+    'Endpoint Security (EDR/EPP)': [
+        "CrowdStrike", "CrowdStrike Falcon", "Carbon Black", "VMware Carbon Black", "SentinelOne",
+        "Cylance", "Symantec", "Symantec Endpoint", "McAfee", "Trend Micro", "Sophos", "Microsoft Defender",
+    ],
+    'Network Security': [
+        "Palo Alto", "Palo Alto Networks", "Fortinet", "FortiGate", "Cisco ASA", "Cisco Firepower",
+        "Check Point", "F5 Networks", "F5", "Barracuda", "Zscaler", "Cisco Umbrella",
+    ],
+    'Cloud Security': [
+        "Cloudflare", "Akamai", "AWS GuardDuty", "AWS Security Hub", "Azure Security Center",
+        "Azure Sentinel", "Google Cloud Security", "Prisma Cloud", "Wiz", "Lacework",
+    ],
+    'Application Security (SAST/DAST)': [
+        "Snyk", "Veracode", "Checkmarx", "SonarQube", "WhiteSource", "Mend", "Black Duck", "Fortify",
+        "HP Fortify", "Qualys", "Aqua Security", "Twistlock",
+    ],
+    'Vulnerability Management': [
+        "Nessus", "Tenable Nessus", "Rapid7", "InsightVM", "Tenable.io", "OpenVAS", "Nexpose", "Qualys VMDR",
+    ],
+    'Email Security': [
+        "Proofpoint", "Mimecast", "Barracuda Email Security", "Microsoft Defender for Office",
+        "Cisco Email Security",
+    ],
+    'Threat Intelligence': [
+        "Recorded Future", "ThreatConnect", "Anomali", "CrowdStrike Threat Intelligence", "Mandiant", "FireEye",
+    ],
+    'CASB (Cloud Access Security Broker)': [
+        "Netskope", "McAfee MVISION", "Symantec CloudSOC", "Microsoft Cloud App Security",
+    ],
+    'Security Automation (SOAR)': [
+        "Palo Alto Cortex XSOAR", "Splunk SOAR", "Phantom", "IBM Resilient", "Swimlane", "Demisto",
+    ],
+    'Compliance Standards': [
+        "SOC 2", "SOC2", "SOC2 Type II", "ISO 27001", "ISO27001", "HIPAA", "HITECH", "GDPR", "PCI DSS",
+        "PCI-DSS", "FedRAMP", "NIST", "CCPA",
+    ],
+    'Security Practices': [
+        "WAF", "Web Application Firewall", "Firewall", "IDS", "IPS", "SIEM", "VPN", "MFA", "Multi-Factor",
+        "SSO", "Single Sign-On", "Zero Trust", "Penetration Testing", "Pen Test", "Red Team", "Blue Team",
+    ],
+    'Encryption & PKI': [
+        "TLS", "SSL", "AES", "RSA", "PKI", "Certificate Authority", "HSM", "Hardware Security Module",
+    ],
+    'Security Frameworks': [
+        "OWASP", "CIS Controls", "NIST CSF", "MITRE ATT&CK",
+    ],
+    'DLP & Data Security': [
+        "DLP", "Data Loss Prevention", "Varonis", "Digital Guardian", "Forcepoint DLP",
+    ],
+    'Incident Response': [
+        "PagerDuty", "ServiceNow Security Operations", "Jira Service Management",
+    ],
+}
+
+
+class TermMatcher:
+    """
+    Case-insensitive whole-term matcher compiled once from a term dictionary
+
+    The terms are folded into a single prefix-trie regex, so each snippet is
+    scanned in one pass and the longest term wins wherever terms overlap
+    (e.g. "Splunk Enterprise" rather than "Splunk").
+    """
+
+    def __init__(self, terms: Union[Iterable[str], Dict[str, str]]):
+        """
+        Args:
+            terms: Terms to match, or a dict of term -> canonical name
+        """
+        if not isinstance(terms, dict):
+            terms = {term: term for term in terms}
+
+        # Lowercased term -> canonical spelling (first definition wins)
+        self.canonical = {}
+        for term, canonical_name in terms.items():
+            self.canonical.setdefault(term.lower(), canonical_name)
+
+        trie = {}
+        for term in self.canonical:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        self.pattern = re.compile(r'(?<!\w)' + self._trie_regex(trie) + r'(?!\w)', re.IGNORECASE)
+
+    @classmethod
+    def _trie_regex(cls, node: Dict) -> str:
+        """Build a regex matching every term in a trie, preferring longer terms"""
+        is_end = '' in node
+        branches = [re.escape(char) + cls._trie_regex(child)
+                    for char, child in sorted(node.items()) if char != '']
+
+        if not branches:
+            return ''
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+
+        group = '(?:' + '|'.join(branches) + ')'
+        return group + '?' if is_end else group
+
+    def find_all(self, text: str) -> List[str]:
+        """Return canonical names of matched terms in order of first appearance"""
+        found = []
+        seen = set()
+        for match in self.pattern.finditer(text):
+            name = self.canonical[match.group(0).lower()]
+            if name not in seen:
+                seen.add(name)
+                found.append(name)
+        return found
+
+    def find_with_context(self, text: str, width: int = 200) -> List[Tuple[str, str]]:
+        """Like find_all, paired with about width characters of text around each term's first appearance"""
+        found = []
+        seen = set()
+        for match in self.pattern.finditer(text):
+            name = self.canonical[match.group(0).lower()]
+            if name not in seen:
+                seen.add(name)
+                start = max(0, match.start() - width // 2)
+                found.append((name, text[start:start + width].strip()))
+        return found
+
+
+def _flatten(categories: Dict[str, List[str]]) -> List[str]:
+    return [term for terms in categories.values() for term in terms]
+
+
+TECHNOLOGY_MATCHER = TermMatcher(_flatten(TECHNOLOGY_CATEGORIES))
+SECURITY_TOOL_MATCHER = TermMatcher(_flatten(SECURITY_CATEGORIES))
+
+
+def extract_technologies(text: str) -> List[str]:
+    """Extract technology names from text"""
+    return TECHNOLOGY_MATCHER.find_all(text)
+
+
+def extract_security_tools(text: str) -> List[str]:
+    """Extract security tool names from text"""
+    return SECURITY_TOOL_MATCHER.find_all(text)
@@ -0,0 +1,212 @@
+"""
+Persistent HTTP cache for company website fetches
+SQLite-backed, zlib-compressed bodies, Cache-Control freshness and
+ETag/Last-Modified revalidation
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+
+DEFAULT_HTTP_CACHE_PATH = Path(__file__).parent / '.cache' / 'http_cache.sqlite3'
+
+# Cached pages kept before least-recently-used entries are evicted
+DEFAULT_MAX_ENTRIES = 5000
+
+# Without explicit freshness, a page stays fresh for 10% of the time since it
+# was last modified (RFC 9111 heuristic), capped here
+MAX_HEURISTIC_FRESHNESS = 24 * 60 * 60
+
+
+class FetchedPage(NamedTuple):
+    """A downloaded page (possibly served from the cache)"""
+    url: str  # final URL, after redirects
+    body: bytes
+    content_type: str
+    from_cache: bool = False
+
+    @property
+    def encoding(self) -> Optional[str]:
+        """Charset from the Content-Type header, or None to let the parser sniff <meta charset>"""
+        match = re.search(r'charset=["\']?([\w.:-]+)', self.content_type, re.IGNORECASE)
+        return match.group(1) if match else None
+
+    @property
+    def is_html(self) -> bool:
+        return not self.content_type or 'html' in self.content_type.lower()
+
+
+class CachedResponse(NamedTuple):
+    """A cache hit: the stored page, whether it can be used without asking the server, and how to revalidate it"""
+    page: FetchedPage
+    fresh: bool
+    validators: Dict[str, str]
+
+
+def freshness_lifetime(headers, now: float) -> Optional[float]:
+    """
+    Seconds a response may be served without revalidation
+
+    Returns None if the response must not be stored at all (no-store,
+    Vary: *), or 0 if it must be revalidated every time.
+    """
+    cache_control = headers.get('Cache-Control', '').lower()
+    if 'no-store' in cache_control or headers.get('Vary', '').strip() == '*':
+        return None
+    if 'no-cache' in cache_control:
+        return 0
+
+    match = re.search(r'max-age=(\d+)', cache_control)
+    if match:
+        return int(match.group(1))
+
+    try:
+        if headers.get('Expires'):
+            return max(0.0, parsedate_to_datetime(headers['Expires']).timestamp() - now)
+        if headers.get('Last-Modified'):
+            age = now - parsedate_to_datetime(headers['Last-Modified']).timestamp()
+            return min(MAX_HEURISTIC_FRESHNESS, max(0.0, age / 10))
+    except (TypeError, ValueError):
+        return 0
+    return 0
+
+
+class HttpCache:
+    """
+    Thread-safe persistent cache of fetched pages
+
+    Used by website_scraper.fetch_page(): fresh pages are served without a
+    request, stale pages with validators are revalidated with a conditional
+    GET, so an unchanged page costs a 304 instead of its full body.
+    """
+
+    def __init__(self, path=None, max_entries: Optional[int] = None):
+        """
+        Args:
+            path: SQLite file path (default: HTTP_CACHE_PATH env var or .cache/http_cache.sqlite3)
+            max_entries: Size bound for LRU eviction (default: HTTP_CACHE_MAX_ENTRIES env var or 5000)
+        """
+        self.path = Path(path or os.environ.get('HTTP_CACHE_PATH', DEFAULT_HTTP_CACHE_PATH))
+        self.max_entries = max_entries or int(os.environ.get('HTTP_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES))
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_responses (
+                url TEXT PRIMARY KEY,
+                final_url TEXT NOT NULL,
+                content_type TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_http_responses_last_access ON http_responses (last_access)'
+        )
+        self._conn.commit()
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """The cached response for url, or None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT final_url, content_type, etag, last_modified, body, expires_at '
+                'FROM http_responses WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute('UPDATE http_responses SET last_access = ? WHERE url = ?', (now, url))
+            self._conn.commit()
+
+        final_url, content_type, etag, last_modified, body, expires_at = row
+        validators = {}
+        if etag:
+            validators['If-None-Match'] = etag
+        if last_modified:
+            validators['If-Modified-Since'] = last_modified
+
+        fresh = now < expires_at
+        if fresh:
+            self.hits += 1
+        elif not validators:
+            self.misses += 1
+            return None
+        page = FetchedPage(final_url, zlib.decompress(body), content_type, from_cache=True)
+        return CachedResponse(page, fresh, validators)
+
+    def store(self, url: str, page: FetchedPage, headers):
+        """Cache a 200 response if its headers allow reuse"""
+        now = time.time()
+        lifetime = freshness_lifetime(headers, now)
+        etag, last_modified = headers.get('ETag'), headers.get('Last-Modified')
+        if lifetime is None or (lifetime == 0 and not (etag or last_modified)):
+            return
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO http_responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, page.url, page.content_type, etag, last_modified,
+                 zlib.compress(page.body), now + lifetime, now)
+            )
+            count = self._conn.execute('SELECT COUNT(*) FROM http_responses').fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute('''
+                    DELETE FROM http_responses WHERE rowid IN (
+                        SELECT rowid FROM http_responses ORDER BY last_access LIMIT ?
+                    )
+                ''', (count - self.max_entries,))
+            self._conn.commit()
+
+    def revalidated(self, url: str, headers):
+        """Record a 304 Not Modified: the stored body is current again"""
+        now = time.time()
+        lifetime = freshness_lifetime(headers, now) or 0
+        self.revalidations += 1
+        with self._lock:
+            self._conn.execute('UPDATE http_responses SET expires_at = ?, last_access = ? WHERE url = ?',
+                               (now + lifetime, now, url))
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM http_responses')
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Hit/revalidation/miss counts for this process plus the number of stored pages"""
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM http_responses').fetchone()[0]
+        return {'hits': self.hits, 'revalidations': self.revalidations, 'misses': self.misses, 'entries': entries}
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_http_cache() -> Optional[HttpCache]:
+    """Return the process-wide HTTP cache, or None when HTTP_CACHE_DISABLED is set"""
+    global _default_cache
+
+    if os.environ.get('HTTP_CACHE_DISABLED', '').lower() in ('1', 'true', 'yes'):
+        return None
+
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = HttpCache()
+    return _default_cache
@@ -0,0 +1,91 @@
+"""
+Shared HTTP transport for the Demo Prep Tool
+Connection-pooled requests session with keep-alive and retry/backoff
+"""
+
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from metrics import HTTP_RETRYABLE_RESPONSES
+
+# Connections kept open per host (should be >= SEARCH_MAX_WORKERS)
+DEFAULT_POOL_SIZE = 16
+
+# Retries for transient failures (connection errors, 429 and 5xx responses)
+DEFAULT_MAX_RETRIES = 3
+
+# Backoff between retries: backoff_factor * 2 ** (retry - 1) seconds, plus jitter
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_BACKOFF_JITTER = 0.5
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+class CountingRetry(Retry):
+    """Retry policy that counts each 429/5xx response, including the ones retried before callers see them"""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and response.status in RETRY_STATUS_CODES:
+            HTTP_RETRYABLE_RESPONSES.inc(status=response.status)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def create_session(pool_size: Optional[int] = None, max_retries: Optional[int] = None,
+                   backoff_factor: Optional[float] = None) -> requests.Session:
+    """
+    Create a pooled HTTP session
+
+    Args:
+        pool_size: Connections kept alive per host (default: HTTP_POOL_SIZE env var or 16)
+        max_retries: Retries on connection errors, 429 and 5xx (default: HTTP_MAX_RETRIES env var or 3)
+        backoff_factor: Base delay in seconds for exponential backoff (default: 0.5)
+
+    Returns:
+        requests.Session with keep-alive connection pools for http and https
+    """
+    pool_size = pool_size or int(os.environ.get('HTTP_POOL_SIZE', DEFAULT_POOL_SIZE))
+    if max_retries is None:
+        max_retries = int(os.environ.get('HTTP_MAX_RETRIES', DEFAULT_MAX_RETRIES))
+    if backoff_factor is None:
+        backoff_factor = DEFAULT_BACKOFF_FACTOR
+
+    retry_options = {
+        'total': max_retries,
+        'backoff_factor': backoff_factor,
+        'status_forcelist': RETRY_STATUS_CODES,
+        'allowed_methods': frozenset(['GET', 'HEAD']),
+        'respect_retry_after_header': True,
+        # Hand the final 429/5xx response back so callers see the real status
+        'raise_on_status': False,
+    }
+    try:
+        retry = CountingRetry(backoff_jitter=DEFAULT_BACKOFF_JITTER, **retry_options)
+    except TypeError:
+        # urllib3 < 2.0 has no jitter support
+        retry = CountingRetry(**retry_options)
+
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use"""
+    global _shared_session
+
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = create_session()
+    return _shared_session
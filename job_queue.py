@@ -0,0 +1,134 @@
+"""
+Background job queue for long-running research requests
+Jobs run on a bounded worker pool and are polled by id
+"""
+
+import os
+import secrets
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from progress import ProgressBus
+
+# Research jobs running at once (each one fans out its own searches)
+DEFAULT_JOB_WORKERS = 4
+
+# Finished jobs are kept this long (seconds) so clients can fetch results
+DEFAULT_JOB_RETENTION = 60 * 60
+
+# Upper bound on jobs held in memory; oldest finished jobs go first
+DEFAULT_MAX_JOBS = 500
+
+
+class Job:
+    """A unit of work tracked by JobQueue"""
+
+    def __init__(self, job_id: str, description: str = '', progress: Optional[ProgressBus] = None):
+        self.id = job_id
+        self.description = description
+        self.progress = progress
+        self.status = 'queued'  # queued -> running -> complete | failed
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.result = None
+        self.error = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ('complete', 'failed')
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable view of the job"""
+        job = {
+            'job_id': self.id,
+            'status': self.status,
+            'description': self.description,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+        if self.status == 'complete':
+            job['result'] = self.result
+        if self.status == 'failed':
+            job['error'] = self.error
+        return job
+
+
+class JobQueue:
+    """Run callables on a worker pool and track them as jobs"""
+
+    def __init__(self, max_workers: Optional[int] = None, retention: int = DEFAULT_JOB_RETENTION,
+                 max_jobs: int = DEFAULT_MAX_JOBS):
+        """
+        Args:
+            max_workers: Jobs running at once (default: RESEARCH_WORKERS env var or 4)
+            retention: Seconds to keep finished jobs
+            max_jobs: Maximum jobs tracked in memory
+        """
+        max_workers = max_workers or int(os.environ.get('RESEARCH_WORKERS', DEFAULT_JOB_WORKERS))
+        self.retention = retention
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='research-job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, func: Callable, *args, description: str = '',
+               progress: Optional[ProgressBus] = None, **kwargs) -> Job:
+        """
+        Queue func(*args, **kwargs) and return its Job immediately
+
+        If a progress bus is given, job status events are emitted on it and
+        it is closed when the job finishes.
+        """
+        job = Job(secrets.token_urlsafe(12), description, progress)
+
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Look up a job by id"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, func: Callable, args, kwargs):
+        job.status = 'running'
+        job.started_at = time.time()
+        self._emit(job)
+        try:
+            job.result = func(*args, **kwargs)
+            job.status = 'complete'
+        except Exception as e:
+            print(f"⚠ Job {job.id} failed: {str(e)}")
+            traceback.print_exc()
+            job.error = str(e)
+            job.status = 'failed'
+        finally:
+            job.finished_at = time.time()
+            self._emit(job)
+            if job.progress:
+                job.progress.close()
+
+    def _emit(self, job: Job):
+        """Publish the job's current status on its progress bus"""
+        if job.progress:
+            job.progress.emit('job_status', job_id=job.id, status=job.status, error=job.error)
+
+    def _prune(self):
+        """Drop expired jobs, then the oldest finished jobs if over max_jobs (caller holds lock)"""
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.done and now - job.finished_at > self.retention:
+                del self._jobs[job_id]
+
+        if len(self._jobs) >= self.max_jobs:
+            finished = sorted((job for job in self._jobs.values() if job.done), key=lambda job: job.finished_at)
+            for job in finished[:len(self._jobs) - self.max_jobs + 1]:
+                del self._jobs[job.id]
@@ -0,0 +1,296 @@
+"""
+In-process timing and counters for research runs
+Labelled counters and latency histograms, exposed in Prometheus text format
+(web app /metrics) and as a summary table at the end of a CLI run
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple
+
+# Histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+class Counter:
+    """Thread-safe monotonically increasing count, per label combination"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}  # label values tuple -> count
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(_label_key(self.labelnames, labels), 0)
+
+    def samples(self) -> List[Tuple[Dict[str, str], float]]:
+        """(labels, count) for every label combination seen so far"""
+        with self._lock:
+            return [(dict(zip(self.labelnames, key)), value) for key, value in sorted(self._values.items())]
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+    def _exposition(self) -> List[str]:
+        return [f"{self.name}{_format_labels(labels)} {_format_value(value)}" for labels, value in self.samples()]
+
+
+class _HistogramState:
+    def __init__(self, bucket_count: int):
+        self.buckets = [0] * bucket_count
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class Histogram:
+    """Thread-safe latency distribution (bucket counts, sum, count and max), per label combination"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._states = {}  # label values tuple -> _HistogramState
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = _label_key(self.labelnames, labels)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _HistogramState(len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state.buckets[i] += 1
+                    break
+            state.count += 1
+            state.sum += value
+            state.max = max(state.max, value)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the with-block, even if it raises"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def summaries(self) -> List[Tuple[Dict[str, str], Dict]]:
+        """(labels, {'count', 'sum', 'mean', 'p50', 'p95', 'max'}) for every label combination seen so far"""
+        with self._lock:
+            states = sorted(self._states.items())
+            return [(dict(zip(self.labelnames, key)), self._summarize(state)) for key, state in states]
+
+    def reset(self):
+        with self._lock:
+            self._states.clear()
+
+    def _summarize(self, state: _HistogramState) -> Dict:
+        return {
+            'count': state.count,
+            'sum': state.sum,
+            'mean': state.sum / state.count if state.count else 0.0,
+            'p50': self._quantile(state, 0.5),
+            'p95': self._quantile(state, 0.95),
+            'max': state.max,
+        }
+
+    def _quantile(self, state: _HistogramState, q: float) -> float:
+        """Upper bound of the bucket holding the q-th observation (never above the observed max)"""
+        rank = math.ceil(q * state.count)
+        seen = 0
+        for bound, count in zip(self.buckets, state.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, state.max)
+        return state.max
+
+    def _exposition(self) -> List[str]:
+        with self._lock:
+            states = sorted(self._states.items())
+            lines = []
+            for key, state in states:
+                labels = dict(zip(self.labelnames, key))
+                cumulative = 0
+                for bound, count in zip(self.buckets, state.buckets):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_format_labels(labels, le=_format_value(bound))} {cumulative}")
+                lines.append(f"{self.name}_bucket{_format_labels(labels, le='+Inf')} {state.count}")
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(state.sum)}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {state.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """A named set of counters and histograms"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def _register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render_prometheus(self) -> str:
+        """Every metric in the Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric._exposition())
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+def _label_key(labelnames: Tuple[str, ...], labels: Dict) -> Tuple[str, ...]:
+    if set(labels) != set(labelnames):
+        raise ValueError(f"Expected labels {labelnames}, got {tuple(labels)}")
+    return tuple(str(labels[name]) for name in labelnames)
+
+
+def _format_labels(labels: Dict[str, str], **extra) -> str:
+    labels = dict(labels, **extra)
+    if not labels:
+        return ''
+    escaped = (
+        f'{name}="' + value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"') + '"'
+        for name, value in labels.items()
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+# Process-wide metrics used by the research code
+REGISTRY = MetricsRegistry()
+
+SEARCH_SECONDS = REGISTRY.histogram(
+    'demo_prep_search_seconds',
+    'Web search latency seen by callers, by query category and where the answer came from (cache, api, shared)',
+    ['category', 'source']
+)
+SEARCH_ERRORS = REGISTRY.counter(
+    'demo_prep_search_errors_total',
+    'Failed Custom Search API calls, by query category and reason (rate_limited, http_error, network, unexpected)',
+    ['category', 'reason']
+)
+SEARCH_SKIPPED = REGISTRY.counter(
+    'demo_prep_search_skipped_total',
+    'Queries not sent because the research budget or daily quota was spent',
+    ['category']
+)
+SEARCH_CACHE_LOOKUPS = REGISTRY.counter(
+    'demo_prep_search_cache_lookups_total',
+    'Search result cache lookups, by result (hit, miss)',
+    ['result']
+)
+HTTP_RETRYABLE_RESPONSES = REGISTRY.counter(
+    'demo_prep_http_retryable_responses_total',
+    '429 and 5xx responses received, counting each attempt including those retried away, by status',
+    ['status']
+)
+HTTP_CACHE_LOOKUPS = REGISTRY.counter(
+    'demo_prep_http_cache_lookups_total',
+    'Website page cache lookups, by result (fresh, revalidated, miss)',
+    ['result']
+)
+PHASE_SECONDS = REGISTRY.histogram(
+    'demo_prep_phase_seconds',
+    'Research phase durations, by phase and outcome',
+    ['phase', 'status']
+)
+
+
+def format_summary() -> str:
+    """
+    Human-readable table of the process-wide metrics: phase durations,
+    search latency per category, errors and cache hit rates
+    """
+    lines = []
+    phases = PHASE_SECONDS.summaries()
+    if phases:
+        lines.append(f"  {'Phase':<32} {'Status':<10} {'Runs':>5} {'Total':>8} {'Max':>8}")
+        for labels, stats in sorted(phases, key=lambda item: -item[1]['sum']):
+            lines.append(f"  {labels['phase']:<32} {labels['status']:<10} {stats['count']:>5} "
+                         f"{_seconds(stats['sum']):>8} {_seconds(stats['max']):>8}")
+
+    searches = SEARCH_SECONDS.summaries()
+    if searches:
+        if lines:
+            lines.append('')
+        lines.append(f"  {'Search category':<22} {'Source':<8} {'Count':>6} {'Mean':>8} {'p95':>8} {'Max':>8}")
+        for labels, stats in searches:
+            lines.append(f"  {labels['category']:<22} {labels['source']:<8} {stats['count']:>6} "
+                         f"{_seconds(stats['mean']):>8} {_seconds(stats['p95']):>8} {_seconds(stats['max']):>8}")
+
+    footer = []
+    errors = [(labels, count) for labels, count in SEARCH_ERRORS.samples() if count]
+    if errors:
+        by_reason = {}
+        for labels, count in errors:
+            by_reason[labels['reason']] = by_reason.get(labels['reason'], 0) + count
+        footer.append('Search errors: ' + ', '.join(f"{reason} {int(count)}" for reason, count in sorted(by_reason.items())))
+    retryable = [(labels['status'], count) for labels, count in HTTP_RETRYABLE_RESPONSES.samples() if count]
+    if retryable:
+        footer.append('HTTP 429/5xx responses (incl. retried): ' +
+                      ', '.join(f"{status} {int(count)}" for status, count in retryable))
+    skipped = sum(count for _, count in SEARCH_SKIPPED.samples())
+    if skipped:
+        footer.append(f"Queries skipped (budget/quota): {int(skipped)}")
+    footer.append('Search cache: ' + _hit_rate(SEARCH_CACHE_LOOKUPS, ['hit']))
+    footer.append('Website cache: ' + _hit_rate(HTTP_CACHE_LOOKUPS, ['fresh', 'revalidated']))
+    if lines:
+        lines.append('')
+    lines.extend('  ' + line for line in footer)
+    return '\n'.join(lines)
+
+
+def _hit_rate(counter: Counter, hit_results: List[str]) -> str:
+    counts = {labels['result']: value for labels, value in counter.samples()}
+    total = sum(counts.values())
+    if not total:
+        return 'no lookups'
+    hits = sum(counts.get(result, 0) for result in hit_results)
+    return f"{int(hits)}/{int(total)} hits ({hits / total:.0%})"
+
+
+def _seconds(value: float) -> str:
+    return f"{value * 1000:.0f}ms" if value < 1 else f"{value:.1f}s"
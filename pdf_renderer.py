@@ -0,0 +1,92 @@
+"""
+PDF rendering off the research and web threads
+Reports are rendered from markdown strings in a pool of worker processes
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+# PDF converter lives in scripts/ (same as the web app)
+sys.path.append(str(Path(__file__).parent / 'scripts'))
+
+# Worker processes rendering PDFs at once
+DEFAULT_PDF_WORKERS = 2
+
+
+def _render(md_text: str, pdf_path: str) -> str:
+    """Worker entry point: render markdown text to pdf_path"""
+    from convert_to_pdf import markdown_to_pdf
+    markdown_to_pdf(md_text, pdf_path)
+    return pdf_path
+
+
+def _render_bytes(md_text: str) -> bytes:
+    """Worker entry point: render markdown text to PDF bytes"""
+    from convert_to_pdf import markdown_to_pdf_bytes
+    return markdown_to_pdf_bytes(md_text)
+
+
+class PdfRenderer:
+    """
+    Render PDFs in a process pool
+
+    ReportLab layout is CPU-bound and holds the GIL, so rendering in worker
+    processes keeps research threads and web requests responsive. Each
+    worker builds its paragraph styles once and reuses them.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Worker processes (default: PDF_WORKERS env var or 2; 0 renders in the calling thread)
+        """
+        if max_workers is None:
+            max_workers = int(os.environ.get('PDF_WORKERS', DEFAULT_PDF_WORKERS))
+        self.max_workers = max_workers
+        self._executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 0 else None
+
+    def submit(self, md_text: str, pdf_path) -> Future:
+        """Queue markdown text for rendering to pdf_path; the future resolves to the path"""
+        return self._submit(_render, md_text, str(pdf_path))
+
+    def submit_bytes(self, md_text: str) -> Future:
+        """Queue markdown text for rendering; the future resolves to the PDF bytes"""
+        return self._submit(_render_bytes, md_text)
+
+    def render(self, md_text: str, pdf_path, timeout: Optional[float] = None) -> str:
+        """Render markdown text to pdf_path and wait for it"""
+        return self.submit(md_text, pdf_path).result(timeout)
+
+    def _submit(self, func, *args) -> Future:
+        if self._executor is not None:
+            return self._executor.submit(func, *args)
+
+        future = Future()
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+
+_default_renderer = None
+_default_renderer_lock = threading.Lock()
+
+
+def get_default_pdf_renderer() -> PdfRenderer:
+    """Return the process-wide PDF renderer, creating it on first use"""
+    global _default_renderer
+
+    if _default_renderer is None:
+        with _default_renderer_lock:
+            if _default_renderer is None:
+                _default_renderer = PdfRenderer()
+    return _default_renderer
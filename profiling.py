@@ -0,0 +1,190 @@
+"""
+Opt-in sampling profiler for research runs
+Samples every thread's stack (research phases run on worker threads, out of
+reach of cProfile) and writes folded stacks for flamegraph tools plus a
+top-N hot function summary
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_PROFILE_DIR = 'profiles'
+
+# Seconds between stack samples
+DEFAULT_INTERVAL = 0.005
+
+# Functions listed in the summary
+DEFAULT_TOP = 15
+
+# Innermost frames of threads with nothing to do (idle pool workers, threads
+# waiting on futures); these samples are left out of the profile
+IDLE_FRAMES = {
+    ('threading.py', 'wait'),
+    ('threading.py', '_wait_for_tstate_lock'),
+    ('queue.py', 'get'),
+    ('thread.py', '_worker'),  # concurrent.futures worker blocked on its C work queue
+    ('selectors.py', 'select'),
+    ('socketserver.py', 'serve_forever'),
+}
+
+# Innermost files meaning the thread is blocked on the network (or backing off
+# before retrying a request)
+NETWORK_FILES = {'socket.py', 'ssl.py', 'connection.py', 'retry.py'}
+
+# Thread start-up frames at the bottom of every stack, left out of the
+# "including callees" ranking
+SCAFFOLD_FILES = ('/threading.py:', 'futures/thread.py:')
+
+
+def profiling_enabled() -> bool:
+    """True when DEMO_PREP_PROFILE is set, e.g. to profile every web app research job"""
+    return os.environ.get('DEMO_PREP_PROFILE', '').lower() in ('1', 'true', 'yes')
+
+
+class SamplingProfiler:
+    """
+    Background thread recording the Python stack of every other thread at a fixed interval
+
+    Samples are process-wide: runs that overlap (e.g. concurrent web app
+    jobs) show up in each other's profiles.
+    """
+
+    def __init__(self, interval: Optional[float] = None):
+        """
+        Args:
+            interval: Seconds between samples (default: PROFILE_INTERVAL env var or 0.005)
+        """
+        self.interval = interval or float(os.environ.get('PROFILE_INTERVAL', DEFAULT_INTERVAL))
+        self.stacks = Counter()  # tuple of frame labels, outermost first -> samples
+        self.idle_samples = 0
+        self.elapsed = 0.0
+        self._labels = {}  # code object -> frame label
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = None
+
+    def start(self) -> 'SamplingProfiler':
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.elapsed = time.perf_counter() - self._started
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_id:
+                    self._record(frame)
+
+    def _record(self, frame):
+        code = frame.f_code
+        if (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES:
+            self.idle_samples += 1
+            return
+        stack = []
+        while frame is not None:
+            stack.append(self._label(frame.f_code))
+            frame = frame.f_back
+        self.stacks[tuple(reversed(stack))] += 1
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            path = '/'.join(Path(code.co_filename).parts[-2:])
+            label = self._labels[code] = f"{code.co_name} ({path}:{code.co_firstlineno})"
+        return label
+
+    def write_folded(self, path):
+        """Write 'frame;frame;frame count' lines, the input format of flamegraph.pl and speedscope"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(';'.join(stack) + f" {count}\n")
+
+    def hot_functions(self, top: int = DEFAULT_TOP) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """(functions by samples spent in them, functions by samples spent in them or their callees)"""
+        own = Counter()
+        total = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for label in set(stack):
+                if not any(scaffold in label for scaffold in SCAFFOLD_FILES):
+                    total[label] += count
+        return own.most_common(top), total.most_common(top)
+
+    def breakdown(self) -> Dict[str, int]:
+        """Busy samples split into network waits, rate-limit waits and everything else (CPU)"""
+        split = Counter()
+        for stack, count in self.stacks.items():
+            leaf_file = stack[-1].rsplit('(', 1)[-1].split('/')[-1].split(':')[0]
+            if leaf_file in NETWORK_FILES:
+                split['network'] += count
+            elif any('rate_limiter.py' in label for label in stack[-3:]):
+                split['rate_limit'] += count
+            else:
+                split['cpu'] += count
+        return dict(split)
+
+    def summary(self, top: int = DEFAULT_TOP) -> str:
+        """Plain-text report: where busy samples went, then the top-N hot functions"""
+        busy = sum(self.stacks.values())
+        if not busy:
+            return f"No busy samples in {self.elapsed:.1f}s"
+
+        split = self.breakdown()
+        lines = [
+            f"{busy} busy samples over {self.elapsed:.1f}s ({self.interval * 1000:.0f}ms interval, "
+            f"{self.idle_samples} idle samples dropped)",
+            '  ' + ', '.join(f"{name} {split.get(name, 0) / busy:.0%}" for name in ('network', 'rate_limit', 'cpu')),
+        ]
+        own, total = self.hot_functions(top)
+        lines.append(f"\n  Top {top} by own time:")
+        lines.extend(f"  {count / busy:6.1%}  {label}" for label, count in own)
+        lines.append(f"\n  Top {top} including callees:")
+        lines.extend(f"  {count / busy:6.1%}  {label}" for label, count in total)
+        return '\n'.join(lines)
+
+
+@contextmanager
+def profile_run(name: str, enabled: Optional[bool] = None, output_dir=None, top: int = DEFAULT_TOP):
+    """
+    Profile the with-block when enabled, then save <name>_<timestamp>.folded
+    and .txt (the summary) and print the summary
+
+    Args:
+        name: Run name used in the file names (e.g. the company domain)
+        enabled: Profile or not (default: DEMO_PREP_PROFILE env var)
+        output_dir: Where profiles go (default: PROFILE_DIR env var or profiles/)
+        top: Functions listed in the summary
+    """
+    if enabled is None:
+        enabled = profiling_enabled()
+    if not enabled:
+        yield None
+        return
+
+    profiler = SamplingProfiler().start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        output_dir = Path(output_dir or os.environ.get('PROFILE_DIR', DEFAULT_PROFILE_DIR))
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{re.sub(r'[^A-Za-z0-9._-]+', '_', name)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        summary = profiler.summary(top)
+        profiler.write_folded(output_dir / f"{stem}.folded")
+        (output_dir / f"{stem}.txt").write_text(summary + '\n', encoding='utf-8')
+        print(f"\n🔥 Profile: {output_dir / stem}.folded (flamegraph.pl / speedscope)")
+        print(summary)
@@ -0,0 +1,74 @@
+"""
+Progress events for in-flight research
+An append-only event log that research code writes to and any number of
+readers (e.g. Server-Sent Events streams) can follow
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+# Events kept per bus; older events are dropped once exceeded
+DEFAULT_MAX_EVENTS = 5000
+
+
+class ProgressBus:
+    """Thread-safe, append-only log of progress events"""
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS):
+        self.max_events = max_events
+        self.closed = False
+        self._events = []
+        self._next_seq = 1
+        self._subscribers = []
+        self._condition = threading.Condition()
+
+    def subscribe(self, callback: Callable[[Dict], None]):
+        """Call callback(event) synchronously for every event emitted from now on"""
+        with self._condition:
+            self._subscribers.append(callback)
+
+    def emit(self, event_type: str, **fields) -> Dict:
+        """
+        Record an event
+
+        Args:
+            event_type: Event name (e.g. 'phase_start', 'query', 'phase_end')
+            **fields: JSON-serializable event details
+
+        Returns:
+            The recorded event, with 'seq', 'type' and 'time' added
+        """
+        with self._condition:
+            event = dict(fields, seq=self._next_seq, type=event_type, time=time.time())
+            self._next_seq += 1
+            self._events.append(event)
+            if len(self._events) > self.max_events:
+                del self._events[:len(self._events) - self.max_events]
+            self._condition.notify_all()
+            subscribers = list(self._subscribers)
+
+        # Outside the lock so subscribers may read the bus or emit themselves
+        for callback in subscribers:
+            callback(event)
+        return event
+
+    def close(self):
+        """Mark the stream finished and wake up waiting readers"""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def events_since(self, seq: int = 0, timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Return events with a sequence number greater than seq
+
+        Blocks up to timeout seconds until a new event arrives or the bus is
+        closed; returns an empty list if nothing arrived in time.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.closed or (self._events and self._events[-1]['seq'] > seq),
+                timeout=timeout
+            )
+            return [event for event in self._events if event['seq'] > seq]
@@ -0,0 +1,139 @@
+"""
+Google Custom Search API quota accounting
+Persistent daily spend tracking plus per-research query budgets
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+try:
+    from zoneinfo import ZoneInfo
+    # Google resets the daily Custom Search quota at midnight Pacific time
+    QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+except Exception:
+    QUOTA_TIMEZONE = timezone.utc
+
+DEFAULT_QUOTA_PATH = Path(__file__).parent / '.cache' / 'quota.sqlite3'
+
+
+def quota_day() -> str:
+    """Current quota day (YYYY-MM-DD in the quota reset timezone)"""
+    return datetime.now(QUOTA_TIMEZONE).strftime('%Y-%m-%d')
+
+
+class QuotaTracker:
+    """
+    Persistent count of API queries spent per day
+
+    Backed by SQLite so the CLI, the web app and batch runs on the same
+    machine share one count.
+    """
+
+    def __init__(self, path=None, daily_limit: Optional[int] = None):
+        """
+        Args:
+            path: SQLite file path (default: QUOTA_PATH env var or .cache/quota.sqlite3)
+            daily_limit: Maximum queries per day (default: GOOGLE_DAILY_QUERY_LIMIT env var, or no limit)
+        """
+        self.path = Path(path or os.environ.get('QUOTA_PATH', DEFAULT_QUOTA_PATH))
+        if daily_limit is None and os.environ.get('GOOGLE_DAILY_QUERY_LIMIT'):
+            daily_limit = int(os.environ['GOOGLE_DAILY_QUERY_LIMIT'])
+        self.daily_limit = daily_limit
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode; transactions are managed explicitly in try_spend()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30,
+                                     isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS quota_usage (
+                day TEXT PRIMARY KEY,
+                queries INTEGER NOT NULL
+            )
+        ''')
+
+    def try_spend(self, count: int = 1) -> bool:
+        """Record count queries if the daily limit allows it; returns False if it does not"""
+        day = quota_day()
+        with self._lock:
+            # IMMEDIATE takes the write lock up front so other processes can't interleave
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute('SELECT queries FROM quota_usage WHERE day = ?', (day,)).fetchone()
+                spent = row[0] if row else 0
+                if self.daily_limit is not None and spent + count > self.daily_limit:
+                    self._conn.execute('ROLLBACK')
+                    return False
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO quota_usage (day, queries) VALUES (?, ?)', (day, spent + count)
+                )
+                self._conn.execute('COMMIT')
+                return True
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def refund(self, count: int = 1):
+        """Give back queries recorded by try_spend() that were never billed (the request failed in transit)"""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE quota_usage SET queries = MAX(0, queries - ?) WHERE day = ?', (count, quota_day())
+            )
+
+    def spent_today(self) -> int:
+        """Queries recorded for the current quota day"""
+        with self._lock:
+            row = self._conn.execute('SELECT queries FROM quota_usage WHERE day = ?', (quota_day(),)).fetchone()
+        return row[0] if row else 0
+
+    def remaining(self) -> Optional[int]:
+        """Queries left today, or None when there is no daily limit"""
+        if self.daily_limit is None:
+            return None
+        return max(0, self.daily_limit - self.spent_today())
+
+
+class QueryBudget:
+    """Thread-safe cap on API queries for a single research run"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.spent = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self.spent)
+
+    def try_spend(self, count: int = 1) -> bool:
+        """Reserve count queries; returns False if that would exceed the budget"""
+        with self._lock:
+            if self.spent + count > self.limit:
+                return False
+            self.spent += count
+            return True
+
+    def refund(self, count: int = 1):
+        """Give back queries that were reserved but not sent"""
+        with self._lock:
+            self.spent = max(0, self.spent - count)
+
+
+_default_tracker = None
+_default_tracker_lock = threading.Lock()
+
+
+def get_default_quota_tracker() -> QuotaTracker:
+    """Return the process-wide quota tracker, creating it on first use"""
+    global _default_tracker
+
+    if _default_tracker is None:
+        with _default_tracker_lock:
+            if _default_tracker is None:
+                _default_tracker = QuotaTracker()
+    return _default_tracker
@@ -0,0 +1,164 @@
+"""
+Token-bucket rate limiting for Google Custom Search requests
+Coordinated across threads, and across processes through a shared state file
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no file locking, fall back to per-process limiting
+    fcntl = None
+
+# Google's default Custom Search limit is 100 queries/minute: a burst of 10
+# plus 1.5/s keeps any minute at or under that
+DEFAULT_QPS = 1.5
+DEFAULT_BURST = 10
+
+DEFAULT_STATE_PATH = Path(__file__).parent / '.cache' / 'rate_limit.json'
+
+
+class TokenBucket:
+    """Thread-safe token bucket for a single process"""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            burst: Bucket capacity (requests allowed back to back)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self, tokens: float) -> float:
+        """Try to take tokens; returns 0 on success, else seconds to wait before retrying"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Block until tokens are available
+
+        Returns:
+            True once acquired, False if timeout (seconds) ran out first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take(tokens)
+            if wait == 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1):
+        """Wait without blocking the event loop until tokens are available"""
+        while True:
+            # _take may wait on a lock (FileTokenBucket: flock), so it runs off the loop
+            wait = await asyncio.to_thread(self._take, tokens)
+            if wait == 0:
+                return
+            await asyncio.sleep(wait)
+
+
+class FileTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in a locked file
+
+    Every process using the same state file draws from one bucket, so the CLI,
+    batch runs and web workers on a machine share a single rate limit.
+    """
+
+    def __init__(self, rate: float, burst: int, path=None):
+        super().__init__(rate, burst)
+        self.path = Path(path or os.environ.get('SEARCH_RATE_LIMIT_PATH', DEFAULT_STATE_PATH))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+    def _take(self, tokens: float) -> float:
+        # Thread lock first so threads in this process don't all contend on flock
+        with self._lock, open(self.path, 'r+') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.loads(f.read() or '{}')
+                except ValueError:
+                    state = {}
+
+                # Wall-clock time: monotonic clocks aren't comparable across processes
+                now = time.time()
+                available = state.get('tokens', self.burst)
+                elapsed = max(0.0, now - state.get('updated', now))
+                available = min(self.burst, available + elapsed * self.rate)
+
+                wait = 0.0
+                if available >= tokens:
+                    available -= tokens
+                else:
+                    wait = (tokens - available) / self.rate
+
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps({'tokens': available, 'updated': now}))
+                # Flush before unlocking so the next process reads this state
+                f.flush()
+                return wait
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def create_rate_limiter(qps: Optional[float] = None, burst: Optional[int] = None,
+                        backend: Optional[str] = None) -> Optional[TokenBucket]:
+    """
+    Create a rate limiter from arguments or environment variables
+
+    Args:
+        qps: Sustained requests per second (default: SEARCH_QPS env var or 1.5; 0 disables)
+        burst: Requests allowed back to back (default: SEARCH_BURST env var or 10)
+        backend: 'file' to share the limit across processes, 'memory' for this
+            process only (default: SEARCH_RATE_LIMIT_BACKEND env var or 'file')
+
+    Returns:
+        TokenBucket, or None if rate limiting is disabled
+    """
+    qps = float(os.environ.get('SEARCH_QPS', DEFAULT_QPS)) if qps is None else qps
+    burst = int(os.environ.get('SEARCH_BURST', DEFAULT_BURST)) if burst is None else burst
+    backend = backend or os.environ.get('SEARCH_RATE_LIMIT_BACKEND', 'file')
+
+    if qps <= 0:
+        return None
+    if backend == 'file' and fcntl is not None:
+        return FileTokenBucket(qps, burst)
+    return TokenBucket(qps, burst)
+
+
+_default_limiter = None
+_default_limiter_created = False
+_default_limiter_lock = threading.Lock()
+
+
+def get_default_rate_limiter() -> Optional[TokenBucket]:
+    """Return the process-wide rate limiter (None if disabled), creating it on first use"""
+    global _default_limiter, _default_limiter_created
+
+    if not _default_limiter_created:
+        with _default_limiter_lock:
+            if not _default_limiter_created:
+                _default_limiter = create_rate_limiter()
+                _default_limiter_created = True
+    return _default_limiter
@@ -0,0 +1,272 @@
+"""
+Record/replay of research HTTP traffic
+Captures the responses behind WebSearcher.search and research_website to a
+fixture file, and replays them from a local stub server with injected
+latency, so the research pipeline can be run and measured offline
+"""
+
+import base64
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from http_client import create_session
+
+# Query parameters left out of fixture keys: the API key must never be written
+# to a fixture, and the search engine id differs between accounts
+IGNORED_PARAMS = {'key', 'cx'}
+
+# Response headers kept in fixtures (hop-by-hop and size headers are rebuilt on replay)
+RECORDED_HEADERS = ('content-type', 'location', 'etag', 'last-modified', 'cache-control', 'expires')
+
+REPLAY_PATH = '/replay'
+
+
+def replay_url(server_url: str, url: str) -> str:
+    """The ReplayServer URL answering requests for url; query parameters added to it are appended to url"""
+    return f"{server_url}{REPLAY_PATH}?url={quote(url, safe='')}"
+
+
+def fixture_key(url: str) -> str:
+    """URL with its query sorted and secrets/account ids dropped, used to match requests to fixtures"""
+    parts = urlsplit(url)
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if name not in IGNORED_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or '/', urlencode(query), ''))
+
+
+class FixtureStore:
+    """Recorded responses keyed by fixture_key(url), loaded from and saved to a JSON file"""
+
+    def __init__(self, responses: Optional[Dict[str, Dict]] = None):
+        self.responses = responses or {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path) -> 'FixtureStore':
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f)['responses'])
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            payload = {'version': 1, 'responses': dict(sorted(self.responses.items()))}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=1)
+
+    def get(self, url: str) -> Optional[Dict]:
+        """The recorded response for url: {'status', 'headers', 'body' (bytes)}, or None"""
+        with self._lock:
+            entry = self.responses.get(fixture_key(url))
+        if entry is None:
+            return None
+        body = entry['body']
+        body = base64.b64decode(body) if entry.get('base64') else body.encode('utf-8')
+        return {'status': entry['status'], 'headers': entry['headers'], 'body': body}
+
+    def put(self, url: str, status: int, headers, body: bytes):
+        entry = {
+            'status': status,
+            'headers': {name: headers[name] for name in RECORDED_HEADERS if headers.get(name)},
+        }
+        try:
+            entry['body'] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            entry['body'] = base64.b64encode(body).decode('ascii')
+            entry['base64'] = True
+        with self._lock:
+            self.responses[fixture_key(url)] = entry
+
+    def __len__(self):
+        return len(self.responses)
+
+
+class RecordingAdapter(BaseAdapter):
+    """Transport adapter that passes requests through and records every response"""
+
+    def __init__(self, store: FixtureStore, inner: BaseAdapter):
+        super().__init__()
+        self.store = store
+        self.inner = inner
+
+    def send(self, request, **kwargs):
+        response = self.inner.send(request, **kwargs)
+        # A 304 only means something to the cache that sent the validators
+        if response.status_code != 304:
+            # Reading .content keeps the body available to streaming callers
+            self.store.put(request.url, response.status_code, response.headers, response.content)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+def recording_session(store: FixtureStore) -> requests.Session:
+    """A pooled session (see http_client) whose responses are recorded into store"""
+    session = create_session()
+    for prefix in ('https://', 'http://'):
+        session.mount(prefix, RecordingAdapter(store, session.get_adapter(prefix)))
+    return session
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Clients drop connections mid-body whenever fetch_page stops at its byte cap
+        if not isinstance(sys.exc_info()[1], (ConnectionError, TimeoutError)):
+            super().handle_error(request, client_address)
+
+
+class ReplayServer:
+    """
+    Local HTTP server answering with recorded responses
+
+    Every request is delayed by latency +/- jitter seconds to stand in for the
+    network. Conditional requests get a 304 when the recorded ETag or
+    Last-Modified matches. Requests with no fixture are answered by
+    fallback(url) if given ({'status', 'headers', 'body'} or None), else 404.
+    """
+
+    def __init__(self, store: FixtureStore, latency: float = 0.0, jitter: float = 0.0,
+                 fallback: Optional[Callable[[str], Optional[Dict]]] = None, seed: int = 0):
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.fallback = fallback
+        self.requests_by_host = {}
+        self.misses = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'ReplayServer':
+        self._server = _QuietHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def url_for(self, url: str) -> str:
+        """Where to send a request for url, for clients that can't use session() (e.g. aiohttp)"""
+        return replay_url(self.url, url)
+
+    def session(self) -> requests.Session:
+        """A pooled session whose requests, to any host, are answered by this server"""
+        session = create_session()
+        for prefix in ('https://', 'http://'):
+            session.mount(prefix, ReplayAdapter(self.url, session.get_adapter(prefix)))
+        return session
+
+    def request_count(self, host: Optional[str] = None) -> int:
+        with self._lock:
+            if host is not None:
+                return self.requests_by_host.get(host, 0)
+            return sum(self.requests_by_host.values())
+
+    def reset_counts(self):
+        with self._lock:
+            self.requests_by_host.clear()
+            self.misses.clear()
+
+    def _respond(self, url: str, request_headers) -> Dict:
+        with self._lock:
+            host = urlsplit(url).netloc.lower()
+            self.requests_by_host[host] = self.requests_by_host.get(host, 0) + 1
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+        time.sleep(delay)
+
+        response = self.store.get(url)
+        if response is None and self.fallback is not None:
+            response = self.fallback(url)
+        if response is None:
+            with self._lock:
+                self.misses.append(url)
+            return {'status': 404, 'headers': {'Content-Type': 'text/plain'}, 'body': b'no fixture'}
+
+        headers = response['headers']
+        if response['status'] == 200 and (
+                (headers.get('etag') and request_headers.get('If-None-Match') == headers['etag'])
+                or (headers.get('last-modified')
+                    and request_headers.get('If-Modified-Since') == headers['last-modified'])):
+            return {'status': 304, 'headers': {k: v for k, v in headers.items() if k != 'content-type'},
+                    'body': b''}
+        return response
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                path, _, query = self.path.partition('?')
+                params = parse_qsl(query, keep_blank_values=True)
+                if path != REPLAY_PATH or not params or params[0][0] != 'url':
+                    self.send_error(400)
+                    return
+                url = params[0][1]
+                if params[1:]:
+                    # Parameters the client added to a url_for() URL belong to the original request
+                    url += ('&' if urlsplit(url).query else '?') + urlencode(params[1:])
+                response = server._respond(url, self.headers)
+                self.send_response(response['status'])
+                for name, value in response['headers'].items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(response['body'])))
+                self.end_headers()
+                self.wfile.write(response['body'])
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter that sends every request to a ReplayServer, tagged with its original URL"""
+
+    def __init__(self, server_url: str, inner: Optional[BaseAdapter] = None):
+        super().__init__()
+        self.server_url = server_url
+        self.inner = inner or HTTPAdapter()
+
+    def send(self, request, **kwargs):
+        original_url = request.url
+        replayed = request.copy()
+        replayed.url = replay_url(self.server_url, original_url)
+        response = self.inner.send(replayed, **kwargs)
+        # Callers (and redirect handling) see the URL they asked for
+        response.url = original_url
+        response.request = request
+        return response
+
+    def close(self):
+        self.inner.close()
@@ -0,0 +1,104 @@
+"""
+On-demand report files for the web app
+Research data is saved once in the research store; Markdown/PDF files are
+rendered only when downloaded and cached by a hash of the data they were
+rendered from
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from pdf_renderer import get_default_pdf_renderer
+from research_store import ResearchStore
+from singleflight import SingleFlight
+
+# Report ids are file stems like acme_20260101_120000
+REPORT_ID_PATTERN = re.compile(r'^[\w.-]+$')
+
+
+def _render_markdown(data: Dict, path: Path):
+    from demo_prep import MarkdownGenerator
+    path.write_text(MarkdownGenerator.render(data), encoding='utf-8')
+
+
+def _render_pdf(data: Dict, path: Path):
+    from demo_prep import MarkdownGenerator
+    get_default_pdf_renderer().render(MarkdownGenerator.render(data), path)
+
+
+# Format name -> (file extension, renderer(data, path)); add entries for new formats
+REPORT_FORMATS = {
+    'markdown': ('md', _render_markdown),
+    'pdf': ('pdf', _render_pdf),
+}
+
+
+class ReportStore:
+    """Research results saved for download, plus a cache of rendered report files"""
+
+    def __init__(self, root, store: ResearchStore):
+        """
+        Args:
+            root: Output directory; rendered files go in its .render_cache subdirectory
+            store: Research store holding the saved data
+        """
+        self.root = Path(root).resolve()
+        self.store = store
+        self.cache_dir = self.root / '.render_cache'
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._renders = SingleFlight()
+
+    def save(self, report_id: str, data: Dict) -> Dict[str, str]:
+        """
+        Persist research data for later rendering
+
+        Returns:
+            Download file name per format, e.g. {'markdown': '<id>.md', 'pdf': '<id>.pdf'}
+        """
+        self.store.save(data, report_id=report_id)
+        return {fmt: f'{report_id}.{ext}' for fmt, (ext, _) in REPORT_FORMATS.items()}
+
+    def load(self, report_id: str) -> Optional[Dict]:
+        """Saved research data, or None if there is no such report"""
+        raw = self._load_raw(report_id)
+        return json.loads(raw) if raw is not None else None
+
+    def get_file(self, filename: str) -> Optional[Path]:
+        """
+        Path of a rendered report file such as '<id>.pdf', rendering it on first request
+
+        Returns None if the report or format does not exist.
+        """
+        report_id, _, ext = filename.rpartition('.')
+        formats = {ext: (fmt, render) for fmt, (ext, render) in REPORT_FORMATS.items()}
+        raw = self._load_raw(report_id) if ext in formats else None
+        if raw is None:
+            return None
+
+        path = self.cache_dir / f'{hashlib.sha256(raw).hexdigest()}.{ext}'
+        if path.exists():
+            return path
+
+        def render():
+            if not path.exists():
+                fmt, renderer = formats[ext]
+                with tempfile.TemporaryDirectory(dir=self.cache_dir) as tmp_dir:
+                    tmp_path = Path(tmp_dir) / path.name
+                    renderer(json.loads(raw), tmp_path)
+                    os.replace(tmp_path, path)
+            return path
+
+        # Concurrent downloads of the same file share one render
+        return self._renders.do(path.name, render)[0]
+
+    def _load_raw(self, report_id: str) -> Optional[bytes]:
+        """Saved data as JSON bytes, or None if there is no such report"""
+        if not REPORT_ID_PATTERN.match(report_id):
+            return None
+        raw = self.store.get_by_report_id(report_id)
+        return raw.encode('utf-8') if raw is not None else None
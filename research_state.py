@@ -0,0 +1,59 @@
+"""
+Server-side store for partially completed research
+Carries CompanyResearcher state from the verification step into deep research
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# States kept in memory; least recently used are dropped first
+DEFAULT_MAX_STATES = 200
+
+# Seconds a state survives without being used
+DEFAULT_STATE_TTL = 60 * 60
+
+
+class ResearchStateStore:
+    """Bounded, expiring in-memory map of state id -> research snapshot"""
+
+    def __init__(self, max_states: int = DEFAULT_MAX_STATES, ttl: int = DEFAULT_STATE_TTL):
+        self.max_states = max_states
+        self.ttl = ttl
+        self._states = OrderedDict()  # state id -> (last used, snapshot)
+        self._lock = threading.Lock()
+
+    def put(self, snapshot: Dict) -> str:
+        """Store a snapshot and return its id"""
+        state_id = secrets.token_urlsafe(12)
+        with self._lock:
+            self._expire()
+            self._states[state_id] = (time.time(), snapshot)
+            while len(self._states) > self.max_states:
+                self._states.popitem(last=False)
+        return state_id
+
+    def get(self, state_id: Optional[str]) -> Optional[Dict]:
+        """Return a stored snapshot (refreshing its expiry), or None if missing or expired"""
+        if not state_id:
+            return None
+
+        with self._lock:
+            self._expire()
+            entry = self._states.get(state_id)
+            if entry is None:
+                return None
+            self._states[state_id] = (time.time(), entry[1])
+            self._states.move_to_end(state_id)
+            return entry[1]
+
+    def _expire(self):
+        """Drop states unused for longer than the TTL (caller holds lock)"""
+        cutoff = time.time() - self.ttl
+        while self._states:
+            state_id, (last_used, _) = next(iter(self._states.items()))
+            if last_used >= cutoff:
+                break
+            del self._states[state_id]
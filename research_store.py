@@ -0,0 +1,172 @@
+"""
+Local store of completed research results
+SQLite-backed, indexed by domain, company name, date, vendor and technology
+so past research can be looked up instead of re-run
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_STORE_PATH = Path(__file__).parent / '.cache' / 'research_store.sqlite3'
+
+# Only each domain's most recent result counts in cross-account queries
+LATEST_RESULTS = 'r.id IN (SELECT MAX(id) FROM research_results GROUP BY domain)'
+
+
+class ResearchStore:
+    """Thread-safe persistent store of CompanyResearcher.data records"""
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path: SQLite file path (default: RESEARCH_STORE_PATH env var or .cache/research_store.sqlite3)
+        """
+        self.path = Path(path or os.environ.get('RESEARCH_STORE_PATH', DEFAULT_STORE_PATH))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS research_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                report_id TEXT UNIQUE,
+                domain TEXT NOT NULL,
+                company_name TEXT NOT NULL COLLATE NOCASE,
+                research_date TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_research_results_domain ON research_results (domain, id);
+            CREATE INDEX IF NOT EXISTS idx_research_results_company ON research_results (company_name);
+            CREATE INDEX IF NOT EXISTS idx_research_results_date ON research_results (research_date);
+
+            CREATE TABLE IF NOT EXISTS result_vendors (
+                result_id INTEGER NOT NULL REFERENCES research_results (id),
+                vendor TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (vendor, result_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS result_technologies (
+                result_id INTEGER NOT NULL REFERENCES research_results (id),
+                technology TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (technology, result_id)
+            );
+        ''')
+        self._conn.commit()
+
+    def save(self, data: Dict, report_id: Optional[str] = None) -> int:
+        """
+        Store a research result
+
+        Args:
+            data: CompanyResearcher.data
+            report_id: Optional external id (e.g. the web app's download name)
+
+        Returns:
+            The stored result's id
+        """
+        vendors = {item['vendor'] for item in data.get('security_vendors', [])}
+        technologies = {item['technology'] if isinstance(item, dict) else item
+                        for item in data.get('tech_stack', [])}
+
+        with self._lock:
+            try:
+                cursor = self._conn.execute(
+                    'INSERT INTO research_results (report_id, domain, company_name, research_date, created_at, data) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (report_id, normalize_domain(data['domain']), data['company_name'],
+                     data['research_date'], time.time(), json.dumps(data, default=str))
+                )
+                result_id = cursor.lastrowid
+                self._conn.executemany('INSERT OR IGNORE INTO result_vendors VALUES (?, ?)',
+                                       [(result_id, vendor) for vendor in vendors])
+                self._conn.executemany('INSERT OR IGNORE INTO result_technologies VALUES (?, ?)',
+                                       [(result_id, technology) for technology in technologies])
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        return result_id
+
+    def get(self, result_id: int) -> Optional[Dict]:
+        """A stored result's data by id"""
+        return self._fetch_data('SELECT data FROM research_results WHERE id = ?', (result_id,))
+
+    def get_by_report_id(self, report_id: str) -> Optional[str]:
+        """A stored result's data as its raw JSON text, looked up by report id"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data FROM research_results WHERE report_id = ?', (report_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def latest_for_domain(self, domain: str) -> Optional[Dict]:
+        """The most recent result for a domain, or None if it was never researched"""
+        return self._fetch_data(
+            'SELECT data FROM research_results WHERE domain = ? ORDER BY id DESC LIMIT 1',
+            (normalize_domain(domain),)
+        )
+
+    def find_by_vendor(self, vendor: str) -> List[Dict]:
+        """Summaries of companies whose latest result has a connection to vendor"""
+        return self._find(
+            'JOIN result_vendors v ON v.result_id = r.id WHERE v.vendor = ? AND ' + LATEST_RESULTS, (vendor,)
+        )
+
+    def find_by_technology(self, technology: str) -> List[Dict]:
+        """Summaries of companies whose latest result lists technology in its tech stack"""
+        return self._find(
+            'JOIN result_technologies t ON t.result_id = r.id WHERE t.technology = ? AND ' + LATEST_RESULTS,
+            (technology,)
+        )
+
+    def find_by_company(self, company_name: str) -> List[Dict]:
+        """Summaries of every result for a company name (case-insensitive), newest first"""
+        return self._find('WHERE r.company_name = ?', (company_name,))
+
+    def list_results(self, since: Optional[str] = None, limit: int = 100) -> List[Dict]:
+        """Summaries of the latest result per domain, newest first, optionally researched on/after since (YYYY-MM-DD)"""
+        return self._find('WHERE r.research_date >= ? AND ' + LATEST_RESULTS, (since or '',), limit)
+
+    def _find(self, where: str, params, limit: Optional[int] = None) -> List[Dict]:
+        query = ('SELECT r.id, r.report_id, r.domain, r.company_name, r.research_date '
+                 f'FROM research_results r {where} ORDER BY r.id DESC')
+        if limit is not None:
+            query += f' LIMIT {int(limit)}'
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            {'id': row[0], 'report_id': row[1], 'domain': row[2], 'company_name': row[3], 'research_date': row[4]}
+            for row in rows
+        ]
+
+    def _fetch_data(self, query: str, params) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        return json.loads(row[0]) if row else None
+
+
+def normalize_domain(domain: str) -> str:
+    """Lower-case a domain and drop a leading www. so lookups match however it was entered"""
+    domain = domain.strip().lower()
+    return domain[4:] if domain.startswith('www.') else domain
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_research_store() -> ResearchStore:
+    """Return the process-wide research store, creating it on first use"""
+    global _default_store
+
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = ResearchStore()
+    return _default_store
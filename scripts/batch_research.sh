@@ -1,5 +1,5 @@
 #!/bin/bash
-# Batch research multiple companies
+# Batch research multiple companies (concurrently, in one process)
 
 companies=(
     "salesforce.com"
@@ -8,19 +8,7 @@ companies=(
     "stripe.com"
 )
 
-for company in "${companies[@]}"; do
-    echo "Researching $company..."
-    ./run_demo_prep.sh "$company"
-
-    # Generate PDF
-    company_name="${company%%.*}"
-    python3 convert_to_pdf.py "${company_name}_demo_prep.md" "${company_name}_report.pdf"
-
-    echo "✓ Completed $company"
-    echo "---"
-
-    # Sleep to avoid rate limiting
-    sleep 5
-done
+# Reports, PDFs and batch_summary.md are written to batch_outputs/
+printf '%s\n' "${companies[@]}" | ./run_demo_prep.sh batch - --pdf
 
 echo "All companies researched!"
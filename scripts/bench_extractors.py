@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for technology / security tool extraction
+
+Compares the precompiled single-pass matchers in extractors.py with the
+previous approach (one regex per category, rebuilt and scanned per call).
+
+Usage: python3 scripts/bench_extractors.py [num_snippets]
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from extractors import (
+    TECHNOLOGY_CATEGORIES, SECURITY_CATEGORIES,
+    extract_technologies, extract_security_tools
+)
+
+FILLER_WORDS = (
+    "the team is hiring engineers to build scalable services experience with modern "
+    "tooling required strong communication skills remote friendly benefits include "
+    "equity and health coverage join us to protect customers across the globe"
+).split()
+
+
+def legacy_extract(text, categories):
+    """Previous implementation: per-category alternation, compiled on every call"""
+    patterns = [r'\b(' + '|'.join(re.escape(term) for term in terms) + r')\b'
+                for terms in categories.values()]
+    found = []
+    for pattern in patterns:
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            if match.group(0) not in found:
+                found.append(match.group(0))
+    return found
+
+
+def make_snippets(count, seed=42):
+    """Generate search-result-sized snippets (~200 chars) with a few known terms"""
+    rng = random.Random(seed)
+    terms = [t for terms in list(TECHNOLOGY_CATEGORIES.values()) + list(SECURITY_CATEGORIES.values())
+             for t in terms]
+    snippets = []
+    for _ in range(count):
+        words = rng.choices(FILLER_WORDS, k=30) + rng.sample(terms, 3)
+        rng.shuffle(words)
+        snippets.append(' '.join(words))
+    return snippets
+
+
+def bench(label, func, snippets):
+    start = time.perf_counter()
+    for snippet in snippets:
+        func(snippet)
+    elapsed = time.perf_counter() - start
+    per_snippet_us = elapsed / len(snippets) * 1e6
+    print(f"  {label:<32} {elapsed * 1000:9.1f} ms total  {per_snippet_us:8.1f} µs/snippet")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    snippets = make_snippets(count)
+
+    print(f"Extracting from {count} snippets")
+    print()
+    print("Technologies:")
+    legacy = bench("legacy (per-category regex)", lambda s: legacy_extract(s, TECHNOLOGY_CATEGORIES), snippets)
+    current = bench("precompiled single pass", extract_technologies, snippets)
+    print(f"  speedup: {legacy / current:.1f}x")
+    print()
+    print("Security tools:")
+    legacy = bench("legacy (per-category regex)", lambda s: legacy_extract(s, SECURITY_CATEGORIES), snippets)
+    current = bench("precompiled single pass", extract_security_tools, snippets)
+    print(f"  speedup: {legacy / current:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
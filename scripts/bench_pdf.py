@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for PDF report rendering
+
+Compares the previous path (write markdown to disk, re-read it, rebuild
+styles per document) with rendering from the in-memory markdown string,
+serially and through the PdfRenderer process pool.
+
+Usage: python3 scripts/bench_pdf.py [num_documents] [workers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from demo_prep import MarkdownGenerator
+from pdf_renderer import PdfRenderer
+from convert_to_pdf import get_styles, markdown_to_pdf_bytes, parse_markdown_to_pdf
+
+
+def make_report(index):
+    """Research data shaped like a typical finished report"""
+    def result(kind, n):
+        return {'title': f'{kind} result {n}', 'url': f'https://example.com/{kind}/{n}',
+                'snippet': f'Snippet text for **{kind}** result {n} with some *context* words. ' * 3}
+
+    return {
+        'domain': f'company{index}.com',
+        'company_name': f'Company {index}',
+        'research_date': '2026-01-01 09:00:00',
+        'search_enabled': True,
+        'website_info': {'title': f'Company {index}', 'description': 'We build things. ' * 10,
+                         'about': 'About us. ' * 40},
+        'company_info': {
+            'linkedin': {'url': 'https://linkedin.com/company/x', 'snippet': 'LinkedIn snippet. ' * 5},
+            'crunchbase': {'url': 'https://crunchbase.com/x', 'snippet': 'Crunchbase snippet. ' * 5},
+            'about': [result('about', n) for n in range(3)],
+            'news': [result('news', n) for n in range(3)],
+        },
+        'contact_leads': [{'name': f'Contact {n}', 'title': 'Director', 'email': f'c{n}@example.com'}
+                          for n in range(3)],
+        'security_leadership': [{'name': f'Leader {n}', 'title': 'CISO',
+                                 'linkedin_url': f'https://linkedin.com/in/l{n}'} for n in range(5)],
+        'executive_leadership': [{'name': f'Exec {n}', 'title': 'CEO',
+                                  'linkedin_url': f'https://linkedin.com/in/e{n}'} for n in range(5)],
+        'tech_stack': [{'technology': f'Tech {n}', 'source': f'https://example.com/t/{n}',
+                        'context': 'Context sentence. ' * 4} for n in range(25)],
+        'security_vendors': [{'vendor': f'Vendor {n}', 'title': f'Vendor {n} case study',
+                              'source': f'https://example.com/v/{n}', 'context': 'Context. ' * 8}
+                             for n in range(15)],
+    }
+
+
+def report(label, count, elapsed):
+    print(f"  {label:<36} {elapsed:7.2f} s  {count / elapsed:7.1f} docs/s")
+    return elapsed
+
+
+def bench_legacy(documents, tmp_dir):
+    """Write markdown, re-read it from disk and rebuild styles for every document"""
+    start = time.perf_counter()
+    for index, md_text in enumerate(documents):
+        md_path = os.path.join(tmp_dir, f'legacy_{index}.md')
+        with open(md_path, 'w', encoding='utf-8') as f:
+            f.write(md_text)
+        get_styles.cache_clear()
+        parse_markdown_to_pdf(md_path, os.path.join(tmp_dir, f'legacy_{index}.pdf'))
+    return time.perf_counter() - start
+
+
+def bench_in_memory(documents):
+    start = time.perf_counter()
+    for md_text in documents:
+        markdown_to_pdf_bytes(md_text)
+    return time.perf_counter() - start
+
+
+def bench_pool(documents, tmp_dir, workers):
+    renderer = PdfRenderer(max_workers=workers)
+    # Start the workers before timing so pool startup isn't counted
+    renderer.submit_bytes(documents[0]).result()
+    start = time.perf_counter()
+    futures = [renderer.submit(md_text, os.path.join(tmp_dir, f'pool_{index}.pdf'))
+               for index, md_text in enumerate(documents)]
+    for future in futures:
+        future.result()
+    elapsed = time.perf_counter() - start
+    renderer.shutdown()
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 2
+    documents = [MarkdownGenerator.render(make_report(index)) for index in range(count)]
+
+    print(f"Rendering {count} reports (~{len(documents[0]) // 1024} KB markdown each)")
+    print()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy = report("disk round-trip, styles per doc", count, bench_legacy(documents, tmp_dir))
+        serial = report("in-memory, cached styles", count, bench_in_memory(documents))
+        pooled = report(f"process pool ({workers} workers)", count, bench_pool(documents, tmp_dir, workers))
+    print()
+    print(f"  speedup: {legacy / serial:.1f}x serial, {legacy / pooled:.1f}x pooled")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark for CompanyResearcher, offline
+
+Runs every research phase against a local replay server (replay.py) with
+injected network latency and reports wall time, Google API queries, website
+requests and peak Python memory (tracemalloc, which adds some overhead of its
+own) per company. Caches, quota and the research store live in a temporary
+directory, so runs are cold unless --warm is given.
+
+Companies come from recorded fixtures (--fixtures DIR, one <domain>.json per
+company, made with --record) or, by default, from synthetic companies whose
+search results and website pages are generated deterministically.
+
+Usage:
+    python3 scripts/bench_research.py [--latency 0.15] [--jitter 0.05] [--warm]
+    python3 scripts/bench_research.py --fixtures fixtures/
+    python3 scripts/bench_research.py --record fixtures/ epic.com crowdstrike.com   # live, spends API quota
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from demo_prep import CompanyResearcher, WebSearcher
+from extractors import SECURITY_CATEGORIES, TECHNOLOGY_CATEGORIES
+from http_cache import get_default_http_cache
+from quota import QuotaTracker
+from replay import FixtureStore, ReplayServer, recording_session
+from search_cache import SearchCache
+from security_vendors import get_vendors_by_priority
+
+SEARCH_HOST = 'www.googleapis.com'
+
+# (domain, company name, share of searches that find something, website pages)
+SYNTHETIC_COMPANIES = [
+    ('acme-widgets.test', 'Acme Widgets', 0.2, 3),
+    ('globex.test', 'Globex', 0.5, 8),
+    ('initech.test', 'Initech', 0.8, 12),
+]
+
+TECH_TERMS = [term for terms in TECHNOLOGY_CATEGORIES.values() for term in terms]
+SECURITY_TERMS = [term for terms in SECURITY_CATEGORIES.values() for term in terms]
+FIRST_NAMES = "Alex Sam Jordan Taylor Morgan Casey Riley Jamie Avery Quinn".split()
+LAST_NAMES = "Nguyen Patel Garcia Smith Kim Okafor Rossi Novak Silva Chen".split()
+
+
+def synthetic_fallback(domain, company_name, hit_rate, site_pages):
+    """Deterministic stand-in for Google API answers and the company's website"""
+    site_paths = ['/', '/about', '/about-us', '/company', '/security', '/trust', '/careers'][:site_pages]
+
+    def respond(url):
+        parts = urlsplit(url)
+        rng = random.Random(url)
+        if parts.netloc == SEARCH_HOST:
+            params = parse_qs(parts.query)
+            query = params.get('q', [''])[0]
+            num = int(params.get('num', ['5'])[0])
+            items = [search_item(query, rng, i) for i in range(num) if rng.random() < hit_rate]
+            return json_response({'items': items})
+        if parts.netloc.endswith(domain):
+            if (parts.path or '/') in site_paths:
+                return html_response(site_page(parts.path, rng))
+            return {'status': 404, 'headers': {'content-type': 'text/plain'}, 'body': b'not found'}
+        return None
+
+    def search_item(query, rng, index):
+        if 'site:linkedin.com/in' in query:
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            role = query.rsplit('"', 2)[-2] if query.count('"') >= 4 else 'Director'
+            slug = name.lower().replace(' ', '-') + f"-{rng.randint(100, 999)}"
+            return {'title': f"{name} - {role} - {company_name} | LinkedIn",
+                    'link': f"https://www.linkedin.com/in/{slug}",
+                    'snippet': f"{role} at {company_name}. {name} leads a team of {rng.randint(3, 40)}."}
+        # Batched vendor queries name several vendors; a result mentions one of them
+        vendors = [v for v in get_vendors_by_priority() if f'"{v}"' in query]
+        vendor = (vendors[0] if len(vendors) == 1 else rng.choice(vendors)) if vendors else None
+        terms = rng.sample(TECH_TERMS, 3) + rng.sample(SECURITY_TERMS, 2)
+        mention = f"{company_name} works with {vendor}. " if vendor else f"{company_name} uses "
+        return {'title': f"{company_name} result {index} for {query[:40]}",
+                'link': f"https://example.test/{rng.randint(0, 10 ** 8)}",
+                'snippet': mention + ', '.join(terms) + '.'}
+
+    def site_page(path, rng):
+        paragraphs = ''.join(f"<p>{company_name} runs on {', '.join(rng.sample(TECH_TERMS, 4))}.</p>"
+                             for _ in range(40))
+        return (f"<html><head><title>{company_name} {path}</title>"
+                f'<meta name="description" content="{company_name} makes things."></head>'
+                f"<body><div><p>About {company_name}: we build software.</p>{paragraphs}</div></body></html>")
+
+    return respond
+
+
+def json_response(payload):
+    return {'status': 200, 'headers': {'content-type': 'application/json'},
+            'body': json.dumps(payload).encode('utf-8')}
+
+
+def html_response(html):
+    return {'status': 200, 'headers': {'content-type': 'text/html; charset=utf-8'}, 'body': html.encode('utf-8')}
+
+
+def research(domain, company_name, web_searcher):
+    """Run every research phase; returns (seconds, peak bytes, data)"""
+    researcher = CompanyResearcher(domain, web_searcher=web_searcher, company_name_override=company_name)
+    tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        researcher.run_all()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, researcher.data
+
+
+def bench_company(domain, company_name, store, fallback, args, workdir):
+    with ReplayServer(store, latency=args.latency, jitter=args.jitter, fallback=fallback) as server:
+        search_cache = SearchCache(Path(workdir) / 'search_cache.sqlite3')
+        search_cache.clear()
+        http_cache = get_default_http_cache()
+        if http_cache:
+            http_cache.clear()
+        web_searcher = WebSearcher(api_key='replay', search_engine_id='replay', session=server.session(),
+                                   cache=search_cache, use_cache=not args.no_cache,
+                                   quota=QuotaTracker(Path(workdir) / 'quota.sqlite3'),
+                                   max_workers=args.workers)
+
+        if args.warm:
+            research(domain, company_name, web_searcher)
+            server.reset_counts()
+        elapsed, peak, data = research(domain, company_name, web_searcher)
+
+        queries = server.request_count(SEARCH_HOST)
+        return {
+            'company': company_name or domain,
+            'seconds': elapsed,
+            'queries': queries,
+            'web_requests': server.request_count() - queries,
+            'peak_mb': peak / 1024 / 1024,
+            'found': sum(len(data[key]) for key in ('tech_stack', 'security_tools', 'security_vendors',
+                                                    'security_leadership', 'executive_leadership')),
+            'missing_fixtures': len(server.misses),
+        }
+
+
+def record(args):
+    """Research each domain live and save its traffic to <dir>/<domain>.json"""
+    os.environ['HTTP_CACHE_DISABLED'] = '1'  # every page must actually be requested to be recorded
+    for domain in args.domains:
+        store = FixtureStore()
+        web_searcher = WebSearcher(session=recording_session(store), use_cache=False)
+        if not web_searcher.api_key:
+            sys.exit("Recording needs GOOGLE_API_KEY and GOOGLE_SEARCH_ENGINE_ID")
+        print(f"Recording {domain}...")
+        CompanyResearcher(domain, web_searcher=web_searcher).run_all()
+        path = Path(args.record) / f"{domain}.json"
+        store.save(path)
+        print(f"  {len(store)} responses -> {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline end-to-end research benchmark')
+    parser.add_argument('domains', nargs='*', help='Domains to record (with --record)')
+    parser.add_argument('--record', metavar='DIR', help='Record live traffic for the given domains into DIR')
+    parser.add_argument('--fixtures', metavar='DIR', help='Replay recorded fixtures from DIR instead of synthetic companies')
+    parser.add_argument('--latency', type=float, default=0.15, help='Injected seconds per request (default 0.15)')
+    parser.add_argument('--jitter', type=float, default=0.05, help='Random +/- seconds added to latency (default 0.05)')
+    parser.add_argument('--workers', type=int, help='Concurrent searches (default: SEARCH_MAX_WORKERS)')
+    parser.add_argument('--warm', action='store_true', help='Research each company twice and report the second run')
+    parser.add_argument('--no-cache', action='store_true', help='Disable the search result cache')
+    args = parser.parse_args()
+
+    if args.record:
+        record(args)
+        return
+
+    workdir = tempfile.mkdtemp(prefix='bench_research_')
+    os.environ.update({
+        'HTTP_CACHE_PATH': str(Path(workdir) / 'http_cache.sqlite3'),
+        'RESEARCH_STORE_PATH': str(Path(workdir) / 'research_store.sqlite3'),
+        'SEARCH_QPS': '0',
+    })
+    os.environ.pop('RESEARCH_QUERY_BUDGET', None)
+
+    if args.fixtures:
+        companies = []
+        for path in sorted(Path(args.fixtures).glob('*.json')):
+            companies.append((path.stem, None, FixtureStore.load(path), None))
+    else:
+        companies = [(domain, name, FixtureStore(), synthetic_fallback(domain, name, hit_rate, pages))
+                     for domain, name, hit_rate, pages in SYNTHETIC_COMPANIES]
+
+    print(f"Latency {args.latency * 1000:.0f}ms +/- {args.jitter * 1000:.0f}ms, "
+          f"{'warm' if args.warm else 'cold'} caches")
+    print(f"  {'Company':<20} {'Wall':>8} {'Queries':>8} {'Web req':>8} {'Peak MB':>8} {'Found':>6}")
+    total = 0.0
+    for domain, name, store, fallback in companies:
+        result = bench_company(domain, name, store, fallback, args, workdir)
+        total += result['seconds']
+        line = (f"  {result['company']:<20} {result['seconds']:>7.2f}s {result['queries']:>8} "
+                f"{result['web_requests']:>8} {result['peak_mb']:>8.1f} {result['found']:>6}")
+        if result['missing_fixtures']:
+            line += f"  ({result['missing_fixtures']} requests had no fixture)"
+        print(line)
+    print(f"  {'Total':<20} {total:>7.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark for homepage scraping (parse + title/description/about extraction)
+
+Compares the previous approach (full html.parser tree, then a find() that
+re-reads each p/div's full text per keyword) with website_scraper
+(strained parse with the fastest parser, single-pass about lookup) on
+synthetic homepages shaped like large real-world ones: deep wrapper divs,
+mega-menus, inline scripts/styles and a late "about" block.
+
+Usage: python3 scripts/bench_scraper.py [page_kb ...]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from website_scraper import HTML_PARSER, extract_homepage_info, parse_html
+
+WORDS = ("platform customers teams secure cloud data enterprise solutions trusted "
+         "global modern scale build deliver partners industry leading innovation").split()
+
+
+def make_homepage(target_kb, depth=25, with_about=True, seed=7):
+    """Generate a homepage of roughly target_kb kilobytes, optionally with an about block"""
+    rng = random.Random(seed)
+
+    def sentence(n=18):
+        return ' '.join(rng.choices(WORDS, k=n)).capitalize() + '.'
+
+    parts = [
+        '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Example Corp | Home</title>',
+        '<meta name="description" content="Example Corp builds secure cloud platforms.">',
+        '<style>' + '.c{color:red}' * 2000 + '</style>',
+        '<script>' + 'var x = "about us";' * 2000 + '</script></head><body>',
+    ]
+    # Layout wrappers: every block below sits inside `depth` nested divs
+    parts.append('<div class="wrap">' * depth)
+    parts.append('<nav><ul>' + ''.join(f'<li><a href="/p{i}">{sentence(3)}</a></li>' for i in range(300))
+                 + '</ul></nav>')
+
+    body = []
+    size = sum(map(len, parts))
+    while size < target_kb * 1024 * 0.9:
+        block = (f'<section><div class="card"><div class="inner"><h3>{sentence(4)}</h3>'
+                 f'<p>{sentence()}</p><p>{sentence()}</p></div></div></section>')
+        body.append(block)
+        size += len(block)
+    # The about block comes late, as it usually does on marketing homepages
+    if with_about:
+        body.insert(int(len(body) * 0.8),
+                    '<section><div class="about"><h2>Who we are</h2><p>About Example Corp: '
+                    + sentence(40) + '</p></div></section>')
+    parts.extend(body)
+    parts.append('</div>' * depth + '<footer><p>' + sentence() + '</p></footer></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def legacy_extract(html):
+    """Previous research_website parsing and lookup"""
+    soup = BeautifulSoup(html.decode('utf-8'), 'html.parser')
+    info = {}
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    if meta_desc:
+        info['description'] = meta_desc.get('content', '')
+    title = soup.find('title')
+    if title:
+        info['title'] = title.text.strip()
+    for keyword in ['about', 'what we do', 'who we are']:
+        about_section = soup.find(lambda tag: tag.name in ['p', 'div'] and keyword in tag.text.lower())
+        if about_section:
+            info['about'] = about_section.text.strip()[:500]
+            break
+    return info
+
+
+def bench(label, func, html, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(html)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"    {label:<34} {elapsed * 1000:9.1f} ms/page")
+    return elapsed, result
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100, 500, 1500]
+    print(f"Parser: {HTML_PARSER}")
+    for kb in sizes:
+        for with_about in (True, False):
+            html = make_homepage(kb, with_about=with_about)
+            repeat = 3 if kb < 1000 else 1
+            print(f"\n  {len(html) // 1024} KB homepage, {'with' if with_about else 'without'} about text")
+            legacy, legacy_info = bench("legacy (full parse, find per tag)", legacy_extract, html, repeat)
+            current, info = bench("strained parse, single pass",
+                                  lambda body: extract_homepage_info(parse_html(body)), html, repeat)
+            print(f"    speedup: {legacy / current:.1f}x  same result: {info == legacy_info}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,8 @@ Convert markdown demo prep files to PDF using ReportLab
 
 import sys
 import re
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -14,20 +16,86 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 
 
+# Precompiled inline formatting patterns
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)')
+BOLD_PATTERN = re.compile(r'\*\*([^\*]+)\*\*')
+ITALIC_PATTERN = re.compile(r'\*([^\*]+)\*')
+
+
+@lru_cache(maxsize=None)
+def get_styles():
+    """Build the paragraph styles once per process"""
+    styles = getSampleStyleSheet()
+
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=HexColor('#2c3e50'),
+            spaceAfter=30,
+            spaceBefore=0
+        ),
+        'heading2': ParagraphStyle(
+            'CustomHeading2',
+            parent=styles['Heading2'],
+            fontSize=18,
+            textColor=HexColor('#34495e'),
+            spaceAfter=12,
+            spaceBefore=20,
+            borderWidth=1,
+            borderColor=HexColor('#e0e0e0'),
+            borderPadding=5
+        ),
+        'heading3': ParagraphStyle(
+            'CustomHeading3',
+            parent=styles['Heading3'],
+            fontSize=14,
+            textColor=HexColor('#555555'),
+            spaceAfter=10,
+            spaceBefore=15
+        ),
+        'body': ParagraphStyle(
+            'CustomBody',
+            parent=styles['BodyText'],
+            fontSize=11,
+            textColor=HexColor('#333333'),
+            spaceAfter=10,
+            leading=16
+        ),
+        'bullet': ParagraphStyle(
+            'CustomBullet',
+            parent=styles['BodyText'],
+            fontSize=11,
+            textColor=HexColor('#333333'),
+            leftIndent=20,
+            spaceAfter=8,
+            leading=16
+        ),
+    }
+
+
 def parse_markdown_to_pdf(md_file_path, pdf_file_path=None):
-    """Convert markdown to PDF with basic formatting"""
+    """Convert a markdown file to PDF with basic formatting"""
 
     # Read markdown file
     with open(md_file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+        md_text = f.read()
 
     # Set default PDF output path
     if pdf_file_path is None:
         pdf_file_path = Path(md_file_path).with_suffix('.pdf')
 
+    markdown_to_pdf(md_text, pdf_file_path)
+    return pdf_file_path
+
+
+def markdown_to_pdf(md_text, pdf_file_path):
+    """Convert a markdown string to a PDF file path or binary file-like object"""
+
     # Create PDF
     doc = SimpleDocTemplate(
-        str(pdf_file_path),
+        pdf_file_path if hasattr(pdf_file_path, 'write') else str(pdf_file_path),
         pagesize=letter,
         rightMargin=72,
         leftMargin=72,
@@ -35,63 +103,32 @@ def parse_markdown_to_pdf(md_file_path, pdf_file_path=None):
         bottomMargin=72
     )
 
-    # Define styles
-    styles = getSampleStyleSheet()
+    # Build PDF
+    doc.build(build_story(md_text))
 
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=HexColor('#2c3e50'),
-        spaceAfter=30,
-        spaceBefore=0
-    )
+    return pdf_file_path
 
-    heading2_style = ParagraphStyle(
-        'CustomHeading2',
-        parent=styles['Heading2'],
-        fontSize=18,
-        textColor=HexColor('#34495e'),
-        spaceAfter=12,
-        spaceBefore=20,
-        borderWidth=1,
-        borderColor=HexColor('#e0e0e0'),
-        borderPadding=5
-    )
 
-    heading3_style = ParagraphStyle(
-        'CustomHeading3',
-        parent=styles['Heading3'],
-        fontSize=14,
-        textColor=HexColor('#555555'),
-        spaceAfter=10,
-        spaceBefore=15
-    )
+def markdown_to_pdf_bytes(md_text) -> bytes:
+    """Convert a markdown string to PDF bytes without touching disk"""
+    buffer = BytesIO()
+    markdown_to_pdf(md_text, buffer)
+    return buffer.getvalue()
 
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontSize=11,
-        textColor=HexColor('#333333'),
-        spaceAfter=10,
-        leading=16
-    )
 
-    bullet_style = ParagraphStyle(
-        'CustomBullet',
-        parent=styles['BodyText'],
-        fontSize=11,
-        textColor=HexColor('#333333'),
-        leftIndent=20,
-        spaceAfter=8,
-        leading=16
-    )
+def build_story(md_text):
+    """Convert markdown text to a list of ReportLab flowables"""
+    styles = get_styles()
+    title_style = styles['title']
+    heading2_style = styles['heading2']
+    heading3_style = styles['heading3']
+    body_style = styles['body']
+    bullet_style = styles['bullet']
 
     # Build document content
     story = []
 
-    for line in lines:
+    for line in md_text.splitlines():
         line = line.rstrip()
 
         if not line:
@@ -146,25 +183,23 @@ def parse_markdown_to_pdf(md_file_path, pdf_file_path=None):
             if text.strip():
                 story.append(Paragraph(text, body_style))
 
-    # Build PDF
-    doc.build(story)
-
-    return pdf_file_path
+    return story
 
 
 def convert_markdown_links(text):
     """Convert markdown links [text](url) to HTML links"""
-    # Pattern: [text](url)
-    pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-    return re.sub(pattern, r'<a href="\2" color="blue">\1</a>', text)
+    if '](' not in text:
+        return text
+    return LINK_PATTERN.sub(r'<a href="\2" color="blue">\1</a>', text)
 
 
 def convert_markdown_formatting(text):
     """Convert markdown bold and italic to HTML"""
-    # Convert **bold**
-    text = re.sub(r'\*\*([^\*]+)\*\*', r'<b>\1</b>', text)
-    # Convert *italic*
-    text = re.sub(r'\*([^\*]+)\*', r'<i>\1</i>', text)
+    if '*' in text:
+        # Convert **bold**
+        text = BOLD_PATTERN.sub(r'<b>\1</b>', text)
+        # Convert *italic*
+        text = ITALIC_PATTERN.sub(r'<i>\1</i>', text)
     # Convert links
     text = convert_markdown_links(text)
     return text
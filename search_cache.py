@@ -0,0 +1,202 @@
+"""
+Persistent cache for Google Custom Search results
+SQLite-backed, with per-category TTLs and size-bounded LRU eviction
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / '.cache' / 'search_cache.sqlite3'
+
+# Maximum cached queries before least-recently-used entries are evicted
+DEFAULT_MAX_ENTRIES = 20000
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# How long results stay fresh, by query category
+CATEGORY_TTLS = {
+    'news': 12 * HOUR,
+    'jobs': 3 * DAY,
+    'linkedin_profile': 30 * DAY,
+    'company_profile': 14 * DAY,
+    'vendor': 7 * DAY,
+    'general': 7 * DAY,
+}
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookups (case and whitespace insensitive)"""
+    return re.sub(r'\s+', ' ', query).strip().lower()
+
+
+def classify_query(query: str) -> str:
+    """Return the category used to pick a TTL for a search query"""
+    q = normalize_query(query)
+    if ' news' in q:
+        return 'news'
+    if 'site:linkedin.com/in' in q:
+        return 'linkedin_profile'
+    if 'site:linkedin.com/jobs' in q or 'site:indeed.com' in q or 'site:glassdoor.com' in q or 'careers' in q:
+        return 'jobs'
+    if 'site:linkedin.com/company' in q or 'site:crunchbase.com' in q:
+        return 'company_profile'
+    if re.fullmatch(r'"[^"]+" "[^"]+"', q) or re.fullmatch(r'"[^"]+" \("[^"]+"(?: or "[^"]+")*\)', q):
+        return 'vendor'
+    return 'general'
+
+
+def cache_key(query: str, start: int = 1, engine_id: str = '') -> str:
+    """
+    Normalized query, tagged with the search engine it was sent to and, for
+    pages past the first, the result offset (num is a separate key column)
+    """
+    key = f"[{engine_id}] {normalize_query(query)}" if engine_id else normalize_query(query)
+    return key if start == 1 else f"{key} #start={start}"
+
+
+class SearchCache:
+    """
+    Thread-safe persistent cache of search results keyed on (search engine,
+    query, num, start), so changing GOOGLE_SEARCH_ENGINE_ID never serves
+    another engine's results
+    """
+
+    def __init__(self, path=None, max_entries: Optional[int] = None, ttls: Optional[Dict[str, int]] = None):
+        """
+        Open (or create) a search cache
+
+        Args:
+            path: SQLite file path (default: SEARCH_CACHE_PATH env var or .cache/search_cache.sqlite3)
+            max_entries: Size bound for LRU eviction (default: SEARCH_CACHE_MAX_ENTRIES env var or 20000)
+            ttls: Per-category TTL overrides in seconds
+        """
+        self.path = Path(path or os.environ.get('SEARCH_CACHE_PATH', DEFAULT_CACHE_PATH))
+        self.max_entries = max_entries or int(os.environ.get('SEARCH_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES))
+        self.ttls = dict(CATEGORY_TTLS, **(ttls or {}))
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS search_results (
+                query TEXT NOT NULL,
+                num INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                results TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (query, num)
+            )
+        ''')
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_search_results_last_access ON search_results (last_access)'
+        )
+        self._conn.commit()
+
+    def get(self, query: str, num: int, start: int = 1, engine_id: str = '') -> Optional[List[Dict]]:
+        """Return cached results if present and fresh, otherwise None"""
+        key = cache_key(query, start, engine_id)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT category, results, created_at FROM search_results WHERE query = ? AND num = ?',
+                (key, num)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            category, results, created_at = row
+            if now - created_at > self.ttls.get(category, CATEGORY_TTLS['general']):
+                self._conn.execute('DELETE FROM search_results WHERE query = ? AND num = ?', (key, num))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                'UPDATE search_results SET last_access = ? WHERE query = ? AND num = ?',
+                (now, key, num)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(results)
+
+    def put(self, query: str, num: int, results: List[Dict], start: int = 1, engine_id: str = ''):
+        """Store results for a query, evicting least-recently-used entries past max_entries"""
+        key = cache_key(query, start, engine_id)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO search_results VALUES (?, ?, ?, ?, ?, ?)',
+                (key, num, classify_query(query), json.dumps(results), now, now)
+            )
+            count = self._conn.execute('SELECT COUNT(*) FROM search_results').fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute('''
+                    DELETE FROM search_results WHERE rowid IN (
+                        SELECT rowid FROM search_results ORDER BY last_access LIMIT ?
+                    )
+                ''', (count - self.max_entries,))
+            self._conn.commit()
+
+    def is_fresh(self, query: str, num: int, start: int = 1, engine_id: str = '') -> bool:
+        """Check whether a query has a fresh cached answer without counting a hit or miss"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT category, created_at FROM search_results WHERE query = ? AND num = ?',
+                (cache_key(query, start, engine_id), num)
+            ).fetchone()
+        if row is None:
+            return False
+        category, created_at = row
+        return time.time() - created_at <= self.ttls.get(category, CATEGORY_TTLS['general'])
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            self._conn.execute('DELETE FROM search_results')
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters for this process and the current entry count"""
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM search_results').fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries,
+        }
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> Optional[SearchCache]:
+    """Return the process-wide cache, or None when SEARCH_CACHE_DISABLED is set"""
+    global _default_cache
+
+    if os.environ.get('SEARCH_CACHE_DISABLED', '').lower() in ('1', 'true', 'yes'):
+        return None
+
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = SearchCache()
+    return _default_cache
@@ -94,12 +94,24 @@ SECURITY_VENDORS = [
     "SonicWall",
 ]
 
+# Most commonly deployed vendors, checked first when query budget is limited
+PRIORITY_VENDORS = [
+    "CrowdStrike", "Splunk", "CyberArk", "Okta", "Palo Alto Networks",
+    "Fortinet", "Proofpoint", "Tenable", "Rapid7", "SentinelOne",
+    "Wiz", "Zscaler", "Mimecast", "Varonis", "Recorded Future"
+]
+
 
 def get_security_vendors():
     """Return the list of security vendors"""
     return SECURITY_VENDORS
 
 
+def get_vendors_by_priority():
+    """Return all security vendors, priority vendors first"""
+    return PRIORITY_VENDORS + [v for v in SECURITY_VENDORS if v not in PRIORITY_VENDORS]
+
+
 def add_vendor(vendor_name):
     """Add a new vendor to the list"""
     if vendor_name not in SECURITY_VENDORS:
@@ -0,0 +1,55 @@
+"""
+Request coalescing ("single-flight") for duplicate in-flight work
+Concurrent callers asking for the same key share one execution and its result
+"""
+
+import threading
+from typing import Callable, Hashable, Tuple
+
+
+class _Call:
+    """One in-flight execution that other callers can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread-safe group of keyed in-flight calls"""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable) -> Tuple[object, bool]:
+        """
+        Run func() unless a call for key is already in flight, in which case
+        wait for that call and share its outcome
+
+        Returns:
+            (result, shared) - shared is True if this caller reused another
+            caller's execution. Exceptions are re-raised to every caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+        else:
+            try:
+                call.result = func()
+            except Exception as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if call.error is not None:
+            raise call.error
+        return call.result, not leader
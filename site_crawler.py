@@ -0,0 +1,267 @@
+"""
+Bounded multi-page crawl of a company website
+Fetches the homepage plus likely high-value pages (about, security, trust,
+careers, matching sitemap entries) concurrently, politely and within a
+byte/time budget
+"""
+
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from http_cache import get_default_http_cache
+from website_scraper import extract_homepage_info, fetch_page, parse_html
+
+# Paths fetched on every crawl, homepage first
+DEFAULT_PATHS = ['/', '/about', '/about-us', '/company', '/security', '/trust', '/careers']
+
+# Sitemap entries are crawled if their path mentions one of these
+SITEMAP_KEYWORDS = ('about', 'security', 'trust', 'careers', 'jobs', 'compliance', 'company', 'technology')
+
+# Pages fetched per crawl, including the homepage
+DEFAULT_MAX_PAGES = 12
+
+# Sitemap entries added on top of DEFAULT_PATHS
+MAX_SITEMAP_PAGES = 5
+
+# Bytes downloaded per crawl, across all pages
+DEFAULT_MAX_CRAWL_BYTES = 6 * 1024 * 1024
+
+# Seconds per crawl, across all pages
+DEFAULT_CRAWL_TIME_BUDGET = 20
+
+# Connections open to one host at a time
+DEFAULT_PER_HOST_CONNECTIONS = 2
+
+# Characters of visible text kept per page
+MAX_PAGE_TEXT = 20000
+
+# Sent with every crawl request and matched against robots.txt User-agent
+# lines (by its 'DemoPrep' product token), so site owners can address it
+CRAWLER_USER_AGENT = 'DemoPrep/1.0'
+CRAWL_HEADERS = {'User-Agent': CRAWLER_USER_AGENT}
+
+LOC_PATTERN = re.compile(r'<loc>\s*([^<\s]+)\s*</loc>', re.IGNORECASE)
+
+
+class CrawlBudget:
+    """
+    Thread-safe byte and time allowance shared by a crawl's fetches
+
+    Each download reserves its byte cap up front, so concurrent fetches can
+    never read more than the budget between them.
+    """
+
+    def __init__(self, max_bytes: int, seconds: float, workers: int = 1):
+        """
+        Args:
+            max_bytes: Bytes the whole crawl may download
+            seconds: Time the whole crawl may take
+            workers: Downloads that may run at once; each reservation takes
+                at most an equal share of the bytes left
+        """
+        self.bytes_left = max_bytes  # neither downloaded nor reserved
+        self.deadline = time.monotonic() + seconds
+        self.workers = max(1, workers)
+        self._lock = threading.Lock()
+
+    def exhausted(self) -> bool:
+        return self.bytes_left <= 0 or time.monotonic() >= self.deadline
+
+    def reserve(self, limit: Optional[int] = None) -> int:
+        """Set aside bytes for one download (at most limit); 0 once the budget is spent"""
+        with self._lock:
+            if self.bytes_left <= 0 or time.monotonic() >= self.deadline:
+                return 0
+            count = max(1, self.bytes_left // self.workers)
+            if limit is not None:
+                count = min(count, limit)
+            self.bytes_left -= count
+            return count
+
+    def release(self, count: int):
+        """Give back reserved bytes a download did not use"""
+        with self._lock:
+            self.bytes_left += count
+
+
+class SiteCrawler:
+    """Crawl a handful of high-value pages of a company website"""
+
+    def __init__(self, session: requests.Session, max_pages: Optional[int] = None,
+                 max_bytes: Optional[int] = None, time_budget: Optional[float] = None,
+                 per_host_connections: int = DEFAULT_PER_HOST_CONNECTIONS, cache=None):
+        """
+        Args:
+            session: HTTP session to use
+            max_pages: Pages per crawl (default: CRAWL_MAX_PAGES env var or 12)
+            max_bytes: Bytes per crawl (default: CRAWL_MAX_BYTES env var or 6 MB)
+            time_budget: Seconds per crawl (default: CRAWL_TIME_BUDGET env var or 20)
+            per_host_connections: Concurrent requests to one host
+            cache: HTTP cache (default: the persistent cache, unless HTTP_CACHE_DISABLED is set)
+        """
+        self.session = session
+        self.max_pages = max_pages if max_pages is not None else int(
+            os.environ.get('CRAWL_MAX_PAGES', DEFAULT_MAX_PAGES))
+        self.max_bytes = max_bytes or int(os.environ.get('CRAWL_MAX_BYTES', DEFAULT_MAX_CRAWL_BYTES))
+        self.time_budget = time_budget or float(os.environ.get('CRAWL_TIME_BUDGET', DEFAULT_CRAWL_TIME_BUDGET))
+        self.per_host_connections = per_host_connections
+        self.cache = cache if cache is not None else get_default_http_cache()
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+
+    def crawl(self, domain: str) -> Dict:
+        """
+        Crawl a company website
+
+        Args:
+            domain: Company domain (crawled over https), or a base URL
+
+        Returns:
+            {'homepage': title/description/about of the homepage,
+             'pages': [{'url', 'title', 'text'}, ...] for every page fetched,
+             'bytes': bytes downloaded}
+        Raises the homepage's fetch error if the homepage itself fails.
+        """
+        base = domain if '://' in domain else f"https://{domain}"
+        budget = CrawlBudget(self.max_bytes, self.time_budget, workers=self.per_host_connections * 2)
+        robots = self._read_robots(base, budget)
+
+        paths = DEFAULT_PATHS[:max(1, self.max_pages)]
+        urls = [urljoin(base, path) for path in paths]
+
+        with ThreadPoolExecutor(max_workers=self.per_host_connections * 2) as executor:
+            sitemap = executor.submit(self._sitemap_urls, base, robots, budget)
+            futures = [executor.submit(self._fetch, url, robots, budget) for url in urls]
+
+            extra = [url for url in sitemap.result()
+                     if url.rstrip('/') not in {u.rstrip('/') for u in urls}]
+            extra = extra[:max(0, min(MAX_SITEMAP_PAGES, self.max_pages - len(urls)))]
+            futures += [executor.submit(self._fetch, url, robots, budget) for url in extra]
+
+            homepage_error = futures[0].exception()
+            if homepage_error is not None:
+                raise homepage_error
+            results = [future.result() for future in futures[1:] if future.exception() is None]
+
+        homepage_soup, homepage = futures[0].result()
+        pages = []
+        seen_urls = set()
+        for soup, page in [(homepage_soup, homepage)] + results:
+            # /about and /about-us often redirect to the same page
+            if soup is None or page.url in seen_urls:
+                continue
+            seen_urls.add(page.url)
+            title = soup.find('title')
+            pages.append({
+                'url': page.url,
+                'title': title.get_text().strip() if title else '',
+                'text': soup.get_text(' ', strip=True)[:MAX_PAGE_TEXT],
+            })
+
+        return {
+            'homepage': extract_homepage_info(homepage_soup) if homepage_soup is not None else {},
+            'pages': pages,
+            'bytes': self.max_bytes - budget.bytes_left,
+        }
+
+    def _fetch(self, url: str, robots: RobotFileParser, budget: CrawlBudget):
+        """Fetch and parse one page; returns (soup or None, page or None)"""
+        if budget.exhausted() or not robots.can_fetch(CRAWLER_USER_AGENT, url):
+            return None, None
+
+        with self._host_slot(urlparse(url).netloc):
+            page = self._download(url, budget)
+
+        if page is None:
+            return None, None
+        if not page.is_html:
+            return None, page
+        return parse_html(page.body, page.encoding, parse_only=None), page
+
+    def _download(self, url: str, budget: CrawlBudget, limit: Optional[int] = None):
+        """fetch_page() capped at bytes reserved from the crawl budget; None once the budget is spent"""
+        reserved = budget.reserve(limit)
+        if not reserved:
+            return None
+
+        used = 0
+        try:
+            page = fetch_page(self.session, url, max_bytes=reserved, deadline=budget.deadline,
+                              headers=CRAWL_HEADERS, cache=self.cache)
+            if not page.from_cache:
+                used = len(page.body)
+            return page
+        finally:
+            budget.release(reserved - used)
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._host_slots_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.per_host_connections)
+            return self._host_slots[host]
+
+    def _read_robots(self, base: str, budget: CrawlBudget) -> RobotFileParser:
+        """Parse robots.txt; a missing file allows everything, 401/403 disallows everything"""
+        robots = RobotFileParser(urljoin(base, '/robots.txt'))
+        try:
+            page = self._download(robots.url, budget, limit=512 * 1024)
+            if page is None:
+                robots.allow_all = True
+            else:
+                robots.parse(page.body.decode('utf-8', errors='replace').splitlines())
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code in (401, 403):
+                robots.disallow_all = True
+            else:
+                robots.allow_all = True
+        except requests.RequestException:
+            robots.allow_all = True
+        return robots
+
+    def _sitemap_urls(self, base: str, robots: RobotFileParser, budget: CrawlBudget) -> List[str]:
+        """High-value same-site pages listed in the sitemap, shortest paths first"""
+        sitemaps = robots.site_maps() or [urljoin(base, '/sitemap.xml')]
+        host = urlparse(base).netloc.lower()
+        site = host[4:] if host.startswith('www.') else host
+
+        locs = []
+        for sitemap_url in sitemaps[:2]:
+            locs += self._read_sitemap(sitemap_url, budget)
+
+        candidates = []
+        for url in dict.fromkeys(locs):
+            parsed = urlparse(url)
+            page_host = parsed.netloc.lower()
+            if not (page_host == site or page_host.endswith('.' + site)):
+                continue
+            path = parsed.path.lower()
+            if any(keyword in path for keyword in SITEMAP_KEYWORDS) and robots.can_fetch(CRAWLER_USER_AGENT, url):
+                candidates.append(url)
+        return sorted(candidates, key=lambda url: (urlparse(url).path.count('/'), len(url)))
+
+    def _read_sitemap(self, url: str, budget: CrawlBudget, nested: bool = True) -> List[str]:
+        """<loc> entries of a sitemap, following a sitemap index one level down"""
+        if url.endswith('.gz'):
+            return []
+        try:
+            page = self._download(url, budget, limit=1024 * 1024)
+        except requests.RequestException:
+            return []
+        if page is None:
+            return []
+
+        text = page.body.decode('utf-8', errors='replace')
+        locs = LOC_PATTERN.findall(text)
+        if nested and '<sitemapindex' in text:
+            # Page sitemaps are usually the ones with "page" in the name
+            children = sorted(locs, key=lambda loc: 'page' not in loc.lower())[:2]
+            return [loc for child in children for loc in self._read_sitemap(child, budget, nested=False)]
+        return locs
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """Keep caches, quota and stores of every test in its own directory"""
+    monkeypatch.setenv('SEARCH_CACHE_PATH', str(tmp_path / 'search_cache.sqlite3'))
+    monkeypatch.setenv('HTTP_CACHE_PATH', str(tmp_path / 'http_cache.sqlite3'))
+    monkeypatch.setenv('RESEARCH_STORE_PATH', str(tmp_path / 'research_store.sqlite3'))
+    monkeypatch.setenv('QUOTA_PATH', str(tmp_path / 'quota.sqlite3'))
+    monkeypatch.setenv('SEARCH_QPS', '0')
+    monkeypatch.delenv('RESEARCH_QUERY_BUDGET', raising=False)
+    monkeypatch.delenv('SEARCH_BACKEND', raising=False)
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import threading
+from urllib.parse import urlencode
+
+import pytest
+
+pytest.importorskip('aiohttp')
+
+import async_search
+from async_search import AsyncWebSearcher, LoopBackedWebSearcher, _LoopThread
+from demo_prep import WebSearcher
+from metrics import HTTP_RETRYABLE_RESPONSES
+from quota import QueryBudget, QuotaTracker
+from replay import FixtureStore, ReplayServer
+from search_cache import SearchCache
+
+SEARCH_URL = 'https://www.googleapis.com/customsearch/v1'
+
+
+class ThreadRecordingCache(SearchCache):
+    """SearchCache remembering which threads called it"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = set()
+
+    def get(self, *args, **kwargs):
+        self.threads.add(threading.get_ident())
+        return super().get(*args, **kwargs)
+
+    def put(self, *args, **kwargs):
+        self.threads.add(threading.get_ident())
+        return super().put(*args, **kwargs)
+
+
+def search_fixtures(*queries, num=5):
+    """One result for each query; queries may also be a single query -> num dict"""
+    sized = queries[0] if queries and isinstance(queries[0], dict) else dict.fromkeys(queries, num)
+    store = FixtureStore()
+    for query, query_num in sized.items():
+        items = [{'title': f'{query} result', 'link': 'https://www.linkedin.com/company/acme', 'snippet': 'Acme'}]
+        store.put(f"{SEARCH_URL}?{urlencode({'q': query, 'num': query_num})}", 200,
+                  {'content-type': 'application/json'}, json.dumps({'items': items}).encode('utf-8'))
+    return store
+
+
+def replay_searcher(server, tmp_path, cls=WebSearcher, **kwargs):
+    searcher = cls(api_key='test', search_engine_id='test', quota=QuotaTracker(tmp_path / 'quota.sqlite3'),
+                   **kwargs)
+    searcher.base_url = server.url_for(SEARCH_URL)
+    return searcher
+
+
+def test_search_runs_over_aiohttp_and_caches_off_the_loop(tmp_path):
+    cache = ThreadRecordingCache(tmp_path / 'cache.sqlite3')
+    with ReplayServer(search_fixtures('acme')) as server:
+        async def main():
+            async with AsyncWebSearcher(replay_searcher(server, tmp_path, cache=cache)) as searcher:
+                first = await searcher.search('acme')
+                second = await searcher.search('acme')
+                return first, second, threading.get_ident()
+
+        first, second, loop_thread = asyncio.run(main())
+        requests_sent = server.request_count()
+
+    assert first == second == [{'title': 'acme result', 'link': 'https://www.linkedin.com/company/acme',
+                                'snippet': 'Acme'}]
+    assert requests_sent == 1
+    assert cache.threads and loop_thread not in cache.threads
+    assert not server.misses
+
+
+def test_identical_in_flight_searches_share_one_request(tmp_path):
+    with ReplayServer(search_fixtures('acme'), latency=0.2) as server:
+        async def main():
+            async with AsyncWebSearcher(replay_searcher(server, tmp_path, use_cache=False)) as searcher:
+                return await asyncio.gather(*(searcher.search('acme') for _ in range(5)))
+
+        results = asyncio.run(main())
+        requests_sent = server.request_count()
+
+    assert all(len(result) == 1 for result in results)
+    assert requests_sent == 1
+
+
+def test_loop_backed_searchers_share_one_pool_and_close_it(tmp_path, monkeypatch):
+    loop_thread = _LoopThread()
+    monkeypatch.setattr(async_search, '_shared_loop', loop_thread)
+    queries = WebSearcher()._company_info_queries('Acme', 'acme.test')
+
+    with ReplayServer(search_fixtures(queries)) as server:
+        first = replay_searcher(server, tmp_path, LoopBackedWebSearcher, use_cache=False)
+        second = replay_searcher(server, tmp_path, LoopBackedWebSearcher, use_cache=False)
+
+        info = first.search_company_info('Acme', 'acme.test')
+        session = loop_thread.shared.session
+        second.search(*next(iter(queries.items())))
+
+        assert second._async_searcher()._shared is first._async_searcher()._shared
+        assert loop_thread.shared.session is session
+        assert info['linkedin']['url'] == 'https://www.linkedin.com/company/acme'
+        assert not server.misses
+
+    loop_thread.stop()
+    assert session.closed
+    assert not loop_thread.loop.is_running()
+
+
+def test_failed_calls_are_refunded_and_counted(tmp_path, monkeypatch):
+    monkeypatch.setenv('HTTP_MAX_RETRIES', '0')
+    HTTP_RETRYABLE_RESPONSES.reset()
+    store = FixtureStore()
+    store.put(f"{SEARCH_URL}?{urlencode({'q': 'acme', 'num': 5})}", 503, {'content-type': 'application/json'}, b'{}')
+
+    with ReplayServer(store) as server:
+        searcher = replay_searcher(server, tmp_path, use_cache=False).bind(budget=QueryBudget(5))
+
+        async def main():
+            async with AsyncWebSearcher(searcher) as async_searcher:
+                return await async_searcher.search('acme')
+
+        assert asyncio.run(main()) == []
+
+    assert searcher.budget.spent == 0
+    assert searcher.quota.spent_today() == 0
+    assert HTTP_RETRYABLE_RESPONSES.value(status=503) == 1
@@ -0,0 +1,38 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from http_client import create_session
+from metrics import HTTP_RETRYABLE_RESPONSES, REGISTRY
+
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """Answers 429 to the first two requests and 200 afterwards"""
+
+    requests_seen = 0
+
+    def do_GET(self):
+        type(self).requests_seen += 1
+        status = 429 if self.requests_seen <= 2 else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+
+def test_retried_429s_are_counted():
+    HTTP_RETRYABLE_RESPONSES.reset()
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ThrottlingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        session = create_session(max_retries=3, backoff_factor=0.01)
+        response = session.get(f'http://127.0.0.1:{server.server_port}/search', timeout=10)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status_code == 200
+    assert HTTP_RETRYABLE_RESPONSES.value(status=429) == 2
+    assert 'demo_prep_http_retryable_responses_total{status="429"} 2' in REGISTRY.render_prometheus()
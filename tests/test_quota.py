@@ -0,0 +1,59 @@
+import io
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from demo_prep import WebSearcher
+from quota import QueryBudget, QuotaTracker
+
+
+class StatusAdapter(BaseAdapter):
+    """Answers every request with one status code, or fails to connect when status is None"""
+
+    def __init__(self, status):
+        super().__init__()
+        self.status = status
+
+    def send(self, request, **kwargs):
+        if self.status is None:
+            raise requests.exceptions.ConnectionError('connection refused')
+        response = requests.Response()
+        response.status_code = self.status
+        response.url = request.url
+        response.request = request
+        response.raw = io.BytesIO(b'{"items": []}')
+        return response
+
+    def close(self):
+        pass
+
+
+def searcher_answering(status, tmp_path, budget):
+    session = requests.Session()
+    session.mount('https://', StatusAdapter(status))
+    searcher = WebSearcher(api_key='test', search_engine_id='test', session=session, use_cache=False,
+                           quota=QuotaTracker(tmp_path / 'quota.sqlite3'))
+    return searcher.bind(budget=budget)
+
+
+def test_budget_and_quota_stop_queries(tmp_path):
+    budget = QueryBudget(1)
+    searcher = searcher_answering(200, tmp_path, budget)
+
+    assert searcher.plan_queries(['first', 'second']) == ['first']
+    searcher.search('first')
+    assert searcher.search('second') == []
+    assert budget.spent == 1
+    assert searcher.quota.spent_today() == 1
+
+
+@pytest.mark.parametrize('status, charged', [(None, 0), (503, 0), (429, 0), (400, 1), (200, 1)])
+def test_only_billed_calls_stay_charged(tmp_path, status, charged):
+    budget = QueryBudget(5)
+    searcher = searcher_answering(status, tmp_path, budget)
+
+    searcher.search('acme')
+
+    assert budget.spent == charged
+    assert searcher.quota.spent_today() == charged
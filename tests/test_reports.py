@@ -0,0 +1,28 @@
+from demo_prep import CompanyResearcher
+from reports import ReportStore
+from research_store import ResearchStore
+
+
+def make_reports(tmp_path):
+    return ReportStore(tmp_path / 'outputs', ResearchStore(tmp_path / 'research_store.sqlite3'))
+
+
+def test_saved_research_renders_on_first_download(tmp_path):
+    reports = make_reports(tmp_path)
+    data = CompanyResearcher('acme.test', company_name_override='Acme').data
+
+    files = reports.save('acme_20260101_120000', data)
+    path = reports.get_file(files['markdown'])
+
+    assert reports.load('acme_20260101_120000')['company_name'] == 'Acme'
+    assert 'Acme' in path.read_text(encoding='utf-8')
+    assert reports.get_file(files['markdown']) == path
+
+
+def test_unknown_reports_are_not_found(tmp_path):
+    reports = make_reports(tmp_path)
+    (tmp_path / 'outputs' / 'acme_20260101_120000.json').write_text('{}')
+
+    assert reports.load('acme_20260101_120000') is None
+    assert reports.get_file('acme_20260101_120000.md') is None
+    assert reports.get_file('../secrets.md') is None
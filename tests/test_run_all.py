@@ -0,0 +1,56 @@
+import time
+
+import demo_prep
+from demo_prep import CompanyResearcher
+from progress import ProgressBus
+
+
+def failing_phase():
+    raise RuntimeError('site unreachable')
+
+
+def tech_stack_after_website(monkeypatch):
+    monkeypatch.setitem(demo_prep.RESEARCH_PHASES, 'research_tech_stack',
+                        {'depends_on': ['research_website'], 'output': 'tech_stack'})
+
+
+def test_phases_after_a_failed_dependency_are_skipped(monkeypatch):
+    tech_stack_after_website(monkeypatch)
+    researcher = CompanyResearcher('acme.test', company_name_override='Acme')
+    researcher.research_website = failing_phase
+
+    statuses = researcher.run_all(['research_website', 'research_tech_stack', 'get_company_info'])
+
+    assert statuses == {
+        'research_website': 'failed',
+        'research_tech_stack': 'skipped',
+        'get_company_info': 'completed',
+    }
+
+
+def test_timed_out_phase_results_are_discarded():
+    researcher = CompanyResearcher('acme.test', company_name_override='Acme')
+
+    def slow_phase():
+        time.sleep(0.3)
+        researcher._store('tech_stack', [{'technology': 'late'}])
+
+    researcher.research_tech_stack = slow_phase
+
+    statuses = researcher.run_all(['research_tech_stack'], timeout=0.05)
+    time.sleep(0.5)
+
+    assert statuses == {'research_tech_stack': 'timed_out'}
+    assert researcher.data['tech_stack'] == []
+
+
+def test_skipped_phases_report_their_end(monkeypatch):
+    tech_stack_after_website(monkeypatch)
+    progress = ProgressBus()
+    researcher = CompanyResearcher('acme.test', company_name_override='Acme', progress=progress)
+    researcher.research_website = failing_phase
+
+    researcher.run_all(['research_website', 'research_tech_stack'])
+
+    ends = {event['phase']: event['status'] for event in progress.events_since(0) if event['type'] == 'phase_end'}
+    assert ends == {'research_website': 'failed', 'research_tech_stack': 'skipped'}
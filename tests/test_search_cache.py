@@ -0,0 +1,20 @@
+from search_cache import SearchCache
+
+
+def test_results_are_cached_per_search_engine(tmp_path):
+    cache = SearchCache(tmp_path / 'cache.sqlite3')
+    cache.put('"Acme" "Okta"', 2, [{'link': 'old'}], engine_id='engine-a')
+
+    assert cache.get('"acme"  "okta"', 2, engine_id='engine-a') == [{'link': 'old'}]
+    assert cache.get('"Acme" "Okta"', 2, engine_id='engine-b') is None
+    assert not cache.is_fresh('"Acme" "Okta"', 2, engine_id='engine-b')
+
+
+def test_results_are_cached_per_page_and_size(tmp_path):
+    cache = SearchCache(tmp_path / 'cache.sqlite3')
+    cache.put('query', 10, [{'link': 'page 1'}], engine_id='e')
+    cache.put('query', 10, [{'link': 'page 2'}], start=11, engine_id='e')
+
+    assert cache.get('query', 10, engine_id='e') == [{'link': 'page 1'}]
+    assert cache.get('query', 10, start=11, engine_id='e') == [{'link': 'page 2'}]
+    assert cache.get('query', 5, engine_id='e') is None
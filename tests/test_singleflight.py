@@ -0,0 +1,80 @@
+import io
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+
+from demo_prep import WebSearcher
+from quota import QueryBudget, QuotaTracker
+
+
+class SlowSearchAdapter(BaseAdapter):
+    """Answers every search with one result after a delay, counting the calls"""
+
+    def __init__(self, delay=0.2):
+        super().__init__()
+        self.delay = delay
+        self.calls = 0
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response.raw = io.BytesIO(b'{"items": [{"title": "Acme", "link": "https://acme.test", "snippet": "Acme"}]}')
+        return response
+
+    def close(self):
+        pass
+
+
+def make_searcher(adapter, tmp_path):
+    session = requests.Session()
+    session.mount('https://', adapter)
+    return WebSearcher(api_key='test', search_engine_id='test', session=session, use_cache=False,
+                       quota=QuotaTracker(tmp_path / 'quota.sqlite3'))
+
+
+def search_concurrently(*searchers):
+    results = [None] * len(searchers)
+
+    def run(i):
+        results[i] = searchers[i].search('acme')
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(searchers))]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_identical_searches_share_one_call(tmp_path):
+    adapter = SlowSearchAdapter()
+    searcher = make_searcher(adapter, tmp_path)
+
+    results = search_concurrently(searcher, searcher, searcher)
+
+    assert adapter.calls == 1
+    assert all(len(result) == 1 for result in results)
+
+
+def test_a_refused_search_is_not_shared_with_another_research(tmp_path):
+    adapter = SlowSearchAdapter()
+    searcher = make_searcher(adapter, tmp_path)
+    refused = searcher.bind(budget=QueryBudget(0))
+    allowed = searcher.bind(budget=QueryBudget(5))
+
+    # Hold the refused leader in flight until the other research has joined it
+    reserve = refused._reserve_query
+    refused._reserve_query = lambda: time.sleep(0.2) or reserve()
+
+    refused_results, allowed_results = search_concurrently(refused, allowed)
+
+    assert refused_results == []
+    assert len(allowed_results) == 1
+    assert allowed.budget.spent == 1
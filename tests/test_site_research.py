@@ -0,0 +1,142 @@
+import io
+import json
+import threading
+import time
+from datetime import datetime
+
+import requests
+from requests.adapters import BaseAdapter
+
+from demo_prep import RESEARCH_PHASES, CompanyResearcher
+from http_cache import HttpCache
+from site_crawler import CRAWLER_USER_AGENT, SiteCrawler
+
+
+class RecordingAdapter(BaseAdapter):
+    """Answers robots.txt with a rule for DemoPrep and everything else with a small page"""
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        if request.url.endswith('/robots.txt'):
+            response.status_code = 200
+            response.headers['content-type'] = 'text/plain'
+            body = b'User-agent: DemoPrep\nDisallow: /careers\n'
+        else:
+            response.status_code = 200
+            response.headers['content-type'] = 'text/html'
+            body = b'<html><title>Acme</title><p>About Acme: we use Okta.</p></html>'
+        response.raw = io.BytesIO(body)
+        return response
+
+    def close(self):
+        pass
+
+
+def test_crawler_sends_the_user_agent_robots_txt_is_checked_against(tmp_path):
+    adapter = RecordingAdapter()
+    session = requests.Session()
+    session.mount('https://', adapter)
+
+    SiteCrawler(session, cache=HttpCache(tmp_path / 'http_cache.sqlite3')).crawl('acme.test')
+
+    assert {request.headers['User-Agent'] for request in adapter.requests} == {CRAWLER_USER_AGENT}
+    assert not any(request.url.endswith('/careers') for request in adapter.requests)
+
+
+class LargePageAdapter(BaseAdapter):
+    """Answers every request with a slow, page_size-byte HTML page, counting the bytes read"""
+
+    def __init__(self, page_size):
+        super().__init__()
+        self.page_size = page_size
+        self.bytes_read = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.requests += 1
+        time.sleep(0.05)
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.status_code = 200
+        response.headers['content-type'] = 'text/html'
+        response.raw = io.BytesIO(b'<html><title>Acme</title>' + b'x' * self.page_size)
+        original_read = response.raw.read
+
+        def read(*args, **kwargs):
+            chunk = original_read(*args, **kwargs)
+            with self._lock:
+                self.bytes_read += len(chunk)
+            return chunk
+
+        response.raw.read = read
+        return response
+
+    def close(self):
+        pass
+
+
+def test_concurrent_fetches_stay_within_the_crawl_byte_budget(tmp_path):
+    adapter = LargePageAdapter(page_size=600 * 1024)
+    session = requests.Session()
+    session.mount('https://', adapter)
+
+    crawler = SiteCrawler(session, max_bytes=1024 * 1024, cache=HttpCache(tmp_path / 'http_cache.sqlite3'))
+    crawl = crawler.crawl('acme.test')
+
+    assert crawl['pages']
+    assert crawl['bytes'] <= 1024 * 1024
+    # fetch_page() stops reading within one 64 KB chunk of its cap
+    assert adapter.bytes_read <= 1024 * 1024 + 64 * 1024 * adapter.requests
+
+
+def test_security_tools_is_a_research_phase_after_the_crawl():
+    assert RESEARCH_PHASES['research_security_tools']['depends_on'] == ['research_website']
+
+
+def test_crawled_page_text_is_not_saved():
+    researcher = CompanyResearcher('acme.test', company_name_override='Acme')
+    researcher.site_pages = [{'url': 'https://acme.test/security', 'title': 'Security', 'text': 'We run CrowdStrike'}]
+
+    assert 'site_pages' not in researcher.data
+    assert 'We run CrowdStrike' not in json.dumps(researcher.snapshot())
+
+
+def test_reused_website_info_is_recrawled_for_stale_site_scans():
+    today = datetime.now().isoformat(timespec='seconds')
+    previous = {
+        'research_date': today,
+        'website_info': {'title': 'Acme'},
+        'tech_stack': [],
+        'section_dates': {'website_info': today, 'tech_stack': today},
+    }
+
+    researcher = CompanyResearcher('acme.test', company_name_override='Acme')
+    pending = researcher.load_previous(previous)
+
+    assert 'research_website' in pending
+    assert 'research_security_tools' in pending
+    assert 'research_tech_stack' not in pending
+
+
+def test_resumed_research_recrawls_only_when_a_site_scan_is_left():
+    verified = CompanyResearcher('acme.test', company_name_override='Acme')
+    verified.phase_status = {'research_website': 'completed', 'get_company_info': 'completed'}
+
+    researcher = CompanyResearcher('acme.test', company_name_override='Acme')
+    researcher.resume(verified.snapshot())
+    assert 'research_website' in researcher.pending_phases()
+
+    verified.phase_status.update({'research_tech_stack': 'completed', 'research_security_tools': 'completed'})
+    researcher = CompanyResearcher('acme.test', company_name_override='Acme')
+    researcher.resume(verified.snapshot())
+    assert 'research_website' not in researcher.pending_phases()
@@ -0,0 +1,51 @@
+import pytest
+
+import demo_prep
+from demo_prep import TERM_PATIENCE, TERM_WAVE_SIZE, WebSearcher
+from quota import QuotaTracker
+
+
+class ScriptedSearcher(WebSearcher):
+    """WebSearcher answering from a query -> snippet table instead of the API"""
+
+    def __init__(self, snippets, **kwargs):
+        super().__init__(api_key='test', search_engine_id='test', use_cache=False, **kwargs)
+        self.snippets = snippets
+        self.queries = []
+
+    def search(self, query, num_results=5, start=1):
+        self.queries.append(query)
+        snippet = self.snippets(query)
+        return [{'title': 'Result', 'link': f'https://example.test/{len(self.queries)}', 'snippet': snippet}] \
+            if snippet else []
+
+
+@pytest.mark.parametrize('max_workers', [1, 8])
+def test_tech_stack_does_not_stop_after_one_empty_query(tmp_path, max_workers):
+    # Only the job board queries after the first one mention technologies
+    def snippets(query):
+        if 'site:linkedin.com/jobs' in query:
+            return ''
+        return 'We use Python, PostgreSQL and Kubernetes'
+
+    searcher = ScriptedSearcher(snippets, max_workers=max_workers, quota=QuotaTracker(tmp_path / 'quota.sqlite3'))
+    tech_stack = searcher.search_tech_stack('Acme', 'acme.test')
+
+    assert {item['technology'] for item in tech_stack} == {'Python', 'PostgreSQL', 'Kubernetes'}
+    assert len(searcher.queries) > 1
+
+
+def test_term_search_stops_after_empty_waves(tmp_path):
+    searcher = ScriptedSearcher(lambda query: '', max_workers=1, quota=QuotaTracker(tmp_path / 'quota.sqlite3'))
+    searcher.search_security_tools('Acme', 'acme.test')
+
+    assert len(searcher.queries) == TERM_PATIENCE * TERM_WAVE_SIZE
+
+
+def test_term_search_stops_at_saturation(tmp_path, monkeypatch):
+    monkeypatch.setattr(demo_prep, 'TERM_SATURATION', 3)
+    searcher = ScriptedSearcher(lambda query: 'Python, PostgreSQL and Kubernetes',
+                                quota=QuotaTracker(tmp_path / 'quota.sqlite3'))
+    searcher.search_tech_stack('Acme', 'acme.test')
+
+    assert len(searcher.queries) == TERM_WAVE_SIZE
@@ -0,0 +1,55 @@
+import demo_prep
+from demo_prep import VENDOR_BATCH_PAGE_SIZE, WebSearcher, pack_or_queries
+from quota import QuotaTracker
+from search_cache import SearchCache
+
+
+class CountingSearcher(WebSearcher):
+    """WebSearcher whose API calls return a full page of results from answer(query, start)"""
+
+    def __init__(self, tmp_path, answer):
+        super().__init__(api_key='test', search_engine_id='test', cache=SearchCache(tmp_path / 'cache.sqlite3'),
+                         quota=QuotaTracker(tmp_path / 'quota.sqlite3'), max_workers=1)
+        self.answer = answer
+        self.api_calls = []
+
+    def _fetch(self, query, num_results, start=1):
+        self.api_calls.append((query, start))
+        results = [self.answer(query, start, i) for i in range(num_results)]
+        self.cache.put(query, num_results, results, start, self.search_engine_id)
+        return results
+
+
+def result(snippet, i):
+    return {'title': f'Result {i}', 'link': f'https://example.test/{i}', 'snippet': snippet}
+
+
+def test_pack_or_queries_respects_word_limit():
+    vendors = demo_prep.get_vendors_by_priority()
+    packed = pack_or_queries('"Acme Widgets"', vendors)
+
+    assert [vendor for batch in packed.values() for vendor in batch] == vendors
+    assert all(len(query.replace('"', ' ').replace('(', ' ').replace(')', ' ').split()) <= 32 for query in packed)
+
+
+def test_batched_results_are_attributed_to_named_vendors(tmp_path):
+    searcher = CountingSearcher(tmp_path, lambda query, start, i: result(
+        'Acme rolled out CrowdStrike Falcon and Okta' if i == 0 else 'Unrelated', i))
+    connections = searcher.search_security_vendor_connections('Acme', 'acme.test')
+
+    assert {item['vendor'] for item in connections} == {'CrowdStrike', 'Okta'}
+
+
+def test_cached_pages_do_not_count_against_the_query_cap(tmp_path, monkeypatch):
+    batches = pack_or_queries('"Acme"', demo_prep.get_vendors_by_priority())
+    monkeypatch.setattr(demo_prep, 'VENDOR_QUERY_CAP', len(batches))
+
+    searcher = CountingSearcher(tmp_path, lambda query, start, i: result('Acme news', i))
+    for query in batches:
+        searcher.cache.put(query, VENDOR_BATCH_PAGE_SIZE, [result('Acme news', i) for i in range(10)],
+                           engine_id='test')
+
+    searcher.search_security_vendor_connections('Acme', 'acme.test')
+
+    # First pages were free, so the whole cap goes to second pages
+    assert sorted(searcher.api_calls) == sorted((query, 1 + VENDOR_BATCH_PAGE_SIZE) for query in batches)
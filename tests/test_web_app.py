@@ -0,0 +1,20 @@
+import pytest
+
+pytest.importorskip('flask')
+
+import web_app
+from progress import ProgressBus
+
+
+@pytest.mark.parametrize('last_event_id', ['not-a-number', '', '0'])
+def test_job_events_tolerates_any_last_event_id(last_event_id):
+    progress = ProgressBus()
+    progress.emit('phase', name='research_website')
+    job = web_app.research_jobs.submit(lambda: None, progress=progress)
+    progress.close()
+
+    response = web_app.app.test_client().get(f'/api/jobs/{job.id}/events',
+                                              headers={'Last-Event-ID': last_event_id})
+
+    assert response.status_code == 200
+    assert 'event: phase' in response.get_data(as_text=True)
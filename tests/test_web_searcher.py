@@ -0,0 +1,40 @@
+import threading
+
+from demo_prep import WebSearcher
+
+
+class RecordingSearcher(WebSearcher):
+    """WebSearcher recording (query, num_results) instead of calling the API"""
+
+    def __init__(self, **kwargs):
+        super().__init__(api_key='test', search_engine_id='test', **kwargs)
+        self.calls = []
+        self._calls_lock = threading.Lock()
+
+    def search(self, query, num_results=5, start=1):
+        with self._calls_lock:
+            self.calls.append((query, num_results))
+        return [{'title': query, 'link': f'https://example.test/{i}', 'snippet': query} for i in range(num_results)]
+
+
+def test_search_many_keeps_query_order():
+    searcher = RecordingSearcher(max_workers=4)
+    queries = [f'query {i}' for i in range(10)]
+
+    results = searcher.search_many(queries, num_results=1)
+
+    assert [result[0]['title'] for result in results] == queries
+
+
+def test_company_info_asks_each_query_for_the_results_it_uses():
+    searcher = RecordingSearcher(max_workers=4)
+    info = searcher.search_company_info('Acme', 'acme.test')
+
+    assert sorted(searcher.calls) == sorted([
+        ('Acme site:linkedin.com/company', 3),
+        ('Acme site:crunchbase.com', 3),
+        ('Acme acme.test company about', 5),
+        ('Acme news 2026', 3),
+    ])
+    assert len(info['about']) == 5
+    assert len(info['news']) == 3
@@ -0,0 +1,54 @@
+import io
+
+import requests
+from requests.adapters import BaseAdapter
+
+from http_cache import HttpCache
+from website_scraper import fetch_page
+
+BODY = b'<html><body>' + b'<p>About us</p>' * 1000 + b'</body></html>'
+
+
+class EtagPageAdapter(BaseAdapter):
+    """Serves BODY with an ETag, answering 304 when the request revalidates it"""
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.headers['etag'] = '"v1"'
+        if request.headers.get('If-None-Match') == '"v1"':
+            response.status_code = 304
+            response.raw = io.BytesIO(b'')
+        else:
+            response.status_code = 200
+            response.headers['content-type'] = 'text/html'
+            response.raw = io.BytesIO(BODY)
+        return response
+
+    def close(self):
+        pass
+
+
+def page_session():
+    session = requests.Session()
+    session.mount('https://', EtagPageAdapter())
+    return session
+
+
+def test_truncated_page_is_not_cached(tmp_path):
+    cache = HttpCache(tmp_path / 'http_cache.sqlite3')
+    page = fetch_page(page_session(), 'https://acme.test/', max_bytes=1024, cache=cache)
+
+    assert len(page.body) == 1024
+    assert cache.lookup('https://acme.test/') is None
+
+
+def test_complete_page_is_cached_and_revalidated(tmp_path):
+    cache = HttpCache(tmp_path / 'http_cache.sqlite3')
+    session = page_session()
+    fetch_page(session, 'https://acme.test/', cache=cache)
+    page = fetch_page(session, 'https://acme.test/', cache=cache)
+
+    assert cache.lookup('https://acme.test/') is not None
+    assert page.body == BODY
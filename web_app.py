@@ -4,8 +4,9 @@ Demo Prep Tool - Web Interface
 Run locally with: python3 web_app.py
 """
 
-from flask import Flask, render_template, request, jsonify, send_file, session
+from flask import Flask, render_template, request, jsonify, send_file, session, Response
 import os
+import json
 import sys
 import secrets
 from datetime import datetime
@@ -18,8 +19,14 @@ load_dotenv()
 # Add scripts directory to path for imports
 sys.path.append(str(Path(__file__).parent / 'scripts'))
 
-from demo_prep import CompanyResearcher, WebSearcher, MarkdownGenerator
-from convert_to_pdf import parse_markdown_to_pdf
+from demo_prep import CompanyResearcher, WebSearcher, create_web_searcher
+from job_queue import JobQueue
+from progress import ProgressBus
+from research_state import ResearchStateStore
+from reports import ReportStore
+from research_store import get_default_research_store
+from metrics import REGISTRY
+from profiling import profile_run
 
 app = Flask(__name__)
 app.secret_key = secrets.token_hex(16)
@@ -28,6 +35,16 @@ app.secret_key = secrets.token_hex(16)
 OUTPUT_FOLDER = Path('web_outputs')
 OUTPUT_FOLDER.mkdir(exist_ok=True)
 
+# Research data is saved once; Markdown/PDF are rendered when downloaded
+research_store = get_default_research_store()
+reports = ReportStore(OUTPUT_FOLDER, research_store)
+
+# Deep research runs in the background; clients poll /api/jobs/<job_id>
+research_jobs = JobQueue()
+
+# Verification results, reused by deep research instead of re-running those phases
+research_states = ResearchStateStore()
+
 @app.route('/')
 def index():
     """Main page"""
@@ -63,7 +80,7 @@ def research():
     domain = domain.replace('https://', '').replace('http://', '').strip('/')
 
     # Initialize web searcher
-    web_searcher = WebSearcher()
+    web_searcher = create_web_searcher()
 
     if not web_searcher.api_key:
         return jsonify({
@@ -80,8 +97,7 @@ def research():
     )
 
     # Do initial research
-    researcher.research_website()
-    researcher.get_company_info()
+    researcher.run_all(['research_website', 'get_company_info'])
 
     # Prepare verification data
     verification_data = {
@@ -92,12 +108,13 @@ def research():
         'company_info': researcher.data.get('company_info', {})
     }
 
-    # Store session data for continuation
+    # Store session data for continuation; research results stay server-side
     session['research_data'] = {
         'domain': domain,
         'company_name': company_name,
         'company_context': company_context,
-        'contact_leads': validated_contacts
+        'contact_leads': validated_contacts,
+        'state_id': research_states.put(researcher.snapshot())
     }
 
     return jsonify({
@@ -107,7 +124,7 @@ def research():
 
 @app.route('/api/continue', methods=['POST'])
 def continue_research():
-    """Continue research after verification"""
+    """Queue deep research after verification"""
     data = request.json
     updated_context = data.get('context', '').strip() or None
 
@@ -116,13 +133,74 @@ def continue_research():
     if not research_data:
         return jsonify({'error': 'No research session found'}), 400
 
-    domain = research_data['domain']
-    company_name = research_data['company_name']
-    company_context = updated_context or research_data['company_context']
-    contact_leads = research_data.get('contact_leads', [])
+    progress = ProgressBus()
+    job = research_jobs.submit(
+        run_deep_research,
+        research_data['domain'],
+        research_data['company_name'],
+        updated_context or research_data['company_context'],
+        research_data.get('contact_leads', []),
+        progress,
+        research_states.get(research_data.get('state_id')),
+        description=f"Deep research for {research_data['domain']}",
+        progress=progress
+    )
+
+    return jsonify({
+        'status': 'queued',
+        'job_id': job.id
+    }), 202
+
+@app.route('/api/jobs/<job_id>')
+def job_status(job_id):
+    """Status (and results, once complete) of a research job"""
+    job = research_jobs.get(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found'}), 404
+
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>/events')
+def job_events(job_id):
+    """Stream a research job's progress events as Server-Sent Events"""
+    job = research_jobs.get(job_id)
+    if not job or not job.progress:
+        return jsonify({'error': 'Job not found'}), 404
+
+    # Resume after the last event the browser saw; a garbled id replays from the start
+    try:
+        last_seq = int(request.headers.get('Last-Event-ID', 0) or 0)
+    except ValueError:
+        last_seq = 0
+
+    def stream(seq):
+        while True:
+            events = job.progress.events_since(seq, timeout=15)
+            if not events:
+                if job.progress.closed:
+                    return
+                # Keep idle connections open through proxies
+                yield ": keep-alive\n\n"
+                continue
+
+            for event in events:
+                seq = event['seq']
+                yield f"id: {seq}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+    return Response(stream(last_seq), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+def run_deep_research(domain, company_name, company_context, contact_leads, progress=None, state=None):
+    """
+    Run full research and save its data for download (executes on a job worker)
 
+    If state holds a snapshot from the verification step, only the phases
+    it has not completed are run.
+    """
     # Initialize web searcher
-    web_searcher = WebSearcher()
+    web_searcher = create_web_searcher()
 
     # Create researcher
     researcher = CompanyResearcher(
@@ -130,36 +208,25 @@ def continue_research():
         web_searcher=web_searcher,
         company_name_override=company_name,
         company_context=company_context,
-        contact_leads=contact_leads
+        contact_leads=contact_leads,
+        progress=progress
     )
 
-    # Do full research
-    researcher.research_website()
-    researcher.get_company_info()
-    researcher.research_tech_stack()
-    researcher.research_security_vendors()
-    researcher.research_security_leadership()
-    researcher.research_executive_leadership()
-    researcher.enrich_contact_leads()
+    if state:
+        researcher.resume(state)
+
+    # Do remaining research (independent phases run concurrently);
+    # profiled when DEMO_PREP_PROFILE is set
+    with profile_run(domain):
+        researcher.run_all(researcher.pending_phases())
 
-    # Generate output files
+    # Save the data; report files are rendered on first download
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     company_slug = domain.split('.')[0]
-
-    md_filename = f"{company_slug}_{timestamp}.md"
-    pdf_filename = f"{company_slug}_{timestamp}.pdf"
-
-    md_path = OUTPUT_FOLDER / md_filename
-    pdf_path = OUTPUT_FOLDER / pdf_filename
-
-    # Generate markdown
-    MarkdownGenerator.generate(researcher.data, str(md_path))
-
-    # Generate PDF
-    parse_markdown_to_pdf(str(md_path), str(pdf_path))
+    files = reports.save(f"{company_slug}_{timestamp}", researcher.data)
 
     # Prepare results
-    results = {
+    return {
         'status': 'complete',
         'company_name': researcher.company_name,
         'domain': researcher.domain,
@@ -167,26 +234,26 @@ def continue_research():
             'website_info': researcher.data.get('website_info', {}),
             'company_info': researcher.data.get('company_info', {}),
             'tech_stack': researcher.data.get('tech_stack', []),
+            'security_tools': researcher.data.get('security_tools', []),
             'security_vendors': researcher.data.get('security_vendors', []),
             'security_leadership': researcher.data.get('security_leadership', []),
             'executive_leadership': researcher.data.get('executive_leadership', []),
             'contact_leads': researcher.data.get('contact_leads', [])
         },
-        'files': {
-            'markdown': md_filename,
-            'pdf': pdf_filename
-        }
+        'files': files
     }
 
-    return jsonify(results)
-
 @app.route('/api/download/<filename>')
 def download(filename):
-    """Download generated file"""
-    file_path = OUTPUT_FOLDER / filename
+    """Download a report file, rendering it on first request"""
+    with profile_run(f"render_{filename}"):
+        file_path = reports.get_file(filename)
 
-    if not file_path.exists():
-        return jsonify({'error': 'File not found'}), 404
+    if file_path is None:
+        # Reports generated before lazy rendering were written out directly
+        file_path = OUTPUT_FOLDER / Path(filename).name
+        if not file_path.is_file():
+            return jsonify({'error': 'File not found'}), 404
 
     return send_file(
         file_path,
@@ -194,6 +261,36 @@ def download(filename):
         download_name=filename
     )
 
+@app.route('/api/reports')
+def find_reports():
+    """
+    Look up past research across accounts
+
+    Query parameters (one of): vendor, technology, company, or since
+    (YYYY-MM-DD, lists the latest report per domain)
+    """
+    if request.args.get('vendor'):
+        results = research_store.find_by_vendor(request.args['vendor'])
+    elif request.args.get('technology'):
+        results = research_store.find_by_technology(request.args['technology'])
+    elif request.args.get('company'):
+        results = research_store.find_by_company(request.args['company'])
+    else:
+        results = research_store.list_results(since=request.args.get('since'))
+
+    return jsonify({'reports': results})
+
+@app.route('/api/reports/latest')
+def latest_report():
+    """Most recent research data for ?domain="""
+    domain = request.args.get('domain', '').strip()
+    data = research_store.latest_for_domain(domain) if domain else None
+
+    if data is None:
+        return jsonify({'error': 'No research found for this domain'}), 404
+
+    return jsonify(data)
+
 @app.route('/health')
 def health():
     """Health check endpoint"""
@@ -205,6 +302,11 @@ def health():
         'timestamp': datetime.now().isoformat()
     })
 
+@app.route('/metrics')
+def metrics():
+    """Search latency, errors, cache hit rates and phase durations in Prometheus text format"""
+    return Response(REGISTRY.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Demo Prep Tool - Web Interface")
@@ -0,0 +1,163 @@
+"""
+Bounded company website scraping
+Streams pages with a byte cap and extracts title, description and about
+text in a single pass over the parsed document
+"""
+
+import os
+import time
+from typing import Dict, List, Optional
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+from http_cache import FetchedPage, get_default_http_cache
+from metrics import HTTP_CACHE_LOOKUPS
+
+try:
+    import lxml  # noqa: F401  (optional, several times faster than html.parser)
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Bytes read from a page before the rest is dropped
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+
+# Seconds allowed for a whole page download (requests' timeout is per read)
+DEFAULT_FETCH_TIMEOUT = 15
+
+# Phrases that mark about/description text, in priority order
+ABOUT_KEYWORDS = ['about', 'what we do', 'who we are']
+
+# Only these tags (and what they contain) are built into the tree
+HOMEPAGE_STRAINER = SoupStrainer(['title', 'meta', 'p', 'div'])
+
+ABOUT_CONTAINERS = ('p', 'div')
+
+
+def fetch_page(session: requests.Session, url: str, max_bytes: Optional[int] = None,
+               timeout: float = 10, deadline: Optional[float] = None,
+               headers: Optional[Dict] = None, cache=None) -> FetchedPage:
+    """
+    Download a page body, stopping at max_bytes
+
+    Args:
+        session: HTTP session to use
+        url: Page URL
+        max_bytes: Body size cap (default: WEBSITE_MAX_BYTES env var or 2 MB)
+        timeout: Connect/read timeout per request, in seconds
+        deadline: time.monotonic() value after which the download stops
+        headers: Extra request headers
+        cache: Optional HttpCache; fresh cached pages are returned without a
+            request, stale ones are revalidated with a conditional GET; bodies
+            cut short by max_bytes or the deadline are not stored
+
+    Returns:
+        The fetched page; raises requests exceptions on HTTP errors
+    """
+    if max_bytes is None:
+        max_bytes = int(os.environ.get('WEBSITE_MAX_BYTES', DEFAULT_MAX_BYTES))
+    if deadline is None:
+        deadline = time.monotonic() + DEFAULT_FETCH_TIMEOUT
+
+    request_headers = dict({'User-Agent': USER_AGENT}, **(headers or {}))
+    cached = cache.lookup(url) if cache is not None else None
+    if cached is not None:
+        if cached.fresh:
+            HTTP_CACHE_LOOKUPS.inc(result='fresh')
+            return cached.page
+        request_headers.update(cached.validators)
+
+    with session.get(url, headers=request_headers, timeout=timeout, stream=True) as response:
+        if response.status_code == 304 and cached is not None:
+            HTTP_CACHE_LOOKUPS.inc(result='revalidated')
+            cache.revalidated(url, response.headers)
+            return cached.page
+        if cache is not None:
+            HTTP_CACHE_LOOKUPS.inc(result='miss')
+        response.raise_for_status()
+
+        chunks = []
+        size = 0
+        complete = True
+        for chunk in response.iter_content(chunk_size=min(64 * 1024, max_bytes)):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes or time.monotonic() > deadline:
+                complete = False
+                break
+
+    page = FetchedPage(response.url, b''.join(chunks)[:max_bytes], response.headers.get('content-type', ''))
+    # A body cut short by the byte cap or deadline must not be revalidated later as if whole
+    if cache is not None and complete:
+        cache.store(url, page, response.headers)
+    return page
+
+
+def parse_html(body: bytes, encoding: Optional[str] = None,
+               parse_only: Optional[SoupStrainer] = HOMEPAGE_STRAINER) -> BeautifulSoup:
+    """Parse an HTML body with the fastest available parser"""
+    return BeautifulSoup(body, HTML_PARSER, from_encoding=encoding, parse_only=parse_only)
+
+
+def find_about_text(soup: BeautifulSoup, keywords: List[str] = ABOUT_KEYWORDS, limit: int = 500) -> Optional[str]:
+    """
+    Find about/description text in one pass over the document's strings
+
+    The result is the outermost p/div holding the first string that mentions
+    a keyword, trying keywords in priority order - the same block a search
+    for the first p/div whose text contains the keyword would return, without
+    re-reading every block's full text.
+    """
+    found = {}  # keyword -> outermost p/div around the first string containing it
+    for string in soup.strings:
+        text = string.lower()
+        for keyword in keywords:
+            if keyword not in found and keyword in text:
+                container = _outermost_container(string)
+                if container is not None:
+                    found[keyword] = container
+        if keywords[0] in found:
+            break
+
+    for keyword in keywords:
+        if keyword in found:
+            return found[keyword].get_text().strip()[:limit]
+    return None
+
+
+def _outermost_container(string):
+    container = None
+    for parent in string.parents:
+        if parent.name in ABOUT_CONTAINERS:
+            container = parent
+    return container
+
+
+def extract_homepage_info(soup: BeautifulSoup) -> Dict:
+    """Title, meta description and about text from a parsed homepage"""
+    info = {}
+
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    if meta_desc:
+        info['description'] = meta_desc.get('content', '')
+
+    title = soup.find('title')
+    if title:
+        info['title'] = title.text.strip()
+
+    about = find_about_text(soup)
+    if about:
+        info['about'] = about
+
+    return info
+
+
+def scrape_homepage(domain: str, session: requests.Session, max_bytes: Optional[int] = None,
+                    cache=None) -> Dict:
+    """Fetch https://{domain} (through the HTTP cache by default) and extract its title, description and about text"""
+    page = fetch_page(session, f"https://{domain}", max_bytes=max_bytes,
+                      cache=cache if cache is not None else get_default_http_cache())
+    return extract_homepage_info(parse_html(page.body, page.encoding))